@@ -2,23 +2,38 @@ from flexible_datetime.flexible_datetime import FlexDateTime
 from flexible_datetime.flex_datetime import (
     dict_datetime,
     flex_datetime,
+    frozen_datetime,
     iso_datetime,
     mask_datetime,
     OutputFormat as FDTOutputFormat,
     short_datetime,
 )
 from flexible_datetime.pydantic_arrow import PyArrow
+from flexible_datetime.pydantic_batch import FlexDatetimeBatch, FlexDatetimeDict, FlexDatetimeList
 from flexible_datetime.flex_time import flex_time, OutputFormat as FTOutputFormat
+from flexible_datetime.timeline import FlexTimeline
 
 __all__ = [
     "FlexDateTime",
     "dict_datetime",
     "flex_datetime",
+    "frozen_datetime",
     "iso_datetime",
     "mask_datetime",
     "FDTOutputFormat",
     "short_datetime",
     "PyArrow",
+    "FlexDatetimeBatch",
+    "FlexDatetimeDict",
+    "FlexDatetimeList",
     "flex_time",
     "FTOutputFormat",
+    "FlexTimeline",
 ]
+
+try:
+    from flexible_datetime.flex_array import FlexDateTimeArray
+
+    __all__.append("FlexDateTimeArray")
+except ImportError:
+    pass
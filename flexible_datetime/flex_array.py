@@ -0,0 +1,240 @@
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from flexible_datetime.flex_datetime import flex_datetime
+from flexible_datetime.packing import (
+    SECONDS_KEY_FIELDS,
+    datetime_to_micros,
+    micros_to_datetime,
+    tz_from_id,
+    utc_offset_seconds,
+)
+
+# Missing values, e.g. of pandas or pyarrow columns, are stored as NaT
+_NAT = np.iinfo(np.int64).min
+
+
+def _civil_from_days(days: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the year, month and day of days since 1970-01-01 in the proleptic Gregorian calendar.
+    Integer arithmetic is much faster than casting to datetime64[M] and datetime64[Y].
+    """
+    # Howard Hinnant's civil_from_days, counting years from March so leap days come last
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _to_datetime(micros: int, offset: int) -> datetime:
+    dt = micros_to_datetime(micros)
+    return dt.astimezone(tz_from_id(offset)) if offset else dt
+
+
+_DATE_BITS = 0b1110000
+
+# (seconds per unit, seconds per period, mask bit) of hour, minute and second
+_TIME_FIELDS = ((3600, 86400, 1 << 3), (60, 3600, 1 << 2), (1, 60, 1 << 1))
+
+
+class FlexDateTimeArray:
+    """
+    Columnar storage of many flex_datetime values: a datetime64[us] array of UTC datetimes, a
+    uint8 array of mask bits, e.g. 0b0011111 for "0011111", and an int32 array of UTC offsets in
+    seconds.
+
+    Comparisons, sorting and min/max work on `comparison_keys`, which follow the semantics of
+    `flex_datetime.get_comparable_dt`: the fields are those of the local datetimes, the UTC
+    datetimes shifted by their offsets. Like the flex_datetime operators, `<`, `<=`, `==` etc.
+    raise a ValueError when the masks of the compared values differ.
+    """
+
+    __slots__ = ("dt", "mask", "offset")
+
+    def __init__(self, dt: Any, mask: Any = 0, offset: Any = 0):
+        self.dt = np.asarray(dt, dtype="datetime64[us]")
+        self.mask = np.broadcast_to(np.asarray(mask, dtype=np.uint8), self.dt.shape).copy()
+        self.offset = np.broadcast_to(np.asarray(offset, dtype=np.int32), self.dt.shape).copy()
+        if self.dt.ndim != 1:
+            raise ValueError("FlexDateTimeArray must be one-dimensional")
+
+    @classmethod
+    def from_flex(cls, values: Iterable[flex_datetime]) -> "FlexDateTimeArray":
+        """
+        Creates an array from flex_datetime instances. Time zones are kept as their UTC offsets,
+        naive datetimes are taken as UTC.
+        """
+        values = list(values)
+        datetimes = [ft.to_datetime() for ft in values]
+        micros = np.fromiter((datetime_to_micros(dt) for dt in datetimes), np.int64, len(values))
+        masks = np.fromiter((ft.mask_bits for ft in values), np.uint8, len(values))
+        offsets = np.fromiter((utc_offset_seconds(dt) for dt in datetimes), np.int32, len(values))
+        return cls(micros.view("datetime64[us]"), masks, offsets)
+
+    @classmethod
+    def from_strings(cls, values: Iterable[str]) -> "FlexDateTimeArray":
+        """
+        Parses date strings with `flex_datetime.parse_many`.
+        """
+        return cls.from_flex(flex_datetime.parse_many(values))
+
+    def to_list(self, cls: type[flex_datetime] = flex_datetime) -> list[Optional[flex_datetime]]:
+        """
+        Returns the values as flex_datetime instances at their UTC offsets, and NaT values as None.
+        """
+        micros = self.dt.view(np.int64).tolist()
+        masks = [format(bits, "07b") for bits in self.mask.tolist()]
+        return [
+            None if us == _NAT else cls._from_parsed(_to_datetime(us, offset), mask)
+            for us, mask, offset in zip(micros, masks, self.offset.tolist())
+        ]
+
+    def _local_seconds(self) -> np.ndarray:
+        # Seconds of the local datetimes since 1970-01-01, the fields flex_datetime compares
+        return self.dt.view(np.int64) // 1_000_000 + self.offset
+
+    def comparison_keys(self) -> np.ndarray:
+        """
+        Returns the int64 comparison key of every value: masked year, month and day count as 1,
+        masked hour, minute and second as 0, and sub-second precision is ignored.
+        """
+        days, day_seconds = np.divmod(self._local_seconds(), 86400)
+        civil: list[np.ndarray] = []
+
+        def date_field(i: int) -> np.ndarray:
+            if not civil:
+                # Day numbers of years 1-9999 fit in int32, which halves the memory traffic
+                civil.extend(_civil_from_days(days.astype(np.int32)))
+            return civil[i]
+
+        fields = {
+            "year": lambda: date_field(0),
+            "month": lambda: date_field(1),
+            "day": lambda: date_field(2),
+            "hour": lambda: day_seconds // 3600,
+            "minute": lambda: day_seconds // 60 % 60,
+            "second": lambda: day_seconds % 60,
+        }
+
+        # Fields masked or unmasked in every value skip the per-element select
+        any_masked = int(np.bitwise_or.reduce(self.mask)) if len(self) else 0
+        all_masked = int(np.bitwise_and.reduce(self.mask)) if len(self) else 0
+        # The layout of packing.comparison_key without the sub-second and mask bits
+        key = np.zeros(len(self), dtype=np.int64)
+        for field, shift, mask_bit, masked_value in SECONDS_KEY_FIELDS:
+            bit = 1 << mask_bit
+            if all_masked & bit:
+                key |= masked_value << shift
+            elif any_masked & bit:
+                values = np.where(self.mask & bit, masked_value, fields[field]())
+                key |= values.astype(np.int64, copy=False) << shift
+            else:
+                key |= fields[field]().astype(np.int64, copy=False) << shift
+        return key
+
+    def _order_keys(self) -> np.ndarray:
+        """
+        Keys ordered like `comparison_keys`, cheaper to compute when all values have the same mask
+        and the date is not masked: epoch seconds with the masked time fields subtracted.
+        Only keys of values with the same mask can be compared.
+        """
+        bits = int(self.mask[0]) if len(self) else 0
+        if bits & _DATE_BITS or np.any(self.mask != bits):
+            return self.comparison_keys()
+        seconds = self._local_seconds()
+        for unit, period, bit in _TIME_FIELDS:
+            if bits & bit:
+                seconds -= seconds % period // unit * unit
+        return seconds
+
+    def argsort(self) -> np.ndarray:
+        """
+        Returns the indices that sort the array by comparison key. The sort is stable and values
+        with different masks are ordered by their keys.
+        """
+        return np.argsort(self._order_keys(), kind="stable")
+
+    def sort(self) -> "FlexDateTimeArray":
+        """
+        Returns a sorted copy, see `argsort`.
+        """
+        return self[self.argsort()]
+
+    def min(self) -> flex_datetime:
+        return self[int(np.argmin(self._order_keys()))]
+
+    def max(self) -> flex_datetime:
+        return self[int(np.argmax(self._order_keys()))]
+
+    def _compare(self, other: Union["FlexDateTimeArray", flex_datetime]) -> tuple[np.ndarray, Any]:
+        if isinstance(other, flex_datetime):
+            other = FlexDateTimeArray.from_flex([other])
+        if not isinstance(other, FlexDateTimeArray):
+            raise TypeError(f"Cannot compare FlexDateTimeArray with {type(other).__name__}")
+        if np.any(self.mask != other.mask):
+            raise ValueError("Cannot compare flex_datetime instances with different masks.")
+        return self._order_keys(), other._order_keys()
+
+    def __eq__(self, other) -> np.ndarray:  # type: ignore[override]
+        a, b = self._compare(other)
+        return a == b
+
+    def __ne__(self, other) -> np.ndarray:  # type: ignore[override]
+        a, b = self._compare(other)
+        return a != b
+
+    def __lt__(self, other) -> np.ndarray:
+        a, b = self._compare(other)
+        return a < b
+
+    def __le__(self, other) -> np.ndarray:
+        a, b = self._compare(other)
+        return a <= b
+
+    def __gt__(self, other) -> np.ndarray:
+        a, b = self._compare(other)
+        return a > b
+
+    def __ge__(self, other) -> np.ndarray:
+        a, b = self._compare(other)
+        return a >= b
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __len__(self) -> int:
+        return len(self.dt)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, (int, np.integer)):
+            us = int(self.dt[index].view(np.int64))
+            if us == _NAT:
+                return None
+            dt = _to_datetime(us, int(self.offset[index]))
+            return flex_datetime._from_parsed(dt, format(int(self.mask[index]), "07b"))
+        return FlexDateTimeArray(self.dt[index], self.mask[index], self.offset[index])
+
+    def __iter__(self) -> Iterator[Optional[flex_datetime]]:
+        return iter(self.to_list())
+
+    @classmethod
+    def concat(cls, arrays: Iterable["FlexDateTimeArray"]) -> "FlexDateTimeArray":
+        arrays = list(arrays)
+        return cls(
+            np.concatenate([a.dt for a in arrays]),
+            np.concatenate([a.mask for a in arrays]),
+            np.concatenate([a.offset for a in arrays]),
+        )
+
+    def __repr__(self) -> str:
+        values = [repr(str(ft)) for ft in self[:10]]
+        if len(self) > 10:
+            values.append("...")
+        return f"FlexDateTimeArray([{', '.join(values)}])"
@@ -1,8 +1,10 @@
+import io
 import json
 import re
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone, tzinfo
 from enum import StrEnum
-from typing import Any, ClassVar, Optional, Union, overload
+from itertools import chain, islice
+from typing import IO, Any, Callable, ClassVar, Iterable, Iterator, Optional, Union, overload
 
 import arrow
 from dateutil import parser as date_parser
@@ -11,7 +13,28 @@ from pydantic_core import core_schema
 
 import flexible_datetime.pydantic_arrow  # noqa: F401 # Need to import this module to patch arrow.Arrow
 from flexible_datetime.flexible_datetime import FlexDateTime
-from flexible_datetime.time_utils import infer_time_format
+from flexible_datetime.formatting import compile_short_format
+from flexible_datetime.intervals import period_bounds
+from flexible_datetime.masks import MaskView, mask_bit_values, mask_to_bits
+from flexible_datetime.packing import (
+    ALL_MASK_BITS,
+    comparison_key,
+    datetime_from_bytes,
+    datetime_to_bytes,
+    local_micros,
+    pack,
+    pack_local,
+    sort_key,
+    tz_from_id,
+    tz_id,
+    unpack,
+    unpack_datetime,
+)
+from flexible_datetime.time_utils import (
+    infer_time_format,
+    lock_datetime_format,
+    parse_datetime_str,
+)
 
 FlextimeInput = Union[str, FlexDateTime, date, datetime, arrow.Arrow, dict, "flex_datetime", None]
 
@@ -41,6 +64,7 @@ class OutputFormat(StrEnum):
 
 
 class flex_datetime:
+    __slots__ = ("_datetime", "_arrow", "_mask_bits", "_output_format")
 
     _dt_formats: ClassVar[dict[str, str]] = {
         "YYYY": "year",
@@ -65,25 +89,19 @@ class flex_datetime:
         "second": None,
         "millisecond": None,
     }
+    _mask_bit_values: ClassVar[dict[str, int]] = mask_bit_values(_mask_fields)
 
     _default_output_format: ClassVar[OutputFormat] = OutputFormat.short
 
     def __init__(self, *args: FlextimeInput, **kwargs: Any):
-        self.dt = arrow.utcnow()
-        self.mask = {
-            "year": False,
-            "month": False,
-            "day": False,
-            "hour": False,
-            "minute": False,
-            "second": False,
-            "millisecond": False,
-        }
+        self._arrow: Optional[arrow.Arrow] = None
+        self._mask_bits = 0
 
         self._output_format: Optional[OutputFormat] = None
         if args and args[0] is None:
             raise ValueError("Cannot parse None as a flex_datetime.")
         if not args and not kwargs:
+            self._datetime = datetime.now(timezone.utc)
             return  # default values
         if args:
             if isinstance(args[0], dict):
@@ -103,21 +121,36 @@ class flex_datetime:
                     elif "mask" in d and isinstance(d["mask"], str):
                         ## {"dt": "2023-06-29T12:30:45+00:00", "mask": "0011111"}
                         self.mask = self.binary_to_mask(d["mask"])
+                    elif "mask" in d and isinstance(d["mask"], int):
+                        ## {"dt": datetime(2023, 6, 29, 12, 30), "mask": 0b0000011, "offset": 7200}
+                        ## see mongo.to_bson, the dt holds the local fields
+                        if not 0 <= d["mask"] <= ALL_MASK_BITS:
+                            raise ValueError(
+                                f"Invalid mask bits {d['mask']}, expected 0 to {ALL_MASK_BITS}."
+                            )
+                        self._mask_bits = d["mask"]
+                        if d.get("offset"):
+                            self.dt = self._datetime.replace(tzinfo=tz_from_id(d["offset"]))
             elif isinstance(args[0], str):
                 ## handle string input,"2023", "2023-06-29T12:30:45+00:00"
+                parsed = parse_datetime_str(args[0])
+                if parsed is not None:
+                    self._datetime, mask_str = parsed
+                    self._mask_bits = int(mask_str, 2)
+                    return
                 dt, mask = self._components_from_str(args[0])
                 self.dt = dt
                 self.mask = mask
             elif isinstance(args[0], flex_datetime):
                 ## handle flex_datetime input
-                self.dt = args[0].dt
+                self.dt = args[0].to_datetime()
                 self.mask = args[0].mask
             elif isinstance(args[0], FlexDateTime):
                 ## handle FlexDateTime input
                 self.dt = args[0].dt
                 self.mask = args[0].mask
             elif isinstance(args[0], datetime) or isinstance(args[0], arrow.Arrow):
-                self.dt = arrow.get(args[0])
+                self.dt = args[0]
             elif isinstance(args[0], date):
                 self.dt = arrow.get(args[0])
                 self.mask.update(
@@ -128,7 +161,7 @@ class flex_datetime:
             return
         ## handle kwargs input
         if "dt" in kwargs:
-            self.dt = arrow.get(kwargs["dt"])
+            self.dt = kwargs["dt"]
             if "mask" in kwargs:
                 if isinstance(kwargs["mask"], dict):
                     self.mask = kwargs["mask"]
@@ -147,35 +180,34 @@ class flex_datetime:
         _handler: GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
         """
-        Defines the Pydantic core schema for flex_datetime
+        Defines the Pydantic core schema for flex_datetime.
+        Validation is a single plain validator, so inputs are not tried against a union of schemas.
         """
-
-        def flex_datetime_serialization(value: flex_datetime, _, info) -> str:
-            return str(value)
-
-        return core_schema.no_info_after_validator_function(
+        return core_schema.no_info_plain_validator_function(
             function=cls.validate,
-            schema=core_schema.union_schema(
-                [
-                    core_schema.str_schema(),
-                    core_schema.dict_schema(),
-                    core_schema.is_instance_schema(flex_datetime),
-                    core_schema.is_instance_schema(datetime),
-                    core_schema.is_instance_schema(arrow.Arrow),
-                    core_schema.is_instance_schema(cls),
-                    core_schema.no_info_plain_validator_function(cls),
-                ]
+            json_schema_input_schema=core_schema.union_schema(
+                [core_schema.str_schema(), core_schema.dict_schema()]
             ),
-            serialization=core_schema.wrap_serializer_function_ser_schema(
-                flex_datetime_serialization, info_arg=True
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, return_schema=core_schema.str_schema()
             ),
         )
 
     @classmethod
     def validate(cls, value) -> "flex_datetime":
-        if isinstance(value, flex_datetime):
+        if isinstance(value, cls):
             return value
-        return flex_datetime(value)
+        if isinstance(value, str):
+            parsed = parse_datetime_str(value)
+            if parsed is not None:
+                return cls._from_parsed(*parsed)
+        return cls(value)
+
+    @staticmethod
+    def _serialize(value: "flex_datetime") -> str:
+        if isinstance(value, flex_datetime):
+            return value.to_str()
+        return str(value)
 
     @staticmethod
     def infer_format(date_str: str) -> str:
@@ -207,6 +239,42 @@ class flex_datetime:
         dt, mask = cls._components_from_str(date_str, input_fmt)
         return cls(dt=dt, mask=mask)
 
+    @classmethod
+    def parse_many(
+        cls, values: Iterable[FlextimeInput], sample: int = 100
+    ) -> list["flex_datetime"]:
+        """
+        Creates flex_datetime instances from many values.
+        The dominant layout among the first `sample` strings is locked and used to parse the rest,
+        values with another layout go through `validate`, so instances of the class are kept as is.
+        """
+        it = iter(values)
+        head = list(islice(it, sample))
+        locked = lock_datetime_format(head)
+        if locked is None:
+            return [cls.validate(value) for value in chain(head, it)]
+
+        results = []
+        for value in chain(head, it):
+            parsed = locked.parse(value) if isinstance(value, str) else None
+            if parsed is None:
+                results.append(cls.validate(value))
+            else:
+                results.append(cls._from_parsed(*parsed))
+        return results
+
+    @classmethod
+    def _from_parsed(cls, dt: datetime, mask_str: str) -> "flex_datetime":
+        """
+        Creates a flex_datetime instance from an already parsed datetime and binary mask.
+        """
+        ft = cls.__new__(cls)
+        ft._datetime = dt
+        ft._arrow = None
+        ft._mask_bits = int(mask_str, 2)
+        ft._output_format = None
+        return ft
+
     @classmethod
     def from_datetime(cls, dt: datetime | date) -> "flex_datetime":
         """
@@ -235,6 +303,11 @@ class flex_datetime:
         """
         Creates the components of a flex_datetime instance from a string.
         """
+        if input_fmt is None:
+            parsed = parse_datetime_str(date_str)
+            if parsed is not None:
+                dt, mask_str = parsed
+                return dt, cls.binary_to_mask(mask_str)
 
         try:
             dt = arrow.get(date_str, input_fmt) if input_fmt else arrow.get(date_str)
@@ -304,6 +377,17 @@ class flex_datetime:
         dt, mask = cls._components_from_dict(datetime_dict)
         return cls(dt=dt, mask=mask)
 
+    @property
+    def mask(self) -> MaskView:
+        """
+        The mask as a dict-like view of the mask bits, e.g. {"year": False, ..., "millisecond": True}.
+        """
+        return MaskView(self)
+
+    @mask.setter
+    def mask(self, mask: dict) -> None:
+        self._mask_bits = mask_to_bits(mask, self._mask_bit_values)
+
     def apply_mask(self, **kwargs) -> None:
         """
         Updates the mask with the provided keyword arguments.
@@ -314,15 +398,7 @@ class flex_datetime:
         """
         Clears the mask.
         """
-        self.mask = {
-            "year": False,
-            "month": False,
-            "day": False,
-            "hour": False,
-            "minute": False,
-            "second": False,
-            "millisecond": False,
-        }
+        self._mask_bits = 0
 
     def use_only(self, *args, **kwargs) -> None:
         """
@@ -345,37 +421,59 @@ class flex_datetime:
         for key in kwargs:
             self.mask[key] = not self.mask[key]
 
+    @property
+    def dt(self) -> arrow.Arrow:
+        """
+        The datetime as an arrow.Arrow, created on first access.
+        """
+        if self._arrow is None:
+            self._arrow = arrow.Arrow.fromdatetime(self._datetime)
+        return self._arrow
+
+    @dt.setter
+    def dt(self, value: Union[arrow.Arrow, datetime, date, str]) -> None:
+        if type(value) is datetime:
+            # Plain datetimes are stored as they are, naive ones are taken as UTC like arrow does
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            self._datetime = value
+            self._arrow = None
+        else:
+            value = value if isinstance(value, arrow.Arrow) else arrow.get(value)
+            self._datetime = value.datetime
+            self._arrow = value
+
     @property
     def year(self):
-        return self.dt.year
+        return self._datetime.year
 
     @property
     def month(self):
-        return self.dt.month
+        return self._datetime.month
 
     @property
     def day(self):
-        return self.dt.day
+        return self._datetime.day
 
     @property
     def hour(self):
-        return self.dt.hour
+        return self._datetime.hour
 
     @property
     def minute(self):
-        return self.dt.minute
+        return self._datetime.minute
 
     @property
     def second(self):
-        return self.dt.second
+        return self._datetime.second
 
     @property
     def millisecond(self):
-        return self.dt.microsecond // 1000
+        return self._datetime.microsecond // 1000
 
     @property
     def microsecond(self):
-        return self.dt.microsecond
+        return self._datetime.microsecond
 
     def to_short_datetime(self, output_fmt: Optional[str] = None) -> str:
         """
@@ -387,84 +485,108 @@ class flex_datetime:
         Returns:
             The string representation of the datetime.
         """
-        if not self.dt:
+        if not self._datetime:
             return "Invalid datetime"
 
-        output_str = output_fmt or "YYYY-MM-DDTHH:mm:ss.SSSSSS%z"
-
-        # Handle each part
-        for fmt, part in flex_datetime._dt_formats.items():
-            if part == "millisecond":
-                # Format milliseconds/microseconds correctly
-                microseconds = self.dt.microsecond
-                if "SSSSSS" in output_str:
-                    replacement = f"{microseconds:06d}"
-                elif "SSSSS" in output_str:
-                    replacement = f"{microseconds:06d}"[:5]
-                elif "SSSS" in output_str:
-                    replacement = f"{microseconds:06d}"[:4]
-                elif "SSS" in output_str:
-                    replacement = f"{microseconds:06d}"[:3]
-                elif "SS" in output_str:
-                    replacement = f"{microseconds // 1000:03d}"[:2]
-                elif "S" in output_str:
-                    replacement = f"{microseconds // 1000:03d}"[:1]
-                else:
-                    replacement = ""
-                if self.mask[part]:
-                    replacement = ""
-                output_str = re.sub(r"S{1,6}", replacement, output_str)
-            elif part == "tzinfo":
-                # Handle timezone offset
-                if self.dt.tzinfo:
-                    offset = self.dt.utcoffset()
-                    if offset:
-                        hours, remainder = divmod(offset.total_seconds(), 3600)
-                        minutes = remainder // 60
-                        replacement = f"{hours:+03.0f}:{minutes:02.0f}"
-                    else:
-                        replacement = "+00:00"
-                else:
-                    replacement = ""
-                if self.mask[part]:
-                    replacement = ""
-                output_str = output_str.replace("%z", replacement)
-            else:
-                value = getattr(self.dt, part)
-                replacement = (
-                    f"{value:02d}" if fmt in ["MM", "DD", "HH", "mm", "ss"] else str(value)
-                )
-                replacement = replacement if not self.mask[part] else ""
-                output_str = output_str.replace(fmt, replacement)
-
-        # Remove unnecessary separators while preserving date and time structure
-        output_str = re.sub(r"(?<=\d)(\s|-|:|T)(?=\d)", r"\1", output_str)
-        output_str = re.sub(r"\s+", " ", output_str).strip()
-        output_str = re.sub(r"-+", "-", output_str)
-        output_str = re.sub(r":+", ":", output_str)
-
-        # Remove all non-digits at the beginning and end of string, except for '+' or '-' for timezone
-        output_str = re.sub(r"^[^\d+-]+|[^\d+-]+$", "", output_str)
-
-        # Remove trailing dot if no microseconds
-        output_str = re.sub(r"\.$", "", output_str)
-
-        # Remove trailing colon or dash
-        output_str = re.sub(r"[-:]\s*$", "", output_str)
-        return output_str
+        output_fmt = output_fmt or "YYYY-MM-DDTHH:mm:ss.SSSSSS%z"
+        # The format is compiled once per mask, see `flexible_datetime.formatting`
+        return compile_short_format(output_fmt, self._mask_bits).format(self._datetime)
 
     def to_str(self, output_format: Optional[str] = None) -> str:
         output_format = output_format or self._output_format
         if output_format is None:
             output_format = self._default_output_format
         if output_format == OutputFormat.datetime:
-            return str(self.dt)
+            return self._datetime.isoformat()
         elif output_format == OutputFormat.short:
             return self.to_short_datetime()
         elif output_format == OutputFormat.components:
             return str(self.to_components())
         return str(self.to_flex())
 
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[FlextimeInput],
+        output_format: Optional[Union[OutputFormat, str]] = None,
+        output_fmt: Optional[str] = None,
+    ) -> list[str]:
+        """
+        Renders many values in one output format.
+
+        Args:
+            values: flex_datetime instances, other inputs are converted first.
+            output_format: Defaults to the default output format of the class.
+                Output formats set on individual instances are not consulted.
+            output_fmt: The format of the short output, see `to_short_datetime`.
+        """
+        return list(cls._iter_format(values, output_format, output_fmt))
+
+    @classmethod
+    def write_many(
+        cls,
+        values: Iterable[FlextimeInput],
+        fp: Union[IO[str], IO[bytes]],
+        output_format: Optional[Union[OutputFormat, str]] = None,
+        output_fmt: Optional[str] = None,
+        sep: str = "\n",
+        chunksize: int = 10_000,
+    ) -> int:
+        """
+        Writes many values to a text or binary stream, each one followed by `sep`.
+        Values are rendered lazily and written `chunksize` at a time.
+        See `format_many` for the other arguments.
+
+        Returns:
+            The number of values written.
+        """
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+        lines = cls._iter_format(values, output_format, output_fmt)
+        count = 0
+        while chunk := list(islice(lines, chunksize)):
+            text = sep.join(chunk) + sep
+            fp.write(text.encode() if binary else text)  # type: ignore
+            count += len(chunk)
+        return count
+
+    @classmethod
+    def _iter_format(
+        cls,
+        values: Iterable[FlextimeInput],
+        output_format: Optional[Union[OutputFormat, str]],
+        output_fmt: Optional[str],
+    ) -> Iterator[str]:
+        output_format = OutputFormat(output_format or cls._default_output_format)
+        render: Callable[[flex_datetime], str]
+        if output_format == OutputFormat.short:
+            fmt = output_fmt or "YYYY-MM-DDTHH:mm:ss.SSSSSS%z"
+            formatters: dict[int, Callable[[datetime], str]] = {}
+
+            def render(ft: flex_datetime) -> str:
+                formatter = formatters.get(ft._mask_bits)
+                if formatter is None:
+                    formatter = compile_short_format(fmt, ft._mask_bits).format
+                    formatters[ft._mask_bits] = formatter
+                return formatter(ft._datetime)
+
+        elif output_format == OutputFormat.datetime:
+
+            def render(ft: flex_datetime) -> str:
+                return ft._datetime.isoformat()
+
+        elif output_format == OutputFormat.components:
+
+            def render(ft: flex_datetime) -> str:
+                return str(ft.to_components())
+
+        else:
+
+            def render(ft: flex_datetime) -> str:
+                return str(ft.to_flex())
+
+        for value in values:
+            yield render(value if isinstance(value, flex_datetime) else cls(value))
+
     def to_json(self, output_format: Optional[str] = None) -> str:
         return self.to_str(output_format)
 
@@ -477,26 +599,26 @@ class flex_datetime:
 
     def to_components(self) -> dict[str, int]:
         component_json = {
-            "year": self.dt.year,
-            "month": self.dt.month,
-            "day": self.dt.day,
-            "hour": self.dt.hour,
-            "minute": self.dt.minute,
-            "second": self.dt.second,
-            "millisecond": self.dt.microsecond // 1000,
+            "year": self._datetime.year,
+            "month": self._datetime.month,
+            "day": self._datetime.day,
+            "hour": self._datetime.hour,
+            "minute": self._datetime.minute,
+            "second": self._datetime.second,
+            "millisecond": self._datetime.microsecond // 1000,
         }
         return {k: v for k, v in component_json.items() if not self.mask.get(k, False)}
 
     @property
     def mask_str(self) -> str:
-        return self.mask_to_binary(self.mask)
+        return format(self._mask_bits, "07b")
 
     def to_flex(self) -> dict[str, str]:
         """
         Returns the dictionary representation of the datetime and mask.
         """
         mask = self.mask_to_binary(self.mask)
-        return {"dt": str(self.dt), "mask": mask}
+        return {"dt": self._datetime.isoformat(), "mask": mask}
 
     def to_mask(self) -> dict[str, str]:
         """
@@ -508,7 +630,18 @@ class flex_datetime:
         """
         Returns the datetime object.
         """
-        return self.dt.datetime
+        return self._datetime
+
+    def as_interval(self) -> tuple[datetime, Optional[datetime]]:
+        """
+        Returns the datetimes [start, end) this value stands for, in its time zone, e.g.
+        [2023-06-01, 2023-07-01) for "2023-06". Unmasked values cover the second they fall in, since
+        sub-second precision is not compared. The end is None past the last representable date.
+
+        Masks that are not a single period, e.g. a day of the month without a year, raise a
+        ValueError.
+        """
+        return period_bounds(self._datetime, self._mask_bits, utc=False)
 
     def __str__(self) -> str:
         """
@@ -519,24 +652,108 @@ class flex_datetime:
     def __repr__(self) -> str:
         return str(self)
 
+    @property
+    def mask_bits(self) -> int:
+        """
+        The mask as an integer, e.g. 0b0011111 for "0011111".
+        """
+        return self._mask_bits
+
+    def to_packed(self) -> int:
+        """
+        Returns the datetime and mask packed into a single integer, see `flexible_datetime.packing`.
+        The local fields are packed, the ones the comparisons use, so `comparison_key` of the packed
+        integer orders values like the operators do. The time zone is not kept.
+        """
+        return pack_local(self._datetime, self._mask_bits)
+
+    @classmethod
+    def from_packed(cls, packed: int, tz: tzinfo = timezone.utc) -> "flex_datetime":
+        """
+        Creates a flex_datetime instance from a packed integer, with the fields taken in `tz`.
+        """
+        dt, mask_bits = unpack_datetime(packed, tz)
+        return cls._from_parsed(dt, format(mask_bits, "07b"))
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns a fixed-width 13 byte encoding: the microseconds of the local fields since
+        1970-01-01, the UTC offset and the mask bits. Time zones are kept as their UTC offsets.
+        """
+        return datetime_to_bytes(self._datetime, self._mask_bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "flex_datetime":
+        """
+        Creates a flex_datetime instance from the encoding of `to_bytes`.
+        """
+        dt, mask_bits = datetime_from_bytes(data)
+        return cls._from_parsed(dt, format(mask_bits, "07b"))
+
+    def __reduce__(self):
+        # The packed local datetime and mask plus a compact time zone id, see `packing.tz_id`
+        dt = self._datetime
+        args: tuple = (type(self), pack_local(dt, self._mask_bits), tz_id(dt.tzinfo))
+        if self._output_format is not None or dt.fold:
+            args += (self._output_format and self._output_format.value,)
+        if dt.fold:
+            args += (dt.fold,)
+        return _restore_flex_datetime, args
+
+    def __composite_values__(self) -> tuple[int, int]:
+        """
+        The (local epoch microseconds, mask bits) column values of a SQLAlchemy composite, see
+        `flexible_datetime.sqlalchemy_type`.
+        """
+        return local_micros(self._datetime), self._mask_bits
+
+    def _comparison_key(self) -> int:
+        """
+        Integer equivalent of `get_comparable_dt`, used by the comparison operators.
+        """
+        dt = self._datetime
+        return comparison_key(
+            pack(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, 0, self._mask_bits)
+        )
+
+    def sort_key(self) -> int:
+        """
+        Returns an integer key ordering values of any mask, e.g. for `sorted`, `heapq` or `bisect`:
+
+            sorted(values, key=flex_datetime.sort_key)
+
+        Values are ordered by the start of their period, then by their microseconds where
+        milliseconds are not masked, then coarser masks first: "2023" < "2023-01" < "2023-01-01" <
+        "2023-01-01T00:00". Values that compare lower with `<` also have lower sort keys.
+        """
+        return sort_key(pack_local(self._datetime, self._mask_bits))
+
+    def freeze(self) -> "frozen_datetime":
+        """
+        Returns an immutable, hashable copy of this instance, see `frozen_datetime`.
+        """
+        ft = frozen_datetime(self)
+        ft._output_format = self._output_format
+        return ft
+
     def get_comparable_dt(self) -> arrow.Arrow:
         """
         Creates a comparable datetime that respects the mask.
         """
         return arrow.get(
-            self.dt.year if not self.mask["year"] else 1,
-            self.dt.month if not self.mask["month"] else 1,
-            self.dt.day if not self.mask["day"] else 1,
-            self.dt.hour if not self.mask["hour"] else 0,
-            self.dt.minute if not self.mask["minute"] else 0,
-            self.dt.second if not self.mask["second"] else 0,
+            self._datetime.year if not self.mask["year"] else 1,
+            self._datetime.month if not self.mask["month"] else 1,
+            self._datetime.day if not self.mask["day"] else 1,
+            self._datetime.hour if not self.mask["hour"] else 0,
+            self._datetime.minute if not self.mask["minute"] else 0,
+            self._datetime.second if not self.mask["second"] else 0,
         )
 
     def _ensure_same_mask(self, other: "flex_datetime") -> None:
         """
         Ensures that the mask of the current instance matches the mask of the other instance.
         """
-        if self.mask != other.mask:
+        if self._mask_bits != other._mask_bits:
             raise ValueError(
                 f"Cannot compare flex_datetime instances with different masks. {self.mask} != {other.mask}"
             )
@@ -602,37 +819,37 @@ class flex_datetime:
             return False
         if not allow_different_masks:
             self._ensure_same_mask(other)
-        return self.get_comparable_dt() == other.get_comparable_dt()
+        return self._comparison_key() == other._comparison_key()
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, flex_datetime):
             return False
         self._ensure_same_mask(other)
-        return self.get_comparable_dt() == other.get_comparable_dt()
+        return self._comparison_key() == other._comparison_key()
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, flex_datetime):
             return NotImplemented
         self._ensure_same_mask(other)
-        return self.get_comparable_dt() < other.get_comparable_dt()
+        return self._comparison_key() < other._comparison_key()
 
     def __le__(self, other) -> bool:
         if not isinstance(other, flex_datetime):
             return NotImplemented
         self._ensure_same_mask(other)
-        return self.get_comparable_dt() <= other.get_comparable_dt()
+        return self._comparison_key() <= other._comparison_key()
 
     def __gt__(self, other) -> bool:
         if not isinstance(other, flex_datetime):
             return NotImplemented
         self._ensure_same_mask(other)
-        return self.get_comparable_dt() > other.get_comparable_dt()
+        return self._comparison_key() > other._comparison_key()
 
     def __ge__(self, other) -> bool:
         if not isinstance(other, flex_datetime):
             return NotImplemented
         self._ensure_same_mask(other)
-        return self.get_comparable_dt() >= other.get_comparable_dt()
+        return self._comparison_key() >= other._comparison_key()
 
     @overload
     def __sub__(self, other: Union["flex_datetime", datetime]) -> timedelta: ...
@@ -653,9 +870,9 @@ class flex_datetime:
             return self.dt - other_dt
         elif isinstance(other, timedelta):
             # Create new flex_datetime with subtracted timedelta
-            new_dt = self.dt - other
+            new_dt = self._datetime - other
             result = flex_datetime(new_dt)
-            result.mask = self.mask.copy()  # Preserve the mask
+            result._mask_bits = self._mask_bits  # Preserve the mask
             return result
         return NotImplemented
 
@@ -665,9 +882,9 @@ class flex_datetime:
         Returns a new flex_datetime object.
         """
         if isinstance(other, timedelta):
-            new_dt = self.dt + other
+            new_dt = self._datetime + other
             result = flex_datetime(new_dt)
-            result.mask = self.mask.copy()  # Preserve the mask
+            result._mask_bits = self._mask_bits  # Preserve the mask
             return result
         return NotImplemented
 
@@ -691,22 +908,94 @@ class flex_datetime:
 
 
 short_datetime = type(
-    "short_datetime", (flex_datetime,), {"_default_output_format": OutputFormat.short}
+    "short_datetime",
+    (flex_datetime,),
+    {"__slots__": (), "_default_output_format": OutputFormat.short},
 )
 
 dict_datetime = type(
-    "dict_datetime", (flex_datetime,), {"_default_output_format": OutputFormat.components}
+    "dict_datetime",
+    (flex_datetime,),
+    {"__slots__": (), "_default_output_format": OutputFormat.components},
 )
 
 iso_datetime = type(
-    "iso_datetime", (flex_datetime,), {"_default_output_format": OutputFormat.datetime}
+    "iso_datetime",
+    (flex_datetime,),
+    {"__slots__": (), "_default_output_format": OutputFormat.datetime},
 )
 
 mask_datetime = type(
-    "flexible_time", (flex_datetime,), {"_default_output_format": OutputFormat.mask}
+    "flexible_time",
+    (flex_datetime,),
+    {"__slots__": (), "_default_output_format": OutputFormat.mask},
 )
 
 
+class frozen_datetime(flex_datetime):
+    """
+    Immutable, hashable flex_datetime.
+
+    The masked comparison key is computed once and reused by hashing, equality and ordering.
+    Instances with different masks compare unequal instead of raising, so mixed masks can share
+    a set or dict. Ordering still requires the same mask.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(self, *args: FlextimeInput, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._freeze()
+
+    @classmethod
+    def _from_parsed(cls, dt: datetime, mask_str: str) -> "frozen_datetime":
+        ft = super()._from_parsed(dt, mask_str)
+        ft._freeze()
+        return ft
+
+    def _freeze(self) -> None:
+        object.__setattr__(self, "_key", super()._comparison_key())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Only the output format and the cached Arrow can change, they do not take part in comparisons
+        if name not in ("output_format", "_output_format", "_arrow") and hasattr(self, "_key"):
+            raise AttributeError(f"{type(self).__name__} instances are immutable")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> "frozen_datetime":
+        return self
+
+    def _comparison_key(self) -> int:
+        return self._key
+
+    def __hash__(self) -> int:
+        # The comparison key leaves the mask bits clear, so they can be folded into the hash
+        return hash(self._key | self._mask_bits)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, flex_datetime):
+            return False
+        return self._mask_bits == other._mask_bits and self._key == other._comparison_key()
+
+
+def _restore_flex_datetime(
+    cls: type[flex_datetime],
+    packed: int,
+    tz: Any,
+    output_format: Optional[str] = None,
+    fold: int = 0,
+) -> flex_datetime:
+    """
+    Unpickles the values reduced by `flex_datetime.__reduce__`.
+    """
+    *fields, mask_bits = unpack(packed)
+    dt = datetime(*fields, tzinfo=tz_from_id(tz), fold=fold)
+    ft = cls._from_parsed(dt, format(mask_bits, "07b"))
+    if output_format is not None:
+        ft._output_format = OutputFormat(output_format)
+    return ft
+
+
 try:
     import beanie  # type: ignore  # noqa: F401
     import beanie.odm.utils.encoder as encoder  # type: ignore
@@ -1,12 +1,24 @@
 import re
 from datetime import datetime, time, timedelta
 from enum import StrEnum
-from typing import Any, ClassVar, Optional, Union
+from itertools import chain, islice
+from typing import Any, ClassVar, Iterable, Optional, Union
 
 import arrow
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
+from flexible_datetime.masks import MaskView, mask_bit_values, mask_to_bits
+from flexible_datetime.packing import (
+    pack_time,
+    time_from_bytes,
+    time_to_bytes,
+    tz_from_id,
+    tz_id,
+    unpack_time,
+)
+from flexible_datetime.time_utils import date_shape, dominant_shape
+
 FlextimeInput = Union[str, int, time, datetime, arrow.Arrow, dict, "flex_time", None]
 
 
@@ -34,6 +46,8 @@ class OutputFormat(StrEnum):
 
 
 class flex_time:
+    __slots__ = ("time", "_mask_bits", "_output_format")
+
     _time_formats: ClassVar[dict[str, str]] = {
         "HH": "hour",
         "mm": "minute",
@@ -52,9 +66,21 @@ class flex_time:
         "second": None,
         "microsecond": None,
     }
+    _mask_bit_values: ClassVar[dict[str, int]] = mask_bit_values(_mask_fields)
 
     _default_output_format: ClassVar[OutputFormat] = OutputFormat.short
 
+    _time_re: ClassVar[re.Pattern] = re.compile(
+        r"(\d{1,2})"
+        r"(?:\s*:\s*(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?"
+        r"|\.(\d{2})(?:\.(\d{2})(?:\.(\d{1,6}))?)?)?"
+        r"(?:\s*([ap])\.?(?:m\.?)?)?",
+        re.ASCII,
+    )
+
+    # 24-hour shapes whose digits can be read directly: H, H:mm, H:mm:ss
+    _positional_shape: ClassVar[re.Pattern] = re.compile(r"d{1,2}(?::dd){0,2}")
+
     def __init__(
         self,
         *args: FlextimeInput,
@@ -65,12 +91,7 @@ class flex_time:
         **kwargs: Any,
     ):
         self.time = time(0, 0, 0, 0)  # midnight by default
-        self.mask = {
-            "hour": False,
-            "minute": False,
-            "second": False,
-            "microsecond": True,  # Always mask microseconds by default
-        }
+        self._mask_bits = 0b0001  # Always mask microseconds by default
 
         self._output_format: Optional[OutputFormat] = None
 
@@ -257,6 +278,48 @@ class flex_time:
         # If no match found, return None to indicate this isn't a natural language time
         return None
 
+    @staticmethod
+    def _tokenize_time_str(time_str: str) -> Optional[time]:
+        """
+        Parses the common time layouts in a single pass:
+        H, H:mm, H:mm:ss, HH:mm:ss.SSSSSS, H.mm, HH.mm.ss, HH.mm.ss.SSSSSS,
+        each optionally followed by am/pm (a, p, am, a.m., ...).
+
+        Expects a lowercase string without prefixes. Returns None if the string has another
+        layout or is out of range, in which case `_parse_time_formats` decides.
+        """
+        m = flex_time._time_re.fullmatch(time_str.strip(". "))
+        if m is None:
+            return None
+        hour_str, minute, second, micro, dot_minute, dot_second, dot_micro, meridian = m.groups()
+        minute = minute or dot_minute
+        second = second or dot_second
+        micro = micro or dot_micro
+        # Seconds with "." separators and microseconds require a two digit hour (HH.mm.ss, HH:mm:ss.SSSSSS)
+        if (dot_second or micro) and len(hour_str) != 2:
+            return None
+        if micro and meridian:
+            return None
+
+        hour = int(hour_str)
+        if meridian == "p" and hour < 12:
+            hour += 12
+        elif meridian == "a":
+            if hour > 12:
+                return None
+            if hour == 12:
+                hour = 0
+        t_minute = int(minute) if minute else 0
+        t_second = int(second) if second else 0
+        t_micro = int(micro.ljust(6, "0")) if micro else 0
+        if hour == 24 and not (t_minute or t_second or t_micro):
+            # Midnight at the end of the day
+            hour = 0
+        try:
+            return time(hour, t_minute, t_second, t_micro)
+        except ValueError:
+            return None
+
     @staticmethod
     def _parse_time_str(time_str: str) -> time:
         # Remove common prefixes first
@@ -270,6 +333,18 @@ class flex_time:
         natural_time = flex_time._parse_natural_time_str(time_str)
         if natural_time is not None:
             return natural_time
+
+        parsed_time = flex_time._tokenize_time_str(time_str)
+        if parsed_time is not None:
+            return parsed_time
+        return flex_time._parse_time_formats(time_str)
+
+    @staticmethod
+    def _parse_time_formats(time_str: str) -> time:
+        """
+        Parses a time string by trying each of the supported arrow formats in turn.
+        Only used for strings `_tokenize_time_str` does not handle, and to report errors.
+        """
         original_str = time_str
 
         # Handle both PM/AM and single P/A cases
@@ -374,6 +449,54 @@ class flex_time:
 
         return t, mask
 
+    @classmethod
+    def parse_many(cls, values: Iterable[FlextimeInput], sample: int = 100) -> list["flex_time"]:
+        """
+        Creates flex_time instances from many values.
+        The dominant layout among the first `sample` strings is locked and used to parse the rest,
+        values with another layout go through the regular constructor.
+        """
+        it = iter(values)
+        head = list(islice(it, sample))
+        dominant = dominant_shape(head)
+        if dominant is None:
+            return [cls(value) for value in chain(head, it)]
+        shape, representative = dominant
+        try:
+            # The mask only depends on the layout, not on the digits
+            _, mask = cls._components_from_str(representative)
+        except ValueError:
+            return [cls(value) for value in chain(head, it)]
+        mask_bits = mask_to_bits(mask, cls._mask_bit_values)
+        slices = None
+        if cls._positional_shape.fullmatch(shape):
+            slices = [m.span() for m in re.finditer("d+", shape)]
+
+        results = []
+        for value in chain(head, it):
+            if not isinstance(value, str) or date_shape(value) != shape:
+                results.append(cls(value))
+                continue
+            try:
+                if slices is not None:
+                    t = time(*[int(value[start:end]) for start, end in slices])
+                else:
+                    t = cls._parse_time_str(value)
+            except ValueError:
+                results.append(cls(value))
+                continue
+            results.append(cls._from_parsed(t, mask_bits))
+        return results
+
+    @classmethod
+    def _from_parsed(cls, t: time, mask_bits: int) -> "flex_time":
+        """Creates a flex_time instance from an already parsed time and mask bits."""
+        ft = cls.__new__(cls)
+        ft.time = t
+        ft._mask_bits = mask_bits
+        ft._output_format = None
+        return ft
+
     @classmethod
     def _components_from_dict(cls, time_dict: dict) -> tuple[time, dict]:
         """Creates the components of a flex_time instance from a dictionary."""
@@ -400,9 +523,18 @@ class flex_time:
         )
         return t, mask
 
+    @property
+    def mask(self) -> MaskView:
+        """The mask as a dict-like view of the mask bits, e.g. {"hour": False, ...}."""
+        return MaskView(self)
+
+    @mask.setter
+    def mask(self, mask: dict) -> None:
+        self._mask_bits = mask_to_bits(mask, self._mask_bit_values)
+
     @property
     def mask_str(self) -> str:
-        return self.mask_to_binary(self.mask)
+        return format(self._mask_bits, "04b")
 
     @staticmethod
     def mask_to_binary(mask: dict) -> str:
@@ -468,6 +600,24 @@ class flex_time:
         """Convert to a standard time object. This will lose the mask."""
         return self.time
 
+    def to_bytes(self) -> bytes:
+        """Fixed-width 6 byte encoding: the microseconds since midnight and the mask bits."""
+        return time_to_bytes(self.time, self._mask_bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "flex_time":
+        """Creates a flex_time instance from the encoding of `to_bytes`."""
+        t, mask_bits = time_from_bytes(data)
+        return cls._from_parsed(t, mask_bits)
+
+    def __reduce__(self):
+        # The packed time and mask plus a compact time zone id, see `packing.tz_id`
+        tz = tz_id(self.time.tzinfo)
+        packed = pack_time(self.time, self._mask_bits)
+        if self._output_format is None:
+            return _restore_flex_time, (type(self), packed, tz)
+        return _restore_flex_time, (type(self), packed, tz, self._output_format.value)
+
     def __str__(self) -> str:
         return self.to_str()
 
@@ -495,11 +645,11 @@ class flex_time:
         (i.e., one mask can be a subset of the other)
         """
         # Get the unmasked components for each time
-        self_unmasked = {k for k, v in self.mask.items() if not v}
-        other_unmasked = {k for k, v in other.mask.items() if not v}
+        self_unmasked = ~self._mask_bits & 0b1111
+        other_unmasked = ~other._mask_bits & 0b1111
 
         # Check if all unmasked components in either time are present in the other
-        if not (self_unmasked.issubset(other_unmasked) or other_unmasked.issubset(self_unmasked)):
+        if self_unmasked & ~other_unmasked and other_unmasked & ~self_unmasked:
             raise ValueError(
                 f"Cannot compare flex_time instances with incompatible masks. "
                 f"Unmasked components don't form a subset: {self.mask} vs {other.mask}"
@@ -511,16 +661,13 @@ class flex_time:
         When comparing times with different masks, we only compare the components
         that are unmasked in both times.
         """
-        other_mask = getattr(self, "_comparison_mask", self.mask)
+        bits = self._mask_bits
+        t = self.time
         return time(
-            self.time.hour if not (self.mask["hour"] or other_mask["hour"]) else 0,
-            self.time.minute if not (self.mask["minute"] or other_mask["minute"]) else 0,
-            self.time.second if not (self.mask["second"] or other_mask["second"]) else 0,
-            (
-                self.time.microsecond
-                if not (self.mask["microsecond"] or other_mask["microsecond"])
-                else 0
-            ),
+            t.hour if not bits & 0b1000 else 0,
+            t.minute if not bits & 0b0100 else 0,
+            t.second if not bits & 0b0010 else 0,
+            t.microsecond if not bits & 0b0001 else 0,
         )
 
     @classmethod
@@ -591,7 +738,7 @@ class flex_time:
 
         # Create new flex_time with same mask
         result = flex_time(dt.time())
-        result.mask = self.mask.copy()
+        result._mask_bits = self._mask_bits
         return result
 
     def __radd__(self, other: timedelta) -> "flex_time":
@@ -602,3 +749,16 @@ class flex_time:
         """Handle reverse subtraction - explicitly return NotImplemented.
         This lets Python know we don't support subtracting a flex_time from other types."""
         return NotImplemented
+
+
+def _restore_flex_time(
+    cls: type[flex_time], packed: int, tz: Any, output_format: Optional[str] = None
+) -> flex_time:
+    """Unpickles the values reduced by `flex_time.__reduce__`."""
+    t, mask_bits = unpack_time(packed)
+    if tz is not None:
+        t = t.replace(tzinfo=tz_from_id(tz))
+    ft = cls._from_parsed(t, mask_bits)
+    if output_format is not None:
+        ft._output_format = OutputFormat(output_format)
+    return ft
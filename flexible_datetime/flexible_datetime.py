@@ -2,7 +2,8 @@ import json
 import re
 from datetime import date, datetime
 from enum import StrEnum
-from typing import Any, ClassVar, Optional
+from itertools import chain, islice
+from typing import Any, ClassVar, Iterable, Optional
 
 import arrow
 from dateutil import parser as date_parser
@@ -17,7 +18,14 @@ from pydantic import (
 
 # Need to import this module to patch arrow.Arrow
 import flexible_datetime.pydantic_arrow  # noqa: F401 # Need to import this module to patch arrow.Arrow  
-from flexible_datetime.time_utils import infer_time_format
+from flexible_datetime.formatting import CompiledFormat, compile_minimal_format
+from flexible_datetime.intervals import period_bounds
+from flexible_datetime.packing import pack_local, sort_key, tz_from_id, tz_id, unpack
+from flexible_datetime.time_utils import (
+    infer_time_format,
+    lock_datetime_format,
+    parse_datetime_str,
+)
 
 
 class OutputFormat(StrEnum):
@@ -178,6 +186,33 @@ class FlexDateTime(BaseModel):
         dt, mask = cls._components_from_str(date_str, input_fmt)
         return cls(dt=dt, mask=mask)
 
+    @classmethod
+    def parse_many(cls, values: Iterable[Any], sample: int = 100) -> list["FlexDateTime"]:
+        """
+        Creates FlexDateTime instances from many values.
+        The dominant layout among the first `sample` strings is locked and used to parse the rest,
+        values with another layout go through the regular constructor.
+        """
+        it = iter(values)
+        head = list(islice(it, sample))
+        locked = lock_datetime_format(head)
+        if locked is None:
+            return [cls(value) for value in chain(head, it)]
+
+        results = []
+        for value in chain(head, it):
+            parsed = locked.parse(value) if isinstance(value, str) else None
+            if parsed is None:
+                results.append(cls(value))
+            else:
+                dt, mask_str = parsed
+                results.append(
+                    cls.model_construct(
+                        dt=arrow.Arrow.fromdatetime(dt), mask=cls.binary_to_mask(mask_str)
+                    )
+                )
+        return results
+
     @classmethod
     def from_datetime(cls, dt: datetime) -> "FlexDateTime":
         """
@@ -206,6 +241,11 @@ class FlexDateTime(BaseModel):
         """
         Creates the components of a FlexDateTime instance from a string.
         """
+        if input_fmt is None:
+            parsed = parse_datetime_str(date_str)
+            if parsed is not None:
+                dt, mask_str = parsed
+                return arrow.Arrow.fromdatetime(dt), cls.binary_to_mask(mask_str)
 
         try:
             dt = arrow.get(date_str, input_fmt) if input_fmt else arrow.get(date_str)
@@ -327,48 +367,15 @@ class FlexDateTime(BaseModel):
         if not self.dt:
             return "Invalid datetime"
 
-        output_str = output_fmt or "YYYY-MM-DD HH:mm:ss"
-
-        # Handle each part
-        for fmt, part in FlexDateTime._dt_formats.items():
-            if part == "millisecond":
-                # Format milliseconds/microseconds correctly
-                microseconds = self.dt.microsecond
-                if "SSSSSS" in output_str:
-                    replacement = f"{microseconds:06d}"
-                elif "SSSSS" in output_str:
-                    replacement = f"{microseconds:06d}"[:5]
-                elif "SSSS" in output_str:
-                    replacement = f"{microseconds:06d}"[:4]
-                elif "SSS" in output_str:
-                    replacement = f"{microseconds:06d}"[:3]
-                elif "SS" in output_str:
-                    replacement = f"{microseconds // 1000:03d}"[:2]
-                elif "S" in output_str:
-                    replacement = f"{microseconds // 1000:03d}"[:1]
-                else:
-                    replacement = ""
-                if self.mask[part]:
-                    replacement = ""
-                output_str = re.sub(r"S{1,6}", replacement, output_str)
-            else:
-                value = getattr(self.dt, part)
-                replacement = (
-                    f"{value:02d}" if fmt in ["MM", "DD", "HH", "mm", "ss"] else str(value)
-                )
-                replacement = replacement if not self.mask[part] else ""
-                output_str = output_str.replace(fmt, replacement)
+        return self.formatter(output_fmt).format(self.dt.datetime)
 
-        # Remove unnecessary separators while preserving date and time structure
-        output_str = re.sub(r"(?<=\d)(\s|-|:)(?=\d)", r"\1", output_str)
-        output_str = re.sub(r"\s+", " ", output_str).strip()
-        output_str = re.sub(r"-+", "-", output_str)
-        output_str = re.sub(r":+", ":", output_str)
-
-        # Remove all non-digits at the beginning and end of string
-        output_str = re.sub(r"^\D+|\D+$", "", output_str)
-
-        return output_str
+    def formatter(self, output_fmt: Optional[str] = None) -> CompiledFormat:
+        """
+        Returns the compiled formatter of `to_minimal_datetime` for the mask of this instance.
+        Formatters are cached per (output_fmt, mask) and can format any datetime.
+        """
+        mask_bits = int(self.mask_to_binary(self.mask), 2)
+        return compile_minimal_format(output_fmt or "YYYY-MM-DD HH:mm:ss", mask_bits)
 
     def to_str(self, output_fmt: Optional[str] = None) -> str:
         return self.to_minimal_datetime(output_fmt)
@@ -392,6 +399,25 @@ class FlexDateTime(BaseModel):
     def to_datetime(self) -> datetime:
         return self.dt.datetime
 
+    def __reduce__(self):
+        # The packed local datetime and mask plus a compact time zone id, see `packing.tz_id`
+        dt = self.dt.datetime
+        packed = pack_local(dt, int(self.mask_to_binary(self.mask), 2))
+        args: tuple = (type(self), packed, tz_id(dt.tzinfo))
+        output_format = self._output_format
+        if output_format != self._default_output_format or dt.fold:
+            args += (output_format.value,)
+        if dt.fold:
+            args += (dt.fold,)
+        return _restore_flex_datetime, args
+
+    def as_interval(self) -> tuple[datetime, Optional[datetime]]:
+        """
+        Returns the datetimes [start, end) this value stands for, in its time zone, e.g.
+        [2023-06-01, 2023-07-01) for "2023-06", see `flex_datetime.as_interval`.
+        """
+        return period_bounds(self.dt.datetime, int(self.mask_to_binary(self.mask), 2), utc=False)
+
     def __str__(self) -> str:
         """
         Returns the string representation of the datetime, considering the mask.
@@ -407,6 +433,12 @@ class FlexDateTime(BaseModel):
     def __repr__(self) -> str:
         return self.model_dump_json()
 
+    def sort_key(self) -> int:
+        """
+        Returns an integer key ordering values of any mask, see `flex_datetime.sort_key`.
+        """
+        return sort_key(pack_local(self.dt.datetime, int(self.mask_to_binary(self.mask), 2)))
+
     def get_comparable_dt(self) -> arrow.Arrow:
         """
         Creates a comparable datetime that respects the mask.
@@ -468,3 +500,23 @@ class FlexDateTime(BaseModel):
             return NotImplemented
         self._ensure_same_mask(other)
         return self.get_comparable_dt() >= other.get_comparable_dt()
+
+
+def _restore_flex_datetime(
+    cls: type[FlexDateTime],
+    packed: int,
+    tz: Any,
+    output_format: Optional[str] = None,
+    fold: int = 0,
+) -> FlexDateTime:
+    """
+    Unpickles the values reduced by `FlexDateTime.__reduce__`.
+    """
+    *fields, mask_bits = unpack(packed)
+    value = cls.model_construct(
+        dt=arrow.Arrow(*fields, tzinfo=tz_from_id(tz), fold=fold),
+        mask=cls.binary_to_mask(format(mask_bits, "07b")),
+    )
+    if output_format is not None:
+        value._output_format = OutputFormat(output_format)
+    return value
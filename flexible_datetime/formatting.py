@@ -0,0 +1,135 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable
+
+# Output format tokens of year ... second, in replacement order. Sub-second digits are runs of S.
+_FIELD_TOKENS = ("YYYY", "MM", "DD", "HH", "mm", "ss")
+_FIELD_ATTRS = ("year", "month", "day", "hour", "minute", "second", "microsecond")
+_FIELD_SPECS = ("", ":02d", ":02d", ":02d", ":02d", ":02d", ":06d")
+
+# Stand-ins for the field values while compiling. They are matched by \d like real digits, so the
+# separator cleanup treats them the same way, but they cannot be mistaken for digits of the format.
+_PLACEHOLDERS = "٠١٢٣٤٥٦"  # Arabic-Indic digits zero to six
+
+
+class CompiledFormat:
+    """
+    An output format compiled for one mask into a str.format template.
+
+    The template takes the datetime attributes in `attrs`, in that order. Fractions shorter than
+    microseconds are cut from the zero padded microseconds, which are then passed last.
+    """
+
+    __slots__ = ("template", "attrs", "truncated_fraction", "_getter")
+
+    def __init__(self, template: str, attrs: tuple[str, ...], truncated_fraction: bool = False):
+        self.template = template
+        self.attrs = attrs
+        self.truncated_fraction = truncated_fraction
+        self._getter = _tuple_getter(attrs)
+
+    def format(self, dt: datetime) -> str:
+        if self.truncated_fraction:
+            return self.template.format(*self._getter(dt), f"{dt.microsecond:06d}")
+        return self.template.format(*self._getter(dt))
+
+    def __repr__(self) -> str:
+        return f"CompiledFormat({self.template!r})"
+
+
+def _substitute_fields(output_fmt: str, mask_bits: int) -> tuple[str, int]:
+    """
+    Replaces the format tokens with the placeholders of the unmasked fields.
+    Returns the string and the number of sub-second digits.
+    """
+
+    output_str = output_fmt
+    for i, token in enumerate(_FIELD_TOKENS):
+        # Mask bits follow the binary mask strings, year is bit 6 and millisecond bit 0
+        masked = mask_bits & 1 << (6 - i)
+        output_str = output_str.replace(token, "" if masked else _PLACEHOLDERS[i])
+
+    # Every run of S is replaced by the same digits, their number is set by the longest run
+    digits = next((n for n in range(6, 0, -1) if "S" * n in output_str), 0)
+    replacement = "" if mask_bits & 1 or not digits else _PLACEHOLDERS[6]
+    output_str = re.sub(r"S{1,6}", replacement, output_str)
+    return output_str, digits
+
+
+def _tuple_getter(attrs: tuple[str, ...]) -> Callable[[Any], tuple]:
+    if not attrs:
+        return lambda obj: ()
+    if len(attrs) == 1:
+        getter = attrgetter(attrs[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*attrs)
+
+
+def _to_compiled(output_str: str, digits: int) -> CompiledFormat:
+    truncated_fraction = 0 < digits < 6 and _PLACEHOLDERS[6] in output_str
+    attrs = []
+    for char in output_str:
+        i = _PLACEHOLDERS.find(char)
+        if i >= 0 and _FIELD_ATTRS[i] not in attrs and not (i == 6 and truncated_fraction):
+            attrs.append(_FIELD_ATTRS[i])
+
+    parts = []
+    for char in output_str:
+        i = _PLACEHOLDERS.find(char)
+        if i == 6 and truncated_fraction:
+            parts.append(f"{{{len(attrs)}:.{digits}}}")
+        elif i >= 0:
+            parts.append(f"{{{attrs.index(_FIELD_ATTRS[i])}{_FIELD_SPECS[i]}}}")
+        else:
+            parts.append(char.replace("{", "{{").replace("}", "}}"))
+    return CompiledFormat("".join(parts), tuple(attrs), truncated_fraction)
+
+
+def _compile(output_fmt: str, mask_bits: int, cleanup: Callable[[str], str]) -> CompiledFormat:
+    output_str, digits = _substitute_fields(output_fmt, mask_bits)
+    return _to_compiled(cleanup(output_str), digits)
+
+
+def _short_cleanup(output_str: str) -> str:
+    # Remove unnecessary separators while preserving date and time structure
+    output_str = re.sub(r"\s+", " ", output_str).strip()
+    output_str = re.sub(r"-+", "-", output_str)
+    output_str = re.sub(r":+", ":", output_str)
+
+    # Remove all non-digits at the beginning and end of string, except for '+' or '-' for timezone
+    output_str = re.sub(r"^[^\d+-]+|[^\d+-]+$", "", output_str)
+
+    # Remove trailing dot if no microseconds
+    output_str = re.sub(r"\.$", "", output_str)
+
+    # Remove trailing colon or dash
+    return re.sub(r"[-:]\s*$", "", output_str)
+
+
+def _minimal_cleanup(output_str: str) -> str:
+    # Remove unnecessary separators while preserving date and time structure
+    output_str = re.sub(r"\s+", " ", output_str).strip()
+    output_str = re.sub(r"-+", "-", output_str)
+    output_str = re.sub(r":+", ":", output_str)
+
+    # Remove all non-digits at the beginning and end of string
+    return re.sub(r"^\D+|\D+$", "", output_str)
+
+
+@lru_cache(maxsize=1024)
+def compile_short_format(output_fmt: str, mask_bits: int) -> CompiledFormat:
+    """
+    Compiles an output format of `flex_datetime.to_short_datetime` for the given mask bits.
+    Masked fields and the separators left around them are removed once, at compile time.
+    """
+    return _compile(output_fmt, mask_bits, _short_cleanup)
+
+
+@lru_cache(maxsize=1024)
+def compile_minimal_format(output_fmt: str, mask_bits: int) -> CompiledFormat:
+    """
+    Compiles an output format of `FlexDateTime.to_minimal_datetime` for the given mask bits.
+    """
+    return _compile(output_fmt, mask_bits, _minimal_cleanup)
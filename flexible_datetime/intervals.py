@@ -0,0 +1,152 @@
+import sys
+from datetime import datetime, timedelta, timezone
+from heapq import heappop, heappush
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from flexible_datetime.packing import datetime_to_micros
+
+P = TypeVar("P")
+Q = TypeVar("Q")
+
+
+def _next_month(dt: datetime) -> datetime:
+    return dt.replace(year=dt.year + dt.month // 12, month=dt.month % 12 + 1)
+
+
+# (field, mask bit, start of the next period) for year ... second, the fields flex_datetime compares
+_PERIOD_FIELDS = (
+    ("year", 1 << 6, lambda dt: dt.replace(year=dt.year + 1)),
+    ("month", 1 << 5, _next_month),
+    ("day", 1 << 4, lambda dt: dt + timedelta(days=1)),
+    ("hour", 1 << 3, lambda dt: dt + timedelta(hours=1)),
+    ("minute", 1 << 2, lambda dt: dt + timedelta(minutes=1)),
+    ("second", 1 << 1, lambda dt: dt + timedelta(seconds=1)),
+)
+
+MIN_DATE = datetime(1, 1, 1, tzinfo=timezone.utc)
+
+
+def period_bounds(
+    dt: datetime, mask_bits: int, *, utc: bool = True
+) -> tuple[datetime, Optional[datetime]]:
+    """
+    Returns the UTC instants [start, end) of the datetimes comparing equal to `dt` under the mask,
+    e.g. [2023-06-01, 2023-07-01) for June 2023. The end is None if the period runs past the last
+    representable date. With `utc=False` the period is taken in the time zone of `dt` instead.
+
+    Only masks of trailing fields form a single period. Others, e.g. a day of the month without a
+    year, raise a ValueError.
+    """
+    if utc:
+        dt = dt.astimezone(timezone.utc)
+    start = MIN_DATE.replace(tzinfo=dt.tzinfo)
+    next_start = None
+    for i, (field, bit, next_period) in enumerate(_PERIOD_FIELDS):
+        if mask_bits & bit:
+            # The remaining fields must be masked too, or the values do not form a single range
+            if any(not mask_bits & lower_bit for _, lower_bit, _ in _PERIOD_FIELDS[i + 1 :]):
+                raise ValueError(f"Mask {mask_bits:07b} cannot be expressed as a date range")
+            break
+        start = start.replace(**{field: getattr(dt, field)})
+        next_start = next_period
+    if next_start is None:
+        return start, None
+    try:
+        return start, next_start(start)
+    except (ValueError, OverflowError):
+        return start, None
+
+
+def range_bounds(
+    *,
+    gt: Any = None,
+    gte: Any = None,
+    lt: Any = None,
+    lte: Any = None,
+    eq: Any = None,
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Combines mask-aware comparisons with flex_datetime bounds into one range [lower, upper), None
+    meaning unbounded. Each bound is compared at its own precision, see `period_bounds`:
+    `lt=flex_datetime("2023-06")` gives the upper bound 2023-06-01 and `lte=flex_datetime("2023-06")`
+    the upper bound 2023-07-01.
+
+    Like the flex_datetime operators, the bounds are the local fields of the values, regardless of
+    their offsets. They are returned as datetimes with these fields in UTC, to be compared with
+    stored local fields, e.g. `packing.local_micros`.
+    """
+    lower: Optional[datetime] = None
+    upper: Optional[datetime] = None
+    for op, value in (("gt", gt), ("gte", gte), ("lt", lt), ("lte", lte), ("eq", eq)):
+        if value is None:
+            continue
+        start, end = period_bounds(value.to_datetime(), value.mask_bits, utc=False)
+        start = start.replace(tzinfo=timezone.utc)
+        end = end and end.replace(tzinfo=timezone.utc)
+        if op in ("gte", "eq"):
+            lower = start if lower is None else max(lower, start)
+        if op == "gt" and end is None:
+            # Nothing compares greater than a period without an end
+            upper = MIN_DATE
+        elif op == "gt":
+            lower = end if lower is None else max(lower, end)
+        if op == "lt":
+            upper = start if upper is None else min(upper, start)
+        if op in ("lte", "eq") and end is not None:
+            upper = end if upper is None else min(upper, end)
+    return lower, upper
+
+
+def _sorted_positions(keys: list[int]) -> list[int]:
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def interval_join(
+    points: Iterable[P],
+    periods: Iterable[Q],
+    *,
+    point_key: Optional[Callable[[P], Any]] = None,
+    period_key: Optional[Callable[[Q], Any]] = None,
+) -> Iterator[tuple[P, Q]]:
+    """
+    Sort-merge join of points in time with the partial dates whose periods contain them:
+
+        for event, month in interval_join(events, months, point_key=lambda e: e.created):
+            ...
+
+    Points are datetimes or values with `to_datetime()`, e.g. flex_datetime, compared as instants
+    with their masks ignored. Naive datetimes are taken as UTC. Periods are values with
+    `as_interval()`, i.e. flex_datetime or FlexDateTime. `point_key` and `period_key` pick these
+    values out of records.
+
+    Pairs are yielded in order of the points, and for each point in order of the period starts.
+    Sorting both sides and sweeping over them takes O((n + m) log(n + m) + k) for k pairs, instead
+    of the O(n * m) of comparing every point with every period.
+    """
+    point_items = list(points)
+    point_times = []
+    for item in point_items:
+        value = item if point_key is None else point_key(item)
+        dt = value if isinstance(value, datetime) else value.to_datetime()
+        point_times.append(datetime_to_micros(dt))
+
+    period_items = list(periods)
+    starts = []
+    ends = []
+    for item in period_items:
+        start, end = (item if period_key is None else period_key(item)).as_interval()
+        starts.append(datetime_to_micros(start))
+        ends.append(sys.maxsize if end is None else datetime_to_micros(end))
+
+    by_start = _sorted_positions(starts)
+    active: list[tuple[int, int]] = []  # (end, rank in by_start) of the periods started so far
+    next_period = 0
+    for i in _sorted_positions(point_times):
+        t = point_times[i]
+        while next_period < len(by_start) and starts[by_start[next_period]] <= t:
+            heappush(active, (ends[by_start[next_period]], next_period))
+            next_period += 1
+        while active and active[0][0] <= t:
+            heappop(active)
+        for rank in sorted(rank for _, rank in active):
+            yield point_items[i], period_items[by_start[rank]]
@@ -0,0 +1,80 @@
+from typing import Any, Iterable, Iterator, Mapping, MutableMapping
+
+
+def mask_bit_values(fields: Iterable[str]) -> dict[str, int]:
+    """
+    Returns the bit of each mask field, the first field being the most significant bit.
+    This matches the binary mask strings, e.g. "0011111" is 0b0011111.
+    """
+    fields = list(fields)
+    return {field: 1 << (len(fields) - 1 - i) for i, field in enumerate(fields)}
+
+
+class MaskView(MutableMapping[str, bool]):
+    """
+    Dict-like view of the mask bits of a flex_datetime or flex_time.
+
+    Reads and writes go straight to the integer bitmask of the owner, so code written against the
+    former mask dicts, e.g. `ft.mask["hour"] = True` or `ft.mask.update(hour=True)`, keeps working.
+    Mask fields cannot be added or removed.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: Any):
+        self._owner = owner
+
+    @property
+    def bits(self) -> int:
+        return self._owner._mask_bits
+
+    def __getitem__(self, field: str) -> bool:
+        return bool(self._owner._mask_bits & self._owner._mask_bit_values[field])
+
+    def __setitem__(self, field: str, masked: bool) -> None:
+        bit = self._owner._mask_bit_values[field]
+        if masked:
+            self._owner._mask_bits |= bit
+        else:
+            self._owner._mask_bits &= ~bit
+
+    def __delitem__(self, field: str) -> None:
+        raise TypeError("Mask fields cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owner._mask_bit_values)
+
+    def __len__(self) -> int:
+        return len(self._owner._mask_bit_values)
+
+    def __contains__(self, field: object) -> bool:
+        return field in self._owner._mask_bit_values
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MaskView):
+            return (
+                self._owner._mask_bit_values == other._owner._mask_bit_values
+                and self.bits == other.bits
+            )
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def copy(self) -> dict[str, bool]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+def mask_to_bits(mask: Mapping[str, bool], bit_values: Mapping[str, int]) -> int:
+    """
+    Converts a mask mapping to its integer bitmask. Missing fields are unmasked, unknown ones ignored.
+    """
+    if isinstance(mask, MaskView) and mask._owner._mask_bit_values == bit_values:
+        return mask.bits
+    bits = 0
+    for field, bit in bit_values.items():
+        if mask.get(field, False):
+            bits |= bit
+    return bits
@@ -0,0 +1,50 @@
+from typing import Any
+
+import msgpack
+
+from flexible_datetime.flex_datetime import flex_datetime
+from flexible_datetime.flex_time import flex_time
+
+# msgpack extension type codes, the payloads are the `to_bytes` encodings
+FLEX_DATETIME_EXT_TYPE = 70
+FLEX_TIME_EXT_TYPE = 71
+
+
+def default(obj: Any) -> Any:
+    """
+    msgpack `default` hook encoding flex_datetime and flex_time values as extension types:
+
+        msgpack.packb(payload, default=default)
+    """
+    if isinstance(obj, flex_datetime):
+        return msgpack.ExtType(FLEX_DATETIME_EXT_TYPE, obj.to_bytes())
+    if isinstance(obj, flex_time):
+        return msgpack.ExtType(FLEX_TIME_EXT_TYPE, obj.to_bytes())
+    raise TypeError(f"Cannot serialize {type(obj).__name__} with msgpack")
+
+
+def ext_hook(code: int, data: bytes) -> Any:
+    """
+    msgpack `ext_hook` decoding the extension types written by `default`:
+
+        msgpack.unpackb(packed, ext_hook=ext_hook)
+    """
+    if code == FLEX_DATETIME_EXT_TYPE:
+        return flex_datetime.from_bytes(data)
+    if code == FLEX_TIME_EXT_TYPE:
+        return flex_time.from_bytes(data)
+    return msgpack.ExtType(code, data)
+
+
+def packb(obj: Any, **kwargs: Any) -> bytes:
+    """
+    msgpack.packb with flex_datetime and flex_time support.
+    """
+    return msgpack.packb(obj, default=default, **kwargs)
+
+
+def unpackb(packed: bytes, **kwargs: Any) -> Any:
+    """
+    msgpack.unpackb with flex_datetime and flex_time support.
+    """
+    return msgpack.unpackb(packed, ext_hook=ext_hook, **kwargs)
@@ -0,0 +1,341 @@
+import struct
+from datetime import datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+from dateutil import tz as dateutil_tz
+
+# Packed integer layout of a masked datetime, from the most significant bits:
+#
+#   year (14) | month (4) | day (5) | hour (5) | minute (6) | second (6) | microsecond (20) | mask (7)
+#
+# Mask bits follow the binary mask strings: "0011111" is 0b0011111, so year is the most significant
+# mask bit and millisecond the least significant one. Years 1-9999 with microseconds need 67 bits,
+# packed values are therefore plain Python ints rather than int64.
+
+MASK_WIDTH = 7
+ALL_MASK_BITS = (1 << MASK_WIDTH) - 1
+
+_MICROSECOND_SHIFT = 7
+_SECOND_SHIFT = 27
+_MINUTE_SHIFT = 33
+_HOUR_SHIFT = 39
+_DAY_SHIFT = 44
+_MONTH_SHIFT = 49
+_YEAR_SHIFT = 53
+
+# (shift, width, mask bit, value used by get_comparable_dt when masked) for year ... second
+_KEY_FIELDS = (
+    (_YEAR_SHIFT, 14, 6, 1),
+    (_MONTH_SHIFT, 4, 5, 1),
+    (_DAY_SHIFT, 5, 4, 1),
+    (_HOUR_SHIFT, 5, 3, 0),
+    (_MINUTE_SHIFT, 6, 2, 0),
+    (_SECOND_SHIFT, 6, 1, 0),
+)
+
+
+# (field, shift, mask bit, value when masked) of the comparison key in whole seconds, i.e.
+# `comparison_key(packed) >> SECONDS_KEY_SHIFT`, for building keys from the local fields directly
+SECONDS_KEY_SHIFT = _SECOND_SHIFT
+SECONDS_KEY_FIELDS = tuple(
+    (field, shift - _SECOND_SHIFT, mask_bit, masked_value)
+    for field, (shift, _, mask_bit, masked_value) in zip(
+        ("year", "month", "day", "hour", "minute", "second"), _KEY_FIELDS
+    )
+)
+
+
+def _build_key_tables() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    keep = []
+    fill = []
+    for bits in range(ALL_MASK_BITS + 1):
+        keep_bits = 0
+        fill_bits = 0
+        for shift, width, mask_bit, masked_value in _KEY_FIELDS:
+            if bits & (1 << mask_bit):
+                fill_bits |= masked_value << shift
+            else:
+                keep_bits |= ((1 << width) - 1) << shift
+        keep.append(keep_bits)
+        fill.append(fill_bits)
+    return tuple(keep), tuple(fill)
+
+
+# Per mask: the field bits kept by the comparison key, and the values masked fields are replaced with
+_KEY_KEEP, _KEY_FILL = _build_key_tables()
+
+# Per mask: the bits kept by the sort key, which adds the microseconds unless milliseconds are
+# masked, and the complement of the mask bits, which orders coarser masks first
+_MICROSECOND_BITS = 0xFFFFF << _MICROSECOND_SHIFT
+_SORT_KEEP = tuple(
+    keep | (0 if bits & 1 else _MICROSECOND_BITS) for bits, keep in enumerate(_KEY_KEEP)
+)
+_SORT_FILL = tuple(fill | (ALL_MASK_BITS ^ bits) for bits, fill in enumerate(_KEY_FILL))
+
+
+def pack(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    microsecond: int,
+    mask_bits: int,
+) -> int:
+    """
+    Packs datetime fields and mask bits into a single integer.
+    """
+    return (
+        year << _YEAR_SHIFT
+        | month << _MONTH_SHIFT
+        | day << _DAY_SHIFT
+        | hour << _HOUR_SHIFT
+        | minute << _MINUTE_SHIFT
+        | second << _SECOND_SHIFT
+        | microsecond << _MICROSECOND_SHIFT
+        | mask_bits
+    )
+
+
+def pack_datetime(dt: datetime, mask_bits: int) -> int:
+    """
+    Packs a datetime and mask bits into a single integer. Aware datetimes are converted to UTC first,
+    which can change the fields the mask keeps, so flex values are packed with `pack_local`.
+    """
+    if dt.tzinfo is not None and dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    return pack(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond, mask_bits)
+
+
+def pack_local(dt: datetime, mask_bits: int) -> int:
+    """
+    Packs the wall-clock fields of a datetime and mask bits into a single integer. Unlike
+    `pack_datetime`, aware datetimes are not converted to UTC, so the time zone is kept separately.
+    """
+    return pack(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond, mask_bits)
+
+
+def unpack(packed: int) -> tuple[int, int, int, int, int, int, int, int]:
+    """
+    Returns the (year, month, day, hour, minute, second, microsecond, mask_bits) of a packed integer.
+    """
+    return (
+        packed >> _YEAR_SHIFT,
+        packed >> _MONTH_SHIFT & 0xF,
+        packed >> _DAY_SHIFT & 0x1F,
+        packed >> _HOUR_SHIFT & 0x1F,
+        packed >> _MINUTE_SHIFT & 0x3F,
+        packed >> _SECOND_SHIFT & 0x3F,
+        packed >> _MICROSECOND_SHIFT & 0xFFFFF,
+        packed & ALL_MASK_BITS,
+    )
+
+
+def unpack_datetime(packed: int, tz: Optional[tzinfo] = timezone.utc) -> tuple[datetime, int]:
+    """
+    Returns the datetime, with the fields taken in `tz`, and the mask bits of a packed integer.
+    """
+    *fields, mask_bits = unpack(packed)
+    return datetime(*fields, tzinfo=tz), mask_bits
+
+
+def comparison_key(packed: int) -> int:
+    """
+    Returns the masked comparison key of a packed integer.
+
+    Keys compare the same way as `flex_datetime.get_comparable_dt`: masked year, month and day count
+    as 1, masked hour, minute and second as 0, and sub-second precision is ignored.
+    """
+    bits = packed & ALL_MASK_BITS
+    return packed & _KEY_KEEP[bits] | _KEY_FILL[bits]
+
+
+def sort_key(packed: int) -> int:
+    """
+    Returns an integer key giving a total order over packed integers of any mask.
+
+    Values are ordered by their comparison key, i.e. the start of their period, then by their
+    microseconds where milliseconds are not masked, then coarser masks first:
+
+        2023 < 2023-01 < 2023-01-01 < 2023-01-01T00:00 < 2023-01-01T00:00:00.5 < 2023-01-01T00:01
+
+    Values comparing lower with the flex_datetime operators also have lower sort keys.
+    """
+    bits = packed & ALL_MASK_BITS
+    return packed & _SORT_KEEP[bits] | _SORT_FILL[bits]
+
+
+def comparison_key_range(packed: int) -> tuple[int, int]:
+    """
+    Returns the smallest and largest comparison keys of the period of a packed integer, e.g. all of
+    June 2023 for a value masked to the month, so keys can be searched with bisect. The range also
+    holds the sort keys of the period.
+
+    Only masks of trailing fields form a single period. Others, e.g. a day of the month without a
+    year, raise a ValueError.
+    """
+    bits = packed & ALL_MASK_BITS
+    low = packed & _KEY_KEEP[bits]
+    high = low | ((1 << _SECOND_SHIFT) - 1)
+    masked = False
+    for shift, width, mask_bit, _ in _KEY_FIELDS:
+        if bits & (1 << mask_bit):
+            masked = True
+            high |= ((1 << width) - 1) << shift
+        elif masked:
+            raise ValueError(f"Mask {bits:07b} cannot be expressed as a date range")
+    return low, high
+
+
+# Fixed-width binary encodings, for wire formats:
+#
+#   datetime: local epoch microseconds (signed 64-bit) | UTC offset in seconds (signed 32-bit) | mask
+#   time:     microseconds since midnight (unsigned 40-bit) | mask
+#
+# Integers are big-endian and masks take 1 byte. Local epoch microseconds count from 1970-01-01 to
+# the wall-clock fields, the ones flex_datetime compares, so the offset is needed for the instant.
+
+DATETIME_BYTES = 13
+TIME_BYTES = 6
+
+_DATETIME_STRUCT = struct.Struct(">qiB")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_micros(dt: datetime) -> int:
+    """
+    Returns the microseconds since 1970-01-01 UTC. Naive datetimes are taken as UTC.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def micros_to_datetime(micros: int) -> datetime:
+    """
+    Returns the UTC datetime of microseconds since 1970-01-01 UTC.
+    """
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def local_micros(dt: datetime) -> int:
+    """
+    Returns the microseconds from 1970-01-01 to the wall-clock fields of a datetime, i.e. the epoch
+    microseconds of its local time taken as UTC.
+    """
+    return datetime_to_micros(dt.replace(tzinfo=None))
+
+
+def utc_offset_seconds(dt: datetime) -> int:
+    """
+    Returns the UTC offset of a datetime in seconds, 0 for naive datetimes.
+    """
+    offset = dt.utcoffset()
+    return 0 if offset is None else offset // timedelta(seconds=1)
+
+
+def datetime_to_bytes(dt: datetime, mask_bits: int) -> bytes:
+    """
+    Encodes a datetime and mask bits in 13 bytes. The time zone is kept as its UTC offset, naive
+    datetimes are taken as UTC.
+    """
+    return _DATETIME_STRUCT.pack(local_micros(dt), utc_offset_seconds(dt), mask_bits)
+
+
+def datetime_from_bytes(data: bytes) -> tuple[datetime, int]:
+    """
+    Returns the datetime, at its UTC offset, and the mask bits encoded by `datetime_to_bytes`.
+    """
+    if len(data) != DATETIME_BYTES:
+        raise ValueError(f"Expected {DATETIME_BYTES} bytes, got {len(data)}")
+    micros, offset, mask_bits = _DATETIME_STRUCT.unpack(data)
+    return micros_to_datetime(micros).replace(tzinfo=tz_from_id(offset)), mask_bits
+
+
+def pack_time(t: time, mask_bits: int) -> int:
+    """
+    Packs a time of day and mask bits into one integer: microseconds since midnight << 8 | mask.
+    The tzinfo is not kept.
+    """
+    micros = ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+    return micros << 8 | mask_bits
+
+
+def unpack_time(packed: int) -> tuple[time, int]:
+    """
+    Returns the time and the mask bits of an integer packed by `pack_time`.
+    """
+    seconds, microsecond = divmod(packed >> 8, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return time(hour, minute, second, microsecond), packed & 0xFF
+
+
+def time_to_bytes(t: time, mask_bits: int) -> bytes:
+    """
+    Encodes a time of day and mask bits in 6 bytes. The tzinfo is not kept.
+    """
+    return pack_time(t, mask_bits).to_bytes(TIME_BYTES, "big")
+
+
+def time_from_bytes(data: bytes) -> tuple[time, int]:
+    """
+    Returns the time and the mask bits encoded by `time_to_bytes`.
+    """
+    if len(data) != TIME_BYTES:
+        raise ValueError(f"Expected {TIME_BYTES} bytes, got {len(data)}")
+    return unpack_time(int.from_bytes(data, "big"))
+
+
+# Compact time zone identifiers, used by the pickle support of the flex types:
+#
+#   None               naive
+#   int                fixed UTC offset in seconds, 0 for UTC
+#   str                IANA key of a ZoneInfo
+#   tzinfo             any other time zone, pickled as is
+#
+# Offsets and keys are small values that pickle memoizes or inlines, so a list of values in one zone
+# does not repeat the time zone object.
+
+
+def tz_id(tz: Optional[tzinfo]) -> Any:
+    """
+    Returns the compact identifier of a time zone, see above.
+    """
+    if tz is None:
+        return None
+    if tz is timezone.utc:
+        return 0
+    if isinstance(tz, dateutil_tz.tzutc):
+        return 0
+    if type(tz) is timezone or isinstance(tz, dateutil_tz.tzoffset):
+        offset = tz.utcoffset(None)
+        # Named fixed offsets, e.g. timezone(timedelta(hours=-5), "EST"), keep their object
+        default_name = timezone(offset).tzname(None) if type(tz) is timezone else None
+        if tz.tzname(None) != default_name:
+            return tz
+        return offset // timedelta(seconds=1)
+    if isinstance(tz, ZoneInfo) and tz.key is not None:
+        return tz.key
+    return tz
+
+
+@lru_cache(maxsize=256)
+def _fixed_offset(seconds: int) -> timezone:
+    return timezone.utc if seconds == 0 else timezone(timedelta(seconds=seconds))
+
+
+def tz_from_id(identifier: Any) -> Optional[tzinfo]:
+    """
+    Returns the time zone of an identifier returned by `tz_id`. Fixed offsets are returned as
+    `datetime.timezone` instances.
+    """
+    if identifier is None or isinstance(identifier, tzinfo):
+        return identifier
+    if isinstance(identifier, int):
+        return _fixed_offset(identifier)
+    return ZoneInfo(identifier)
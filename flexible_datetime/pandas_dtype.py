@@ -0,0 +1,253 @@
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+
+from flexible_datetime.flex_array import FlexDateTimeArray
+from flexible_datetime.flex_datetime import flex_datetime
+
+# Factorize key of missing values, comparison keys are never negative
+_NA_KEY = -1
+
+
+@register_extension_dtype
+class FlexDateTimeDtype(ExtensionDtype):
+    """
+    pandas dtype of flex_datetime columns, registered as "flexdatetime":
+
+        df["created"] = df["created"].astype("flexdatetime")
+    """
+
+    name = "flexdatetime"
+    type = flex_datetime
+    kind = "O"
+    na_value = pd.NaT
+
+    @classmethod
+    def construct_array_type(cls) -> "type[FlexDateTimeExtensionArray]":
+        return FlexDateTimeExtensionArray
+
+    def __from_arrow__(self, array) -> "FlexDateTimeExtensionArray":
+        from flexible_datetime.pyarrow_type import from_arrow
+
+        return FlexDateTimeExtensionArray(from_arrow(array))
+
+
+class FlexDateTimeExtensionArray(ExtensionArray):
+    """
+    pandas extension array of flex_datetime values, stored as a `FlexDateTimeArray` of UTC
+    datetime64[us] values, uint8 mask bits and int32 UTC offsets. Missing values are NaT.
+
+    Sorting uses the mask-aware comparison keys of `FlexDateTimeArray`. Grouping, unique and
+    value_counts treat values as equal when their masks and comparison keys are equal, e.g.
+    "2023-06-29T10:00" and "2023-06-29T12:00" both masked to the day are one group.
+    """
+
+    def __init__(self, data: FlexDateTimeArray):
+        self._data = data
+
+    @property
+    def dtype(self) -> FlexDateTimeDtype:
+        return FlexDateTimeDtype()
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy: bool = False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        if isinstance(scalars, FlexDateTimeArray):
+            return cls(scalars)
+        values = np.asarray(scalars, dtype=object)
+        na = pd.isna(values)
+        parsed = FlexDateTimeArray.from_flex(flex_datetime.parse_many(values[~na].tolist()))
+        if not na.any():
+            return cls(parsed)
+        dt = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[us]")
+        mask = np.zeros(len(values), dtype=np.uint8)
+        offset = np.zeros(len(values), dtype=np.int32)
+        dt[~na] = parsed.dt
+        mask[~na] = parsed.mask
+        offset[~na] = parsed.offset
+        return cls(FlexDateTimeArray(dt, mask, offset))
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype, copy: bool = False):
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values: np.ndarray, original: "FlexDateTimeExtensionArray"):
+        # Uniques are represented by the first value with their key
+        keys, _ = original._values_for_factorize()
+        first = _first_positions(keys)
+        return original.take(first[pd.Index(keys[first]).get_indexer(values)])
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["FlexDateTimeExtensionArray"]):
+        return cls(FlexDateTimeArray.concat(array._data for array in to_concat))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, (int, np.integer)):
+            if np.isnat(self._data.dt[item]):
+                return self.dtype.na_value
+            return self._data[item]
+        if isinstance(item, tuple) and len(item) == 1:
+            item = item[0]
+        item = check_array_indexer(self, item)
+        return type(self)(self._data[item])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+        if pd.api.types.is_scalar(value) or isinstance(value, flex_datetime):
+            value = [value]
+        values = self._from_sequence(value)._data
+        dt, mask, offset = values.dt, values.mask, values.offset
+        if isinstance(key, (int, np.integer)):
+            # numpy does not assign a length 1 datetime64 array to a single position
+            dt, mask, offset = dt[0], mask[0], offset[0]
+        self._data.dt[key] = dt
+        self._data.mask[key] = mask
+        self._data.offset[key] = offset
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is not None and np.dtype(dtype).kind == "M":
+            return self._data.dt.astype(dtype)
+        values = np.empty(len(self), dtype=object)
+        values[:] = list(self)
+        return values
+
+    def astype(self, dtype, copy: bool = True):
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, FlexDateTimeDtype):
+            return self.copy() if copy else self
+        if isinstance(dtype, np.dtype) and dtype.kind == "M":
+            return self._data.dt.astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+    def __arrow_array__(self, type=None):
+        from flexible_datetime.pyarrow_type import to_arrow
+
+        return to_arrow(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.dt.nbytes + self._data.mask.nbytes + self._data.offset.nbytes
+
+    def isna(self) -> np.ndarray:
+        return np.isnat(self._data.dt)
+
+    def copy(self) -> "FlexDateTimeExtensionArray":
+        data = self._data
+        return type(self)(FlexDateTimeArray(data.dt.copy(), data.mask, data.offset))
+
+    def take(self, indices, *, allow_fill: bool = False, fill_value: Any = None):
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill = self._from_sequence([fill_value])._data
+            fill_dt, fill_mask, fill_offset = fill.dt[0], fill.mask[0], fill.offset[0]
+        else:
+            fill_dt, fill_mask, fill_offset = np.datetime64("NaT", "us"), 0, 0
+        dt = take(self._data.dt, indices, allow_fill=allow_fill, fill_value=fill_dt)
+        mask = take(self._data.mask, indices, allow_fill=allow_fill, fill_value=fill_mask)
+        offset = take(self._data.offset, indices, allow_fill=allow_fill, fill_value=fill_offset)
+        return type(self)(FlexDateTimeArray(dt, mask, offset))
+
+    def _values_for_argsort(self) -> np.ndarray:
+        # Missing values are placed by pandas itself, their keys are ignored
+        return self._data.comparison_keys()
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, int]:
+        # Values are equal when both their comparison keys and masks are equal. Keys use 40 bits.
+        keys = self._data.comparison_keys() << 7 | self._data.mask
+        keys[self.isna()] = _NA_KEY
+        return keys, _NA_KEY
+
+    def unique(self) -> "FlexDateTimeExtensionArray":
+        keys, _ = self._values_for_factorize()
+        return self.take(_first_positions(keys))
+
+    def value_counts(self, dropna: bool = True) -> pd.Series:
+        codes, uniques = self.factorize(use_na_sentinel=dropna)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        return pd.Series(counts, index=pd.Index(uniques), name="count")
+
+    def isin(self, values) -> np.ndarray:
+        keys, _ = self._values_for_factorize()
+        other, _ = self._from_sequence(values)._values_for_factorize()
+        return np.isin(keys, other)
+
+    def _coerce(self, other: Any) -> "flex_datetime | FlexDateTimeExtensionArray":
+        if isinstance(other, (pd.Series, pd.Index)):
+            other = other.array
+        if isinstance(other, (FlexDateTimeExtensionArray, flex_datetime)):
+            return other
+        if pd.api.types.is_list_like(other):
+            return self._from_sequence(other)
+        return flex_datetime.validate(other)
+
+    def _cmp(self, other: Any, op: str) -> np.ndarray:
+        other = self._coerce(other)
+        na = self.isna()
+        if isinstance(other, FlexDateTimeExtensionArray):
+            na = na | other.isna()
+            other = other._data[~na]
+        result = np.zeros(len(self), dtype=bool)
+        result[~na] = getattr(self._data[~na], op)(other)
+        return result
+
+    def __eq__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        # Values with different masks are not equal, instead of raising as flex_datetime does
+        other = self._coerce(other)
+        if isinstance(other, flex_datetime):
+            same_mask = self._data.mask == other.mask_bits
+            result = np.zeros(len(self), dtype=bool)
+            result[same_mask] = self[same_mask]._cmp(other, "__eq__")
+        else:
+            same_mask = self._data.mask == other._data.mask
+            result = np.zeros(len(self), dtype=bool)
+            result[same_mask] = self[same_mask]._cmp(other[same_mask], "__eq__")
+        return result
+
+    def __ne__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return ~(self == other)
+
+    def __lt__(self, other: Any) -> np.ndarray:
+        return self._cmp(other, "__lt__")
+
+    def __le__(self, other: Any) -> np.ndarray:
+        return self._cmp(other, "__le__")
+
+    def __gt__(self, other: Any) -> np.ndarray:
+        return self._cmp(other, "__gt__")
+
+    def __ge__(self, other: Any) -> np.ndarray:
+        return self._cmp(other, "__ge__")
+
+    def _reduce(self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs):
+        if name not in ("min", "max"):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        na = self.isna()
+        if na.all() or (na.any() and not skipna):
+            result = self.dtype.na_value
+        else:
+            result = getattr(self._data[~na], name)()
+        return type(self)._from_sequence([result]) if keepdims else result
+
+
+def _first_positions(keys: np.ndarray) -> np.ndarray:
+    """
+    Returns the position of the first occurrence of each distinct key, in order of appearance.
+    """
+    _, first = np.unique(keys, return_index=True)
+    return np.sort(first)
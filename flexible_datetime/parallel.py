@@ -0,0 +1,124 @@
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from os import PathLike, cpu_count
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from flexible_datetime.flex_datetime import flex_datetime
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# A parsed chunk: epoch microseconds, UTC offsets in seconds and mask bits, one entry per value
+ParsedChunk = tuple[array, array, array]
+
+
+def _parse_chunk(values: list[str]) -> ParsedChunk:
+    """
+    Parses a chunk of date strings in a worker process.
+    Results are returned as flat integer arrays, which pickle far smaller than arrow.Arrow objects.
+    """
+    micros = array("q")
+    offsets = array("i")
+    masks = array("B")
+    for ft in flex_datetime.parse_many(values):
+        dt = ft.to_datetime()
+        offset = dt.utcoffset() or timedelta(0)
+        micros.append((dt - _EPOCH) // timedelta(microseconds=1))
+        offsets.append(int(offset.total_seconds()))
+        masks.append(ft.mask_bits)
+    return micros, offsets, masks
+
+
+def _decode_chunk(chunk: ParsedChunk, cls: type[flex_datetime]) -> Iterator[flex_datetime]:
+    tzinfos: dict[int, timezone] = {0: timezone.utc}
+    for us, offset, bits in zip(*chunk):
+        tz = tzinfos.get(offset)
+        if tz is None:
+            tz = tzinfos[offset] = timezone(timedelta(seconds=offset))
+        dt = (_EPOCH + timedelta(microseconds=us)).astimezone(tz)
+        yield cls._from_parsed(dt, format(bits, "07b"))
+
+
+def _chunks(values: Iterable[str], chunksize: int) -> Iterator[list[str]]:
+    it = iter(values)
+    while chunk := list(islice(it, chunksize)):
+        yield chunk
+
+
+def iter_parse_parallel(
+    values: Iterable[str],
+    cls: type[flex_datetime] = flex_datetime,
+    chunksize: int = 10_000,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[flex_datetime]:
+    """
+    Parses date strings on a process pool, yielding flex_datetime instances in their original order.
+
+    Args:
+        values: The date strings, consumed lazily one chunk at a time.
+        cls: The flex_datetime class (or subclass) to create.
+        chunksize: Number of values sent to a worker at once.
+        max_workers: Size of the process pool, defaults to the number of CPUs.
+        executor: An existing executor to use instead of creating a process pool.
+
+    Raises:
+        ValueError: If a value cannot be parsed.
+    """
+    owns_executor = executor is None
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=max_workers)
+    # Bound the number of chunks in flight so large inputs are not read into memory at once
+    window = 2 * (max_workers or cpu_count() or 1)
+    pending: deque[Future] = deque()
+    try:
+        for chunk in _chunks(values, chunksize):
+            pending.append(pool.submit(_parse_chunk, chunk))
+            if len(pending) >= window:
+                yield from _decode_chunk(pending.popleft().result(), cls)
+        while pending:
+            yield from _decode_chunk(pending.popleft().result(), cls)
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            pool.shutdown()
+
+
+def parse_parallel(
+    values: Iterable[str],
+    cls: type[flex_datetime] = flex_datetime,
+    chunksize: int = 10_000,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list[flex_datetime]:
+    """
+    Parses date strings on a process pool and returns the flex_datetime instances in order.
+    See `iter_parse_parallel` for the arguments.
+    """
+    return list(iter_parse_parallel(values, cls, chunksize, max_workers, executor))
+
+
+def parse_file_parallel(
+    file: Union[str, PathLike, IO[str]],
+    cls: type[flex_datetime] = flex_datetime,
+    chunksize: int = 10_000,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list[flex_datetime]:
+    """
+    Parses a file with one date string per line on a process pool. Blank lines are skipped.
+    See `iter_parse_parallel` for the other arguments.
+    """
+
+    def lines(fp: IO[str]) -> Iterator[str]:
+        for line in fp:
+            line = line.strip()
+            if line:
+                yield line
+
+    if isinstance(file, (str, PathLike)):
+        with open(file) as fp:
+            return parse_parallel(lines(fp), cls, chunksize, max_workers, executor)
+    return parse_parallel(lines(file), cls, chunksize, max_workers, executor)
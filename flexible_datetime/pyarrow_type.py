@@ -0,0 +1,121 @@
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from flexible_datetime.flex_array import FlexDateTimeArray
+from flexible_datetime.flex_datetime import flex_datetime
+from flexible_datetime.packing import tz_from_id
+
+# Storage of a flex_datetime column: the UTC datetime, the mask bits, e.g. 0b0011111 for "0011111",
+# and the UTC offset in seconds
+STORAGE_TYPE = pa.struct(
+    [("dt", pa.timestamp("us", tz="UTC")), ("mask", pa.uint8()), ("offset", pa.int32())]
+)
+
+
+class FlexDateTimeType(pa.ExtensionType):
+    """
+    pyarrow extension type of flex_datetime columns, registered as "flexible_datetime.flex_datetime".
+    Values are stored as a struct of timestamp[us, UTC], uint8 mask bits and int32 UTC offsets, so
+    Parquet files written with this type need no per-value formatting and read back as
+    flex_datetime columns.
+    """
+
+    def __init__(self):
+        super().__init__(STORAGE_TYPE, "flexible_datetime.flex_datetime")
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return b""
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized) -> "FlexDateTimeType":
+        return cls()
+
+    def __arrow_ext_class__(self):
+        return FlexDateTimeArrowArray
+
+    def __arrow_ext_scalar_class__(self):
+        return FlexDateTimeScalar
+
+    def to_pandas_dtype(self):
+        from flexible_datetime.pandas_dtype import FlexDateTimeDtype
+
+        return FlexDateTimeDtype()
+
+
+class FlexDateTimeScalar(pa.ExtensionScalar):
+    def as_py(self, **kwargs) -> Optional[flex_datetime]:
+        if self.value is None or not self.value.is_valid:
+            return None
+        value = self.value
+        dt, offset = value["dt"].as_py(), value["offset"].as_py()
+        if offset:
+            dt = dt.astimezone(tz_from_id(offset))
+        return flex_datetime._from_parsed(dt, format(value["mask"].as_py(), "07b"))
+
+
+class FlexDateTimeArrowArray(pa.ExtensionArray):
+    def to_flex_array(self) -> FlexDateTimeArray:
+        """
+        Returns the values as a FlexDateTimeArray, without copying where pyarrow allows it.
+        Null values become NaT.
+        """
+        return from_arrow(self)
+
+
+def to_arrow(
+    values: Union[FlexDateTimeArray, Iterable[Optional[flex_datetime]]],
+) -> FlexDateTimeArrowArray:
+    """
+    Converts a FlexDateTimeArray or flex_datetime values to a pyarrow array of FlexDateTimeType.
+    None and NaT values become nulls.
+    """
+    if not isinstance(values, FlexDateTimeArray):
+        values = list(values)
+        valid = [ft for ft in values if ft is not None]
+        data = FlexDateTimeArray.from_flex(valid)
+        if len(valid) < len(values):
+            is_valid = np.array([ft is not None for ft in values])
+            dt = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[us]")
+            mask = np.zeros(len(values), dtype=np.uint8)
+            offset = np.zeros(len(values), dtype=np.int32)
+            dt[is_valid] = data.dt
+            mask[is_valid] = data.mask
+            offset[is_valid] = data.offset
+            data = FlexDateTimeArray(dt, mask, offset)
+        values = data
+
+    dt = pa.array(values.dt, type=STORAGE_TYPE.field("dt").type, from_pandas=True)
+    storage = pa.StructArray.from_arrays(
+        [dt, pa.array(values.mask, type=pa.uint8()), pa.array(values.offset, type=pa.int32())],
+        fields=list(STORAGE_TYPE),
+        mask=dt.is_null() if dt.null_count else None,
+    )
+    return pa.ExtensionArray.from_storage(FlexDateTimeType(), storage)
+
+
+def from_arrow(array: Union[pa.Array, pa.ChunkedArray]) -> FlexDateTimeArray:
+    """
+    Converts a pyarrow array of FlexDateTimeType, or of its storage type, to a FlexDateTimeArray.
+    Null values become NaT. Storage without an offset field is read as UTC.
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks() if array.num_chunks else pa.array([], FlexDateTimeType())
+    storage = array.storage if isinstance(array, pa.ExtensionArray) else array
+    dt = storage.field("dt")
+    if storage.null_count:
+        dt = pc.if_else(storage.is_null(), pa.scalar(None, dt.type), dt)
+    if storage.type.get_field_index("offset") < 0:
+        offset = 0
+    else:
+        offset = storage.field("offset").fill_null(0).to_numpy(zero_copy_only=False)
+    return FlexDateTimeArray(
+        dt.to_numpy(zero_copy_only=False).astype("datetime64[us]"),
+        storage.field("mask").fill_null(0).to_numpy(zero_copy_only=False),
+        offset,
+    )
+
+
+pa.register_extension_type(FlexDateTimeType())
@@ -0,0 +1,87 @@
+from typing import Annotated, Any, Iterable, get_args, get_origin
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from flexible_datetime.flex_datetime import flex_datetime
+
+
+class FlexDatetimeBatch:
+    """
+    Annotated metadata validating a whole list[flex_datetime] or dict[str, flex_datetime] in a
+    single call to `parse_many`, instead of validating one element at a time.
+    The element type can be any flex_datetime subclass:
+
+        timestamps: Annotated[list[iso_datetime], FlexDatetimeBatch()]
+    """
+
+    def __get_pydantic_core_schema__(
+        self,
+        source_type: Any,
+        _handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        origin = get_origin(source_type)
+        args = get_args(source_type)
+        cls = args[-1] if args else None
+        if origin not in (list, dict) or not (
+            isinstance(cls, type) and issubclass(cls, flex_datetime)
+        ):
+            raise TypeError(f"FlexDatetimeBatch cannot be applied to {source_type}")
+
+        item_schema = core_schema.union_schema(
+            [core_schema.str_schema(), core_schema.dict_schema()]
+        )
+        if origin is list:
+
+            def validate_list(values: Any) -> list[flex_datetime]:
+                if not isinstance(values, (list, tuple)):
+                    raise ValueError("Input should be a valid list")
+                return _parse_many(cls, values, range(len(values)))
+
+            def serialize_list(values: list[flex_datetime]) -> list[str]:
+                return [cls._serialize(value) for value in values]
+
+            return core_schema.no_info_plain_validator_function(
+                validate_list,
+                json_schema_input_schema=core_schema.list_schema(item_schema),
+                serialization=core_schema.plain_serializer_function_ser_schema(
+                    serialize_list,
+                    return_schema=core_schema.list_schema(core_schema.str_schema()),
+                ),
+            )
+
+        def validate_dict(values: Any) -> dict[str, flex_datetime]:
+            if not isinstance(values, dict):
+                raise ValueError("Input should be a valid dictionary")
+            return dict(zip(values, _parse_many(cls, list(values.values()), values)))
+
+        def serialize_dict(values: dict[str, flex_datetime]) -> dict[str, str]:
+            return {key: cls._serialize(value) for key, value in values.items()}
+
+        return core_schema.no_info_plain_validator_function(
+            validate_dict,
+            json_schema_input_schema=core_schema.dict_schema(core_schema.str_schema(), item_schema),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                serialize_dict,
+                return_schema=core_schema.dict_schema(
+                    core_schema.str_schema(), core_schema.str_schema()
+                ),
+            ),
+        )
+
+
+def _parse_many(cls: type[flex_datetime], values: list, keys: Iterable) -> list[flex_datetime]:
+    try:
+        return cls.parse_many(values)
+    except (ValueError, KeyError, TypeError):
+        # Name the first invalid item, parse_many does not track positions
+        for key, value in zip(keys, values):
+            try:
+                cls.validate(value)
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid item {key!r}: {e}") from e
+        raise
+
+
+FlexDatetimeList = Annotated[list[flex_datetime], FlexDatetimeBatch()]
+FlexDatetimeDict = Annotated[dict[str, flex_datetime], FlexDatetimeBatch()]
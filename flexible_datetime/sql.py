@@ -0,0 +1,92 @@
+from typing import Optional
+
+from flexible_datetime.flex_datetime import flex_datetime
+from flexible_datetime.intervals import range_bounds
+from flexible_datetime.packing import datetime_to_micros, local_micros, micros_to_datetime
+
+# SQL storage of a flex_datetime as two integer columns, e.g. for sqlite3:
+#
+#   CREATE TABLE events (created_us INTEGER, created_mask INTEGER);
+#   CREATE INDEX events_created ON events (created_us);
+#
+# created_us holds the microseconds from 1970-01-01 to the local fields of the value, the ones
+# flex_datetime compares, see `packing.local_micros`, and created_mask the mask bits, e.g. 31 for
+# "0011111". The UTC offset is not stored. sqlite3 adapters convert one value to one column, so
+# values are passed with `to_sql` and read with `from_sql` instead. `range_clause` builds filters
+# that can use the index.
+
+
+def to_sql(value: Optional[flex_datetime]) -> tuple[Optional[int], Optional[int]]:
+    """
+    Returns the (local epoch microseconds, mask bits) column values of a flex_datetime, or
+    (None, None):
+
+        conn.execute("INSERT INTO events VALUES (?, ?)", to_sql(ft))
+    """
+    if value is None:
+        return None, None
+    return local_micros(value.to_datetime()), value.mask_bits
+
+
+def from_sql(
+    micros: Optional[int], mask_bits: Optional[int], cls: type[flex_datetime] = flex_datetime
+) -> Optional[flex_datetime]:
+    """
+    Creates a flex_datetime instance from the column values of `to_sql`, with the local fields in
+    UTC:
+
+        [from_sql(*row) for row in conn.execute("SELECT created_us, created_mask FROM events")]
+    """
+    if micros is None:
+        return None
+    return cls._from_parsed(micros_to_datetime(micros), format(mask_bits or 0, "07b"))
+
+
+def micros_bounds(
+    *,
+    gt: Optional[flex_datetime] = None,
+    gte: Optional[flex_datetime] = None,
+    lt: Optional[flex_datetime] = None,
+    lte: Optional[flex_datetime] = None,
+    eq: Optional[flex_datetime] = None,
+) -> tuple[Optional[int], Optional[int]]:
+    """
+    Returns the range [lower, upper) of local epoch microseconds matching mask-aware comparisons,
+    see `intervals.range_bounds`. None means unbounded.
+    """
+    lower, upper = range_bounds(gt=gt, gte=gte, lt=lt, lte=lte, eq=eq)
+    return (
+        None if lower is None else datetime_to_micros(lower),
+        None if upper is None else datetime_to_micros(upper),
+    )
+
+
+def range_clause(
+    column: str,
+    *,
+    gt: Optional[flex_datetime] = None,
+    gte: Optional[flex_datetime] = None,
+    lt: Optional[flex_datetime] = None,
+    lte: Optional[flex_datetime] = None,
+    eq: Optional[flex_datetime] = None,
+) -> tuple[str, list[int]]:
+    """
+    Builds a WHERE clause with qmark parameters on a local epoch microseconds column, comparing the
+    way flex_datetime does. Bounds are compared at their own precision, and the clause is a plain range
+    on `column`, so an index on it is used:
+
+        clause, params = range_clause("created_us", eq=flex_datetime("2023-06"))
+        conn.execute(f"SELECT * FROM events WHERE {clause}", params)
+
+    `column` is inserted into the SQL as is and must not come from user input.
+    """
+    lower, upper = micros_bounds(gt=gt, gte=gte, lt=lt, lte=lte, eq=eq)
+    conditions = []
+    params = []
+    if lower is not None:
+        conditions.append(f"{column} >= ?")
+        params.append(lower)
+    if upper is not None:
+        conditions.append(f"{column} < ?")
+        params.append(upper)
+    return " AND ".join(conditions) or "1 = 1", params
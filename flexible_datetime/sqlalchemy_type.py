@@ -0,0 +1,91 @@
+from typing import Any, Optional
+
+from sqlalchemy import ColumnElement, and_, not_, true
+from sqlalchemy.orm import Composite, composite
+
+from flexible_datetime.flex_datetime import flex_datetime
+from flexible_datetime.sql import from_sql, micros_bounds
+
+# SQLAlchemy mapping of a flex_datetime as two integer columns, see `flexible_datetime.sql`:
+#
+#   class Event(Base):
+#       __tablename__ = "events"
+#       id: Mapped[int] = mapped_column(primary_key=True)
+#       created_us: Mapped[Optional[int]] = mapped_column(BigInteger, index=True)
+#       created_mask: Mapped[Optional[int]] = mapped_column(SmallInteger)
+#       created: Mapped[Optional[flex_datetime]] = flex_datetime_composite(created_us, created_mask)
+#
+#   session.scalars(select(Event).where(Event.created == flex_datetime("2023-06")))
+#
+# Comparisons on the composite become ranges on the microseconds column, so its index is used.
+
+
+class FlexDateTimeComparator(Composite.Comparator):
+    """
+    Comparator of `flex_datetime_composite` attributes. The operand is compared at its own precision
+    and on the local fields, like the flex_datetime operators do:
+    `Event.created == flex_datetime("2023-06")` matches any value in June 2023, and
+    `Event.created < flex_datetime("2023-06")` any value before it.
+    """
+
+    def _micros_column(self) -> ColumnElement[int]:
+        return self.__clause_element__().clauses[0]
+
+    def _range(self, **bounds: flex_datetime) -> ColumnElement[bool]:
+        lower, upper = micros_bounds(**bounds)
+        column = self._micros_column()
+        conditions = []
+        if lower is not None:
+            conditions.append(column >= lower)
+        if upper is not None:
+            conditions.append(column < upper)
+        return and_(*conditions) if conditions else true()
+
+    def __eq__(self, other: Any) -> ColumnElement[bool]:  # type: ignore[override]
+        if other is None:
+            return self._micros_column().is_(None)
+        return self._range(eq=flex_datetime.validate(other))
+
+    def __ne__(self, other: Any) -> ColumnElement[bool]:  # type: ignore[override]
+        if other is None:
+            return self._micros_column().is_not(None)
+        return not_(self == other)
+
+    def __lt__(self, other: Any) -> ColumnElement[bool]:  # type: ignore[override]
+        return self._range(lt=flex_datetime.validate(other))
+
+    def __le__(self, other: Any) -> ColumnElement[bool]:  # type: ignore[override]
+        return self._range(lte=flex_datetime.validate(other))
+
+    def __gt__(self, other: Any) -> ColumnElement[bool]:  # type: ignore[override]
+        return self._range(gt=flex_datetime.validate(other))
+
+    def __ge__(self, other: Any) -> ColumnElement[bool]:  # type: ignore[override]
+        return self._range(gte=flex_datetime.validate(other))
+
+    def between(self, start: Any, end: Any, symmetric: bool = False) -> ColumnElement[bool]:
+        """
+        Values from `start` up to and including `end`, each at its own precision. With `symmetric`,
+        the bounds may be given in either order.
+        """
+        start, end = flex_datetime.validate(start), flex_datetime.validate(end)
+        if symmetric and end.sort_key() < start.sort_key():
+            start, end = end, start
+        return self._range(gte=start, lte=end)
+
+
+def flex_datetime_composite(
+    micros_column: Any, mask_column: Any, cls: type[flex_datetime] = flex_datetime, **kwargs: Any
+) -> Any:
+    """
+    Maps a local epoch microseconds column and a mask bits column to one flex_datetime attribute, see
+    `flexible_datetime.sql`. Values are loaded with their local fields in UTC. Keyword arguments are
+    passed on to `sqlalchemy.orm.composite`.
+    """
+
+    def load(micros: Optional[int], mask_bits: Optional[int]) -> Optional[flex_datetime]:
+        return from_sql(micros, mask_bits, cls)
+
+    return composite(
+        load, micros_column, mask_column, comparator_factory=FlexDateTimeComparator, **kwargs
+    )
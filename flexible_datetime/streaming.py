@@ -0,0 +1,117 @@
+import csv
+import json
+from itertools import chain
+from os import PathLike, fspath
+from typing import IO, Any, Iterator, Literal, Optional, Union
+
+from flexible_datetime.flex_datetime import flex_datetime
+
+StreamFormat = Literal["csv", "jsonl"]
+ErrorMode = Literal["raise", "yield", "skip"]
+
+
+class RowParseError(ValueError):
+    """
+    Raised (or yielded) when a row of a stream cannot be turned into a flex_datetime.
+    """
+
+    def __init__(self, row: int, value: Any, error: Exception):
+        super().__init__(f"Row {row}: cannot parse {value!r}: {error}")
+        self.row = row
+        self.value = value
+        self.error = error
+
+
+def _cell_value(value: Any) -> Any:
+    """
+    CSV cells holding a JSON object, e.g. '{"dt": "2023-06-29T00:00:00+00:00", "mask": "0001111"}',
+    are decoded so they go through the dict input of flex_datetime.
+    """
+    if isinstance(value, str) and value.startswith("{"):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _sniff_format(fp: IO[str]) -> tuple[StreamFormat, Iterator[str]]:
+    """
+    Guesses the format from the first non-blank line, which is put back in front of the stream.
+    """
+    head = []
+    for line in fp:
+        head.append(line)
+        if line.strip():
+            break
+    file_format: StreamFormat = "jsonl" if head and head[-1].lstrip().startswith("{") else "csv"
+    return file_format, chain(head, fp)
+
+
+def iter_flex_datetimes(
+    file: Union[str, PathLike, IO[str]],
+    column: Union[str, int],
+    file_format: Optional[StreamFormat] = None,
+    errors: ErrorMode = "raise",
+    cls: type[flex_datetime] = flex_datetime,
+    header: bool = False,
+    **csv_kwargs: Any,
+) -> Iterator[Union[flex_datetime, RowParseError]]:
+    """
+    Lazily reads one column of a CSV or JSON Lines stream and yields a flex_datetime per row.
+    Only one row is held in memory at a time.
+
+    Args:
+        file: A path or an open text file.
+        column: The CSV header name or index, or the JSON key, holding the value.
+            Values can be date strings, component dicts or {"dt": ..., "mask": ...} dicts.
+            With a header name, the first CSV line is the header. With an index, every line is
+            data unless `header` is set.
+        file_format: "csv" or "jsonl". Guessed from the file name or the first line if omitted.
+        errors: What to do with rows that cannot be parsed:
+            "raise" raises a RowParseError, "yield" yields it in place of the value, "skip" drops the row.
+        cls: The flex_datetime class (or subclass) to create.
+        header: Skip the header line of a CSV file read by column index.
+        csv_kwargs: Passed to csv.reader / csv.DictReader, e.g. delimiter=";".
+    """
+    if isinstance(file, (str, PathLike)):
+        path = fspath(file)
+        if file_format is None and path.endswith((".jsonl", ".ndjson")):
+            file_format = "jsonl"
+        with open(path, newline="") as fp:
+            yield from iter_flex_datetimes(
+                fp, column, file_format, errors, cls, header=header, **csv_kwargs
+            )
+        return
+
+    lines: Iterator[str] = iter(file)
+    if file_format is None:
+        file_format, lines = _sniff_format(file)
+
+    records: Iterator[Any]
+    if file_format == "jsonl":
+        records = (line for line in lines if line.strip())
+    elif file_format == "csv" and isinstance(column, int):
+        records = csv.reader(lines, **csv_kwargs)
+        if header:
+            next(records, None)
+    elif file_format == "csv":
+        records = csv.DictReader(lines, **csv_kwargs)
+    else:
+        raise ValueError(f"Invalid format '{file_format}'. Must be one of: ['csv', 'jsonl']")
+
+    for row, record in enumerate(records, start=1):
+        value = None
+        try:
+            if file_format == "jsonl":
+                record = json.loads(record)
+            value = record[column]
+            ft = cls(_cell_value(value))
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            # Malformed JSON, a missing column or an unparsable value
+            if errors == "raise":
+                raise RowParseError(row, value, e) from e
+            if errors == "yield":
+                yield RowParseError(row, value, e)
+            continue
+        yield ft
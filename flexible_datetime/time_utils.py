@@ -1,20 +1,167 @@
 import re
+import threading
+from collections import Counter, OrderedDict, namedtuple
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Iterable, Optional
+
+from arrow.parser import TzinfoParser
 from dateutil.parser import parse
 from dateutil.parser._parser import ParserError
 
-import re
-from dateutil.parser import parse
+# Extended layouts: YYYY-MM, YYYY-MM-DD[T ]HH:mm:ss.SSSSSS[Z|+HH:MM] and every prefix of it.
+# "/" is accepted in place of "-" as long as it is used consistently.
+_EXTENDED_RE = re.compile(
+    r"(\d{4})"
+    r"(?:([-/])(\d{2})"
+    r"(?:\2(\d{2})"
+    r"(?:[T ](\d{2})"
+    r"(?::(\d{2})"
+    r"(?::(\d{2})(?:\.(\d{6}|\d{3}))?(Z|[+-]\d{2}:\d{2})?"
+    r")?)?)?)?)?",
+    re.ASCII,
+)
 
+# Basic (compact) layouts: YYYY, YYYYMMDD, YYYYMMDDTHHmm, YYYYMMDDTHHmmss.SSSSSS[Z|+HH:MM].
+_BASIC_RE = re.compile(
+    r"(\d{4})"
+    r"(?:(\d{2})(\d{2})"
+    r"(?:T(\d{2})(\d{2})"
+    r"(?:(\d{2})(?:\.(\d{6}|\d{3}))?(Z|[+-]\d{2}:\d{2})?)?)?)?",
+    re.ASCII,
+)
 
-def infer_time_format(date_str: str) -> str:
+# Mask for a value that provides the first n components (year, month, ... millisecond).
+_PREFIX_MASKS = tuple("0" * n + "1" * (7 - n) for n in range(8))
+
+
+def parse_datetime_str(date_str: str) -> Optional[tuple[datetime, str]]:
     """
-    Infers the date format from the given date string, including handling various formats.
+    Parses the ISO 8601 layouts known to `infer_time_format` in a single pass.
+
+    Returns the parsed datetime and the binary mask of the components that were not provided,
+    e.g. (datetime(2023, 6, 1, tzinfo=timezone.utc), "0011111") for "2023-06".
+    Returns None if the string is not one of these layouts or does not form a valid datetime,
+    in which case the caller should fall back to the general parser.
     """
-    # Remove any leading/trailing whitespace
-    date_str = date_str.strip()
+    if len(date_str) > 4 and date_str[4] in "-/":
+        m = _EXTENDED_RE.fullmatch(date_str)
+        if m is None:
+            return None
+        year, _, month, day, hour, minute, second, fraction, tz = m.groups()
+    else:
+        m = _BASIC_RE.fullmatch(date_str)
+        if m is None:
+            return None
+        year, month, day, hour, minute, second, fraction, tz = m.groups()
+
+    if fraction is not None:
+        provided = 7
+    elif second is not None:
+        provided = 6
+    elif minute is not None:
+        provided = 5
+    elif hour is not None:
+        provided = 4
+    elif day is not None:
+        provided = 3
+    elif month is not None:
+        provided = 2
+    else:
+        provided = 1
+
+    try:
+        dt = datetime(
+            int(year),
+            int(month) if month else 1,
+            int(day) if day else 1,
+            int(hour) if hour else 0,
+            int(minute) if minute else 0,
+            int(second) if second else 0,
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=TzinfoParser.parse(tz) if tz else timezone.utc,
+        )
+    except ValueError:
+        return None
+    return dt, _PREFIX_MASKS[provided]
+
+
+_DIGITS_TO_D = str.maketrans("0123456789", "d" * 10)
+
+FormatCacheInfo = namedtuple(
+    "FormatCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+def date_shape(date_str: str) -> str:
+    """
+    Returns the shape of a date string: every digit becomes "d", everything else is kept.
+    e.g. "2023-06-29" -> "dddd-dd-dd", "20230629T145530" -> "ddddddddTdddddd"
+    """
+    return date_str.translate(_DIGITS_TO_D)
+
+
+class ShapeFormatCache:
+    """
+    Bounded LRU cache of inferred formats keyed on the shape of the date string.
+    A maxsize of 0 disables caching. The cache can be shared between threads.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._formats: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, shape: str) -> Optional[str]:
+        with self._lock:
+            try:
+                fmt = self._formats[shape]
+                self._formats.move_to_end(shape)
+            except KeyError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return fmt
+
+    def put(self, shape: str, fmt: str) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._formats[shape] = fmt
+            self._evict(self.maxsize)
+
+    def _evict(self, maxsize: int) -> None:
+        while self._formats and len(self._formats) > max(maxsize, 0):
+            self._formats.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+        """Changes the maximum number of shapes kept, evicting the least recently used ones."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict(maxsize)
+
+    def info(self) -> FormatCacheInfo:
+        with self._lock:
+            return FormatCacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._formats)
+            )
 
-    # Check for common formats
-    formats = [
+    def clear(self) -> None:
+        """Empties the cache and resets the statistics."""
+        with self._lock:
+            self._formats.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+format_cache = ShapeFormatCache()
+
+# Common formats, checked in order
+_KNOWN_FORMATS = [
+    (re.compile(pattern), fmt)
+    for pattern, fmt in [
         (r"^\d{4}$", "YYYY"),
         (r"^\d{6}$", "YYYYMM"),
         (r"^\d{8}$", "YYYYMMDD"),
@@ -32,21 +179,145 @@ def infer_time_format(date_str: str) -> str:
         (r"^\d{8}T\d{6}\.\d{6}Z$", "YYYYMMDDTHHmmssSSSSSSZZ"),
         (r"^\d{4}[-/]\d{2}[-/]\d{2}[T ]\d{2}:\d{2}:\d{2}\.\d{6}Z$", "%Y-%m-%dT%H:%M:%S.%f%z"),
     ]
+]
+
 
-    for pattern, fmt in formats:
-        if re.match(pattern, date_str):
+def infer_time_format(date_str: str) -> str:
+    """
+    Infers the date format from the given date string, including handling various formats.
+    Formats of the known layouts are cached on the shape of the string (see `date_shape` and
+    `format_cache`). Other strings are parsed every time: whether they are valid dates, and the
+    format inferred for them, depend on the digits and not only on the shape.
+    """
+    # Remove any leading/trailing whitespace
+    date_str = date_str.strip()
+
+    shape = date_shape(date_str)
+    fmt = format_cache.get(shape)
+    if fmt is not None:
+        return fmt
+
+    for pattern, fmt in _KNOWN_FORMATS:
+        if pattern.match(date_str):
             # Replace [T] with T or space based on the input
-            return fmt.replace("[T]", "T" if "T" in date_str else " ")
+            fmt = fmt.replace("[T]", "T" if "T" in date_str else " ")
+            format_cache.put(shape, fmt)
+            return fmt
 
     # If no match found, try to parse and infer
     try:
         dt = parse(date_str)
-        separator = "T" if "T" in date_str else " "
-        fmt = f"YYYY-MM-DD{separator}HH:mm:ss"
-        if dt.microsecond:
-            fmt += "SSSSSS"
-        if dt.tzinfo:
-            fmt += "ZZ"
-        return fmt
     except ValueError:
         raise ParserError(f"Unknown date format for {date_str}")
+    separator = "T" if "T" in date_str else " "
+    fmt = f"YYYY-MM-DD{separator}HH:mm:ss"
+    if dt.microsecond:
+        fmt += "SSSSSS"
+    if dt.tzinfo:
+        fmt += "ZZ"
+    return fmt
+
+
+def dominant_shape(values: Iterable[Any]) -> Optional[tuple[str, str]]:
+    """
+    Returns the most common shape among the strings in `values`, along with the first string
+    having that shape, or None if there are no strings.
+    """
+    samples: dict[str, str] = {}
+    counts: Counter[str] = Counter()
+    for value in values:
+        if isinstance(value, str):
+            shape = date_shape(value)
+            counts[shape] += 1
+            samples.setdefault(shape, value)
+    if not counts:
+        return None
+    shape = counts.most_common(1)[0][0]
+    return shape, samples[shape]
+
+
+class LockedDatetimeFormat:
+    """
+    A parser locked to the layout of one sample string, for parsing many values of the same shape.
+    Fields are read at fixed positions once the shape of a value has been checked.
+    """
+
+    _defaults = (1, 1, 1, 0, 0, 0, 0)
+
+    def __init__(
+        self, shape: str, slices: list[tuple[int, int]], tz_slice: Optional[tuple[int, int]]
+    ):
+        self.shape = shape
+        self.mask = _PREFIX_MASKS[len(slices)]
+        self._slices = slices
+        self._tz_slice = tz_slice
+        self._padding = self._defaults[len(slices) :]
+        # Scale the milli/micro seconds field up to microseconds
+        self._fraction_scale = 10 ** (6 - (slices[6][1] - slices[6][0])) if len(slices) == 7 else 1
+        self._tzinfos: dict[str, tzinfo] = {}
+        # datetime.fromisoformat reads the extended layouts with a full date the same way. Naive
+        # values with a time get a UTC offset appended, which is cheaper than replacing the tzinfo.
+        self._isoformat = shape.startswith("dddd-dd-dd")
+        self._utc_suffix = "+00:00" if tz_slice is None and len(slices) > 3 else ""
+
+    @classmethod
+    def from_sample(cls, sample: str) -> Optional["LockedDatetimeFormat"]:
+        """
+        Locks the layout of `sample`, or returns None if it is not one of the layouts
+        handled by `parse_datetime_str`.
+        """
+        if parse_datetime_str(sample) is None:
+            return None
+        if len(sample) > 4 and sample[4] in "-/":
+            m = _EXTENDED_RE.fullmatch(sample)
+            groups = [1, 3, 4, 5, 6, 7, 8]
+            tz_group = 9
+        else:
+            m = _BASIC_RE.fullmatch(sample)
+            groups = [1, 2, 3, 4, 5, 6, 7]
+            tz_group = 8
+        assert m is not None
+        slices = [m.span(g) for g in groups if m.group(g) is not None]
+        tz_slice = m.span(tz_group) if m.group(tz_group) is not None else None
+        return cls(date_shape(sample), slices, tz_slice)
+
+    def parse(self, date_str: str) -> Optional[tuple[datetime, str]]:
+        """
+        Parses a string with the locked layout, see `parse_datetime_str`.
+        Returns None if the string has a different shape or does not form a valid datetime.
+        """
+        if date_str.translate(_DIGITS_TO_D) != self.shape:
+            return None
+        if self._isoformat:
+            try:
+                dt = datetime.fromisoformat(date_str + self._utc_suffix)
+            except ValueError:
+                return None
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt, self.mask
+        fields = [int(date_str[start:end]) for start, end in self._slices]
+        fields.extend(self._padding)
+        fields[6] *= self._fraction_scale
+        try:
+            if self._tz_slice is None:
+                tz = timezone.utc
+            else:
+                tz_str = date_str[self._tz_slice[0] : self._tz_slice[1]]
+                tz = self._tzinfos.get(tz_str)
+                if tz is None:
+                    tz = self._tzinfos[tz_str] = TzinfoParser.parse(tz_str)
+            return datetime(*fields, tzinfo=tz), self.mask
+        except ValueError:
+            return None
+
+
+def lock_datetime_format(values: Iterable[Any]) -> Optional[LockedDatetimeFormat]:
+    """
+    Locks the dominant layout among the strings in `values`, if it is one handled by
+    `parse_datetime_str`.
+    """
+    dominant = dominant_shape(values)
+    if dominant is None:
+        return None
+    return LockedDatetimeFormat.from_sample(dominant[1])
@@ -0,0 +1,144 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional, Union, overload
+
+from flexible_datetime.flex_datetime import flex_datetime
+from flexible_datetime.packing import comparison_key_range, pack_local
+
+
+def _key_range(value: flex_datetime) -> tuple[int, int]:
+    """
+    Returns the smallest and largest sort keys within the period of a query bound.
+    """
+    return comparison_key_range(pack_local(value.to_datetime(), value.mask_bits))
+
+
+class FlexTimeline:
+    """
+    flex_datetime values kept sorted on their sort keys, for range queries in O(log n):
+
+        timeline = FlexTimeline(events)
+        timeline.between(flex_datetime("2023-06"), flex_datetime("2023-08"))
+        timeline.nearest_before(flex_datetime("2023-06-29T12:00"))
+
+    Values of any mask can be mixed and are ordered by `flex_datetime.sort_key`: "2023-06" sorts at
+    the start of June, before "2023-06-01T00:00" and "2023-06-01T00:00:01", and after
+    "2023-05-31T23:59:59". Values with equal sort keys keep their insertion order.
+
+    Query bounds are compared at their own precision, so a start of "2023-06" and an end of
+    "2023-08" cover June 1st up to and including the whole of August. Bounds whose mask is not a
+    single period, e.g. a day of the month without a year, raise a ValueError.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, values: Iterable[flex_datetime] = ()):
+        values = list(values)
+        self._keys: list[int] = [value.sort_key() for value in values]
+        self._values: list[flex_datetime] = values
+        self._sort()
+
+    def _sort(self) -> None:
+        # Sorting positions on the int keys is faster than sorting (key, value) pairs. The sort is
+        # stable and finds already sorted runs, so merging two sorted timelines is linear.
+        keys, values = self._keys, self._values
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[i] for i in order]
+        self._values = [values[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[flex_datetime]:
+        return iter(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> flex_datetime: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[flex_datetime]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[flex_datetime, list[flex_datetime]]:
+        return self._values[index]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._values!r})"
+
+    def add(self, value: flex_datetime) -> None:
+        """
+        Inserts a value after the values with the same key. Finding the position is O(log n), the
+        list insertion itself moves the later values.
+        """
+        key = value.sort_key()
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._values.insert(i, value)
+
+    def update(self, values: Union["FlexTimeline", Iterable[flex_datetime]]) -> None:
+        """
+        Inserts many values at once: the new values are sorted and then merged with the current
+        ones in linear time. Appending values that sort after the current ones is O(m).
+        """
+        if isinstance(values, FlexTimeline):
+            keys, new_values = values._keys, values._values
+        else:
+            other = FlexTimeline(values)
+            keys, new_values = other._keys, other._values
+        if not keys:
+            return
+        if not self._keys or keys[0] >= self._keys[-1]:
+            self._keys.extend(keys)
+            self._values.extend(new_values)
+            return
+        self._keys = self._keys + keys
+        self._values = self._values + new_values
+        self._sort()
+
+    def merge(self, other: "FlexTimeline") -> "FlexTimeline":
+        """
+        Returns a new timeline with the values of both timelines, see `update`.
+        """
+        result = FlexTimeline()
+        result._keys = list(self._keys)
+        result._values = list(self._values)
+        result.update(other)
+        return result
+
+    def _positions(
+        self, start: Optional[flex_datetime], end: Optional[flex_datetime]
+    ) -> tuple[int, int]:
+        lo = 0 if start is None else bisect_left(self._keys, _key_range(start)[0])
+        hi = len(self._keys) if end is None else bisect_right(self._keys, _key_range(end)[1])
+        return lo, max(lo, hi)
+
+    def between(
+        self, start: Optional[flex_datetime] = None, end: Optional[flex_datetime] = None
+    ) -> list[flex_datetime]:
+        """
+        Returns the values from the start of `start` up to and including the end of `end`, each
+        bound at its own precision. A missing bound is unbounded.
+        """
+        lo, hi = self._positions(start, end)
+        return self._values[lo:hi]
+
+    def count_between(
+        self, start: Optional[flex_datetime] = None, end: Optional[flex_datetime] = None
+    ) -> int:
+        """
+        Returns the number of values `between` would return, in O(log n).
+        """
+        lo, hi = self._positions(start, end)
+        return hi - lo
+
+    def nearest_before(self, value: flex_datetime) -> Optional[flex_datetime]:
+        """
+        Returns the last value before the period of `value`, or None.
+        """
+        i = bisect_left(self._keys, _key_range(value)[0])
+        return self._values[i - 1] if i else None
+
+    def nearest_after(self, value: flex_datetime) -> Optional[flex_datetime]:
+        """
+        Returns the first value after the period of `value`, or None.
+        """
+        i = bisect_right(self._keys, _key_range(value)[1])
+        return self._values[i] if i < len(self._values) else None
@@ -0,0 +1,121 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from flexible_datetime import flex_datetime  # noqa: E402
+from flexible_datetime.flex_array import FlexDateTimeArray  # noqa: E402
+from flexible_datetime.packing import (  # noqa: E402
+    SECONDS_KEY_SHIFT,
+    comparison_key,
+    pack_datetime,
+)
+
+
+def random_values(n, masks=range(128)):
+    rng = random.Random(0)
+    start = datetime(1, 1, 1, tzinfo=timezone.utc)
+    return [
+        flex_datetime._from_parsed(
+            start + timedelta(microseconds=rng.randrange(315537897600000000)),
+            format(rng.choice(masks), "07b"),
+        )
+        for _ in range(n)
+    ]
+
+
+def test_roundtrip():
+    values = flex_datetime.parse_many(["2023-06-29T14:55:30.123456", "2023-06", "1969-12-31T23:59"])
+    arr = FlexDateTimeArray.from_flex(values)
+    assert arr.dt.dtype == np.dtype("datetime64[us]")
+    assert arr.mask.dtype == np.uint8
+    assert [str(ft) for ft in arr] == [str(ft) for ft in values]
+    assert [ft.mask for ft in arr.to_list()] == [ft.mask for ft in values]
+    assert str(arr[1]) == "2023-06"
+
+
+def test_from_strings_keeps_offset():
+    arr = FlexDateTimeArray.from_strings(["2023-06-29T14:55:30+02:00"])
+    assert arr.dt[0] == np.datetime64("2023-06-29T12:55:30")
+    assert arr.offset.tolist() == [7200]
+    assert arr[0].to_datetime() == datetime(2023, 6, 29, 12, 55, 30, tzinfo=timezone.utc)
+    assert arr[0].to_datetime().utcoffset() == timedelta(hours=2)
+
+
+def test_comparison_keys_match_flex_datetime():
+    values = random_values(5000)
+    keys = FlexDateTimeArray.from_flex(values).comparison_keys()
+    expected = [
+        comparison_key(pack_datetime(ft.to_datetime(), ft.mask_bits)) >> SECONDS_KEY_SHIFT
+        for ft in values
+    ]
+    assert keys.tolist() == expected
+
+
+def test_comparisons_use_local_fields():
+    # Like flex_datetime, values compare on their local fields, not on the UTC instants
+    east = flex_datetime._from_parsed(
+        datetime(2023, 6, 30, 1, 0, tzinfo=timezone(timedelta(hours=3))), "0001111"
+    )
+    utc = flex_datetime._from_parsed(datetime(2023, 6, 30, tzinfo=timezone.utc), "0001111")
+    west = flex_datetime._from_parsed(
+        datetime(2023, 6, 29, 22, 0, tzinfo=timezone(timedelta(hours=-5))), "0001111"
+    )
+    assert east == utc and west < utc
+    a = FlexDateTimeArray.from_flex([east, west])
+    assert (a == utc).tolist() == [True, False]
+    assert (a < utc).tolist() == [False, True]
+    assert a.comparison_keys().tolist() == [
+        ft._comparison_key() >> SECONDS_KEY_SHIFT for ft in (east, west)
+    ]
+    assert [str(ft) for ft in a.sort()] == [str(west), str(east)]
+
+
+@pytest.mark.parametrize("mask", ["0000000", "0001111", "0011111", "1000000", "0000110"])
+def test_comparisons_match_flex_datetime(mask):
+    values = random_values(500, masks=[int(mask, 2)])
+    other = random_values(500, masks=[int(mask, 2)])[::-1]
+    a = FlexDateTimeArray.from_flex(values)
+    b = FlexDateTimeArray.from_flex(other)
+    assert (a < b).tolist() == [x < y for x, y in zip(values, other)]
+    assert (a <= b).tolist() == [x <= y for x, y in zip(values, other)]
+    assert (a == b).tolist() == [x == y for x, y in zip(values, other)]
+    assert (a >= values[0]).tolist() == [x >= values[0] for x in values]
+    assert a.min() == min(values)
+    assert a.max() == max(values)
+    assert [str(ft) for ft in a.sort()] == [str(ft) for ft in sorted(values)]
+
+
+def test_filter():
+    arr = FlexDateTimeArray.from_strings(["2023-06-28", "2023-06-29", "2023-06-30"])
+    assert [str(ft) for ft in arr[arr >= flex_datetime("2023-06-29")]] == [
+        "2023-06-29",
+        "2023-06-30",
+    ]
+
+
+def test_different_masks():
+    arr = FlexDateTimeArray.from_strings(["2023-06-29", "2023-06"])
+    with pytest.raises(ValueError):
+        arr < flex_datetime("2023-06-29")
+    # Sorting orders values with different masks by their comparison keys
+    assert [str(ft) for ft in arr.sort()] == ["2023-06", "2023-06-29"]
+
+
+def test_nat_values():
+    arr = FlexDateTimeArray(np.array(["2023-06-29", "NaT"], dtype="datetime64[us]"), 0b0001111)
+    assert arr[1] is None
+    assert [str(ft) for ft in arr] == ["2023-06-29", "None"]
+
+
+def test_concat():
+    a = FlexDateTimeArray.from_strings(["2023-06-29"])
+    b = FlexDateTimeArray.from_strings(["2023"])
+    assert [str(ft) for ft in FlexDateTimeArray.concat([a, b])] == ["2023-06-29", "2023"]
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
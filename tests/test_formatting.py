@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from flexible_datetime import FlexDateTime, flex_datetime
+from flexible_datetime.formatting import compile_minimal_format, compile_short_format
+
+DT = datetime(2023, 6, 29, 14, 5, 30, 123456, tzinfo=timezone.utc)
+
+
+def test_compile_short_format_default():
+    compiled = compile_short_format("YYYY-MM-DDTHH:mm:ss.SSSSSS%z", 0b0000000)
+    assert compiled.template == "{0}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}.{6:06d}"
+    assert compiled.format(DT) == "2023-06-29T14:05:30.123456"
+
+
+def test_compile_short_format_masked():
+    compiled = compile_short_format("YYYY-MM-DDTHH:mm:ss.SSSSSS%z", 0b0001111)
+    assert compiled.template == "{0}-{1:02d}-{2:02d}"
+    assert compiled.format(DT) == "2023-06-29"
+
+
+def test_compile_short_format_milliseconds():
+    assert compile_short_format("HH:mm:ss.SSS", 0b0000000).format(DT) == "14:05:30.123"
+    assert compile_short_format("HH:mm:ss.SS", 0b0000000).format(DT) == "14:05:30.12"
+
+
+def test_compile_short_format_escapes_braces():
+    assert compile_short_format("YYYY{MM}DD", 0b0000000).format(DT) == "2023{06}29"
+
+
+def test_compile_short_format_is_cached():
+    assert compile_short_format("YYYY-MM", 0b0011111) is compile_short_format("YYYY-MM", 0b0011111)
+
+
+def test_to_short_datetime_custom_format():
+    ft = flex_datetime("2023-06-29T14:05")
+    assert ft.to_short_datetime("DD/MM/YYYY HH:mm") == "29/06/2023 14:05"
+    ft.apply_mask(minute=True)
+    assert ft.to_short_datetime("DD/MM/YYYY HH:mm") == "29/06/2023 14"
+
+
+def test_compile_minimal_format():
+    compiled = compile_minimal_format("YYYY-MM-DD HH:mm:ss", 0b0000111)
+    assert compiled.template == "{0}-{1:02d}-{2:02d} {3:02d}"
+    assert compiled.format(DT) == "2023-06-29 14"
+
+
+def test_flexdatetime_formatter():
+    fdt = FlexDateTime("2023-06-29")
+    assert fdt.formatter() is compile_minimal_format("YYYY-MM-DD HH:mm:ss", 0b0001111)
+    assert fdt.formatter("DD.MM.YYYY").format(DT) == "29.06.2023"
+    assert str(fdt) == "2023-06-29"
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -1,6 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from dateutil.parser._parser import ParserError
-from flexible_datetime.time_utils import infer_time_format
+from flexible_datetime.time_utils import (
+    ShapeFormatCache,
+    date_shape,
+    format_cache,
+    infer_time_format,
+)
 
 
 def test_format_YYYY():
@@ -75,6 +82,70 @@ def test_invalid_format():
         infer_time_format("invalid_date")
 
 
+def test_date_shape():
+    assert date_shape("2023-06-29") == "dddd-dd-dd"
+    assert date_shape("20230629T145530") == "ddddddddTdddddd"
+
+
+def test_format_cache_hits_on_same_shape():
+    format_cache.clear()
+    assert infer_time_format("2023-06-29") == "YYYY-MM-DD"
+    assert infer_time_format("1999-12-31") == "YYYY-MM-DD"
+    info = format_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_format_cache_fallback_with_fraction_not_cached():
+    format_cache.clear()
+    assert infer_time_format("2023-06-29T14:55:30.5+01:00") == "YYYY-MM-DDTHH:mm:ssSSSSSSZZ"
+    assert infer_time_format("2023-06-29T14:55:30.0+01:00") == "YYYY-MM-DDTHH:mm:ssZZ"
+    assert format_cache.info().currsize == 0
+
+
+def test_format_cache_fallback_checks_every_string():
+    format_cache.clear()
+    assert infer_time_format("12/31/2023") == "YYYY-MM-DD HH:mm:ss"
+    with pytest.raises(ParserError):
+        infer_time_format("99/99/9999")
+
+
+def test_format_cache_threads():
+    cache = ShapeFormatCache(maxsize=8)
+
+    def work(i):
+        for j in range(500):
+            shape = "d" * (1 + (i + j) % 16)
+            if cache.get(shape) is None:
+                cache.put(shape, "fmt")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(work, range(8)))
+    info = cache.info()
+    assert info.currsize <= 8
+    assert info.hits + info.misses == 8 * 500
+
+
+def test_format_cache_invalid_not_cached():
+    format_cache.clear()
+    with pytest.raises(ValueError):
+        infer_time_format("invalid_date")
+    assert format_cache.info().currsize == 0
+
+
+def test_format_cache_evicts_least_recently_used():
+    cache = ShapeFormatCache(maxsize=2)
+    cache.put("dddd", "YYYY")
+    cache.put("dddd-dd", "YYYY-MM")
+    assert cache.get("dddd") == "YYYY"
+    cache.put("dddd-dd-dd", "YYYY-MM-DD")
+    assert cache.get("dddd-dd") is None
+    assert cache.info().evictions == 1
+    cache.resize(1)
+    assert cache.get("dddd") is None
+    assert cache.get("dddd-dd-dd") == "YYYY-MM-DD"
+    assert cache.info().evictions == 2
+
+
 # Run the tests
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -0,0 +1,109 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from flexible_datetime import FlexDateTime, flex_datetime
+from flexible_datetime.intervals import interval_join, period_bounds
+
+UTC = timezone.utc
+
+
+def test_period_bounds():
+    dt = datetime(2023, 6, 29, 16, 55, 30, tzinfo=timezone(timedelta(hours=2)))
+    assert period_bounds(dt, 0b0001111) == (
+        datetime(2023, 6, 29, tzinfo=UTC),
+        datetime(2023, 6, 30, tzinfo=UTC),
+    )
+    assert period_bounds(dt, 0b0111111) == (
+        datetime(2023, 1, 1, tzinfo=UTC),
+        datetime(2024, 1, 1, tzinfo=UTC),
+    )
+    assert period_bounds(datetime(9999, 12, 31, tzinfo=UTC), 0b0011111)[1] is None
+    # In the time zone of the datetime, rather than in UTC
+    start, end = period_bounds(dt, 0b0001111, utc=False)
+    assert (start, end) == (
+        dt.replace(hour=0, minute=0, second=0),
+        dt.replace(day=30, hour=0, minute=0, second=0),
+    )
+    assert start.utcoffset() == timedelta(hours=2)
+
+
+def test_as_interval():
+    assert flex_datetime("2023-06").as_interval() == (
+        datetime(2023, 6, 1, tzinfo=UTC),
+        datetime(2023, 7, 1, tzinfo=UTC),
+    )
+    assert flex_datetime("2023-12").as_interval()[1] == datetime(2024, 1, 1, tzinfo=UTC)
+    assert flex_datetime("2023-06-29T16:55:30.123").as_interval() == (
+        datetime(2023, 6, 29, 16, 55, 30, tzinfo=UTC),
+        datetime(2023, 6, 29, 16, 55, 31, tzinfo=UTC),
+    )
+    assert FlexDateTime.from_str("2023-06-29").as_interval() == (
+        datetime(2023, 6, 29, tzinfo=UTC),
+        datetime(2023, 6, 30, tzinfo=UTC),
+    )
+
+
+def test_as_interval_unsupported_mask():
+    ft = flex_datetime("2023-06-29")
+    ft.apply_mask(year=True)
+    with pytest.raises(ValueError):
+        ft.as_interval()
+
+
+def test_interval_join():
+    points = [
+        flex_datetime("2023-06-30T23:59:59"),
+        flex_datetime("2023-05-31T23:59:59"),
+        datetime(2023, 6, 15, 12),
+        flex_datetime("2023-07-01T00:00"),
+    ]
+    periods = [flex_datetime("2023"), flex_datetime("2023-06"), flex_datetime("2023-06-15")]
+    pairs = [(str(point), str(period)) for point, period in interval_join(points, periods)]
+    assert pairs == [
+        ("2023-05-31T23:59:59", "2023"),
+        ("2023-06-15 12:00:00", "2023"),
+        ("2023-06-15 12:00:00", "2023-06"),
+        ("2023-06-15 12:00:00", "2023-06-15"),
+        ("2023-06-30T23:59:59", "2023"),
+        ("2023-06-30T23:59:59", "2023-06"),
+        ("2023-07-01T00:00", "2023"),
+    ]
+
+
+def test_interval_join_records():
+    events = [{"id": 1, "at": flex_datetime("2023-06-02T10:00")}]
+    months = [{"name": "june", "month": FlexDateTime.from_str("2023-06")}]
+    pairs = list(
+        interval_join(events, months, point_key=lambda e: e["at"], period_key=lambda m: m["month"])
+    )
+    assert pairs == [(events[0], months[0])]
+
+
+def test_interval_join_matches_nested_loop():
+    rng = random.Random(0)
+    start = datetime(2023, 1, 1, tzinfo=UTC)
+    points = [start + timedelta(minutes=rng.randrange(365 * 24 * 60)) for _ in range(300)]
+    periods = []
+    for _ in range(100):
+        ft = flex_datetime(start + timedelta(hours=rng.randrange(365 * 24)))
+        ft.apply_mask(minute=True, second=True, millisecond=True)
+        ft.apply_mask(**{field: True for field in rng.choice([["day", "hour"], ["hour"], []])})
+        periods.append(ft)
+    bounds = [period.as_interval() for period in periods]
+
+    expected = [
+        (point, i)
+        for point in sorted(points)
+        for i in sorted(range(len(periods)), key=lambda i: bounds[i][0])
+        if bounds[i][0] <= point < bounds[i][1]
+    ]
+    positions = {id(period): i for i, period in enumerate(periods)}
+    found = [(point, positions[id(period)]) for point, period in interval_join(points, periods)]
+    assert found == expected
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from flexible_datetime import flex_datetime
+from flexible_datetime.mongo import from_bson, range_filter, to_bson
+
+
+def test_to_bson_from_bson():
+    ft = flex_datetime("2023-06-29T16:55:30.123+02:00")
+    doc = to_bson(ft)
+    local = datetime(2023, 6, 29, 16, 55, 30, 123000, tzinfo=timezone.utc)
+    assert doc == {"dt": local, "mask": 0, "offset": 7200}
+    restored = from_bson({**doc, "dt": doc["dt"].replace(tzinfo=None)})
+    assert restored.to_datetime() == ft.to_datetime()
+    assert restored.to_datetime().utcoffset() == timedelta(hours=2)
+    assert restored.mask == ft.mask
+    # Documents written without an offset are read in UTC
+    assert from_bson({"dt": local, "mask": 0}).to_datetime() == local
+
+
+def test_validate_bson_document():
+    # Documents read back through pydantic, e.g. by beanie, need no separate decoder
+    ft = flex_datetime.validate({"dt": datetime(2023, 6, 1), "mask": 0b0011111})
+    assert str(ft) == "2023-06"
+    ft = flex_datetime.validate(to_bson(flex_datetime("2023-06-29T00:30:00+02:00")))
+    assert str(ft) == "2023-06-29T00:30:00"
+    assert ft.to_datetime().utcoffset() == timedelta(hours=2)
+
+
+def test_validate_mask_bits_out_of_range():
+    for mask in (-1, 0b10000000, 999):
+        with pytest.raises(ValueError):
+            flex_datetime({"dt": datetime(2023, 6, 1), "mask": mask})
+
+
+def test_range_filter():
+    start = datetime(2023, 6, 1, tzinfo=timezone.utc)
+    end = datetime(2023, 7, 1, tzinfo=timezone.utc)
+    june = flex_datetime("2023-06")
+    assert range_filter("created", eq=june) == {"created.dt": {"$gte": start, "$lt": end}}
+    assert range_filter("created", lt=june) == {"created.dt": {"$lt": start}}
+    assert range_filter("created", lte=june) == {"created.dt": {"$lt": end}}
+    assert range_filter("created", gt=june) == {"created.dt": {"$gte": end}}
+    assert range_filter("created", gte=june, same_mask=True) == {
+        "created.dt": {"$gte": start},
+        "created.mask": 0b0011111,
+    }
+
+
+def test_range_filter_unsupported_mask():
+    ft = flex_datetime("2023-06-29")
+    ft.apply_mask(year=True)
+    with pytest.raises(ValueError):
+        range_filter("created", eq=ft)
+
+
+def test_range_filter_matches_comparisons():
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient().db.events
+    values = [
+        flex_datetime(s)
+        for s in ["2023-05-31T23:59:59", "2023-06-01", "2023-06-30T23:59", "2023-07-01T00:00:00"]
+    ]
+    collection.insert_many([{"created": to_bson(ft), "i": i} for i, ft in enumerate(values)])
+
+    def matches(**kwargs):
+        return [doc["i"] for doc in collection.find(range_filter("created", **kwargs)).sort("i")]
+
+    june = flex_datetime("2023-06")
+    assert matches(eq=june) == [1, 2]
+    assert matches(lt=june) == [0]
+    assert matches(gt=june) == [3]
+    assert matches(gte=flex_datetime("2023-06-01T00:00:00"), lte=june) == [1, 2]
+    assert matches(gte=june, same_mask=True) == []
+
+    # The same matches as the flex_datetime operators, applied at the precision of the bound
+    for ft in values:
+        ft.use_only("year", "month")
+    assert [i for i, ft in enumerate(values) if ft == june] == matches(eq=june)
+
+
+def test_range_filter_uses_local_fields():
+    mongomock = pytest.importorskip("mongomock")
+    collection = mongomock.MongoClient().db.events
+    day = flex_datetime("2023-06-29T00:30:00+02:00")
+    day.apply_mask(hour=True, minute=True, second=True, millisecond=True)
+    values = [
+        flex_datetime(s)
+        for s in [
+            "2023-06-28T23:30:00+00:00",
+            "2023-06-29T00:30:00+02:00",
+            "2023-06-29T23:30-05:00",
+        ]
+    ]
+    collection.insert_many([{"created": to_bson(ft), "i": i} for i, ft in enumerate(values)])
+
+    doc = collection.find_one({"i": 1})
+    restored = from_bson(doc["created"])
+    assert str(restored) == str(values[1])
+    assert restored.to_datetime() == values[1].to_datetime()
+
+    # Only the values on June 29th in their own time zones, as flex_datetime compares them
+    found = collection.find(range_filter("created", eq=day)).sort("i")
+    assert [doc["i"] for doc in found] == [1, 2]
+    for ft in values:
+        ft.use_only("year", "month", "day")
+    assert [i for i, ft in enumerate(values) if ft == day] == [1, 2]
+
+
+def test_beanie_encoder():
+    encoder = pytest.importorskip("beanie.odm.utils.encoder")
+    from flexible_datetime.mongo import use_bson_encoding
+
+    ft = flex_datetime("2023-06")
+    try:
+        use_bson_encoding()
+        assert encoder.Encoder().encode({"created": ft}) == {"created": to_bson(ft)}
+    finally:
+        use_bson_encoding(False)
+    assert encoder.Encoder().encode({"created": ft}) == {"created": "2023-06"}
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
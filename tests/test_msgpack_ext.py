@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+import pytest
+
+msgpack = pytest.importorskip("msgpack")
+
+from flexible_datetime import flex_datetime, flex_time  # noqa: E402
+from flexible_datetime.msgpack_ext import FLEX_DATETIME_EXT_TYPE, packb, unpackb  # noqa: E402
+
+
+def test_roundtrip():
+    payload = {"at": flex_datetime("2023-06"), "times": [flex_time("14:30"), None]}
+    restored = unpackb(packb(payload))
+    assert str(restored["at"]) == "2023-06"
+    assert restored["at"].mask == payload["at"].mask
+    assert str(restored["times"][0]) == "14:30"
+    assert restored["times"][1] is None
+
+
+def test_ext_type():
+    packed = packb(flex_datetime("2023-06-29T14:55:30"))
+    # fixext 8 does not fit 13 bytes, so this is an ext 8 header: 0xc7, length, type
+    assert len(packed) == 16
+    ext = msgpack.unpackb(packed)
+    assert ext.code == FLEX_DATETIME_EXT_TYPE
+    assert flex_datetime.from_bytes(ext.data) == flex_datetime("2023-06-29T14:55:30")
+
+
+def test_offsets_are_kept():
+    at = flex_datetime("2023-06-29T00:30:00+02:00")
+    at.apply_mask(hour=True, minute=True, second=True, millisecond=True)
+    restored = unpackb(packb({"at": at}))["at"]
+    assert str(restored) == "2023-06-29"
+    assert restored == at
+    assert restored.to_datetime().utcoffset() == timedelta(hours=2)
+
+
+def test_unknown_type():
+    with pytest.raises(TypeError):
+        packb(object())
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
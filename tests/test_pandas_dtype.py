@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from flexible_datetime import flex_datetime  # noqa: E402
+from flexible_datetime.pandas_dtype import (  # noqa: E402
+    FlexDateTimeDtype,
+    FlexDateTimeExtensionArray,
+)
+
+
+@pytest.fixture
+def series():
+    values = ["2023-06-29T10:00", "2023-06", None, "2023-06-28", "2023-06-29T10:00"]
+    return pd.Series(values).astype("flexdatetime")
+
+
+def test_astype_from_strings(series):
+    assert isinstance(series.dtype, FlexDateTimeDtype)
+    assert isinstance(series.array, FlexDateTimeExtensionArray)
+    assert series.isna().tolist() == [False, False, True, False, False]
+    assert str(series[1]) == "2023-06"
+    assert series[1].mask == flex_datetime("2023-06").mask
+
+
+def test_storage(series):
+    # 8 bytes of datetime64[us], 1 byte of mask and 4 bytes of UTC offset per value
+    assert series.array.nbytes == 13 * len(series)
+
+
+def test_sort(series):
+    assert [str(v) for v in series.sort_values().dropna()] == [
+        "2023-06",
+        "2023-06-28",
+        "2023-06-29T10:00",
+        "2023-06-29T10:00",
+    ]
+    assert pd.isna(series.sort_values().iloc[-1])
+
+
+def test_take_concat(series):
+    assert [str(v) for v in series.take([3, 0])] == ["2023-06-28", "2023-06-29T10:00"]
+    combined = pd.concat([series, series], ignore_index=True)
+    assert combined.dtype == series.dtype
+    assert len(combined) == 10
+
+
+def test_groupby_value_counts(series):
+    df = pd.DataFrame({"t": series, "v": range(5)})
+    sums = df.groupby("t").v.sum()
+    assert [str(t) for t in sums.index] == ["2023-06", "2023-06-28", "2023-06-29T10:00"]
+    assert sums.tolist() == [1, 3, 4]
+    counts = series.value_counts()
+    assert counts.max() == 2
+    assert len(series.unique()) == 4
+
+
+def test_groupby_labels_follow_first_occurrence():
+    # A duplicate comes before a new value, so unique positions differ from row positions
+    series = pd.Series(["2023-06-29", None, "2023-06-01", "2023-06-29", "1969-12-31"]).astype(
+        "flexdatetime"
+    )
+    codes, uniques = series.factorize()
+    assert codes.tolist() == [0, -1, 1, 0, 2]
+    assert [str(t) for t in uniques] == ["2023-06-29", "2023-06-01", "1969-12-31"]
+    sums = pd.DataFrame({"t": series, "v": range(5)}).groupby("t").v.sum()
+    assert dict(zip((str(t) for t in sums.index), sums.tolist())) == {
+        "1969-12-31": 4,
+        "2023-06-01": 2,
+        "2023-06-29": 3,
+    }
+
+    series = pd.Series(["2023-06-29", "2023-06-29", "2023-06-01", "2022-01-01"]).astype(
+        "flexdatetime"
+    )
+    counts = series.value_counts()
+    assert dict(zip((str(t) for t in counts.index), counts.tolist())) == {
+        "2023-06-29": 2,
+        "2023-06-01": 1,
+        "2022-01-01": 1,
+    }
+
+
+def test_offsets_are_kept():
+    series = pd.Series(["2023-06-30T01:00:00+03:00", None, "2023-06-29T12:00:00"]).astype(
+        "flexdatetime"
+    )
+    taken = series.take([2, 0]).reset_index(drop=True)
+    assert str(taken[1]) == str(series[0])
+    assert taken[1].to_datetime().utcoffset() == timedelta(hours=3)
+    # Compared on the local fields, as flex_datetime does
+    assert (series > flex_datetime("2023-06-30T00:00:00")).tolist() == [True, False, False]
+    series[2] = flex_datetime("2023-06-30T03:00:00+05:00")
+    assert series[2].to_datetime().utcoffset() == timedelta(hours=5)
+    assert [str(t) for t in series.sort_values().dropna()] == [str(series[0]), str(series[2])]
+
+
+def test_groupby_uses_mask():
+    ft = flex_datetime("2023-06-29T12:00")
+    ft.use_only("year", "month", "day")
+    day = flex_datetime("2023-06-29")
+    series = pd.Series(pd.array([ft, day, flex_datetime("2023-06-29T12:00")], dtype="flexdatetime"))
+    assert series.value_counts().tolist() == [2, 1]
+
+
+def test_comparisons(series):
+    assert (series == flex_datetime("2023-06-29T10:00")).tolist() == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert series.min() == flex_datetime("2023-06")
+    days = pd.Series(["2023-06-28", "2023-06-29", "2023-06-30"], dtype="flexdatetime")
+    assert (days > "2023-06-28").tolist() == [False, True, True]
+
+
+def test_astype_datetime(series):
+    converted = series.astype("datetime64[us]")
+    assert converted.iloc[1] == pd.Timestamp("2023-06-01")
+    assert pd.isna(converted.iloc[2])
+
+
+def test_fillna(series):
+    assert str(series.fillna(flex_datetime("2000"))[2]) == "2000"
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
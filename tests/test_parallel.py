@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from flexible_datetime import flex_datetime, short_datetime
+from flexible_datetime.parallel import parse_file_parallel, parse_parallel
+
+VALUES = [
+    "2023-06-29",
+    "2023-06-29T14:55:30.123456+02:00",
+    "2023-07",
+    "20230629T1455",
+    "June 15th, 2023",
+] * 20
+
+
+def test_parse_parallel_keeps_order():
+    parsed = parse_parallel(VALUES, chunksize=7, max_workers=2)
+    expected = [flex_datetime(v) for v in VALUES]
+    assert [p.dt for p in parsed] == [e.dt for e in expected]
+    assert [p.dt.utcoffset() for p in parsed] == [e.dt.utcoffset() for e in expected]
+    assert [p.mask_str for p in parsed] == [e.mask_str for e in expected]
+
+
+def test_parse_parallel_subclass_with_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parsed = parse_parallel(VALUES[:5], cls=short_datetime, chunksize=2, executor=executor)
+    assert all(type(p) is short_datetime for p in parsed)
+    assert [str(p) for p in parsed] == [str(short_datetime(v)) for v in VALUES[:5]]
+
+
+def test_parse_parallel_invalid_value():
+    with pytest.raises(ValueError):
+        parse_parallel(["2023-06-29", "not a date"], chunksize=1, max_workers=2)
+
+
+def test_parse_file_parallel(tmp_path):
+    path = tmp_path / "dates.txt"
+    path.write_text("2023-06-29\n\n2023-06-30T12:00\n")
+    parsed = parse_file_parallel(path, max_workers=2)
+    assert [str(p) for p in parsed] == ["2023-06-29", "2023-06-30T12:00"]
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from flexible_datetime import flex_datetime
+from flexible_datetime.time_utils import parse_datetime_str
+
+
+def test_parse_YYYY():
+    assert parse_datetime_str("2023") == (datetime(2023, 1, 1, tzinfo=timezone.utc), "0111111")
+
+
+def test_parse_YYYY_MM():
+    assert parse_datetime_str("2023-06") == (datetime(2023, 6, 1, tzinfo=timezone.utc), "0011111")
+
+
+def test_parse_YYYY_MM_slash():
+    assert parse_datetime_str("2023/06") == (datetime(2023, 6, 1, tzinfo=timezone.utc), "0011111")
+
+
+def test_parse_YYYYMMDD():
+    assert parse_datetime_str("20230629") == (datetime(2023, 6, 29, tzinfo=timezone.utc), "0001111")
+
+
+def test_parse_YYYY_MM_DD_HH():
+    assert parse_datetime_str("2023-06-29 14") == (
+        datetime(2023, 6, 29, 14, tzinfo=timezone.utc),
+        "0000111",
+    )
+
+
+def test_parse_YYYYMMDDTHHmm():
+    assert parse_datetime_str("20230629T1455") == (
+        datetime(2023, 6, 29, 14, 55, tzinfo=timezone.utc),
+        "0000011",
+    )
+
+
+def test_parse_YYYY_MM_DDTHH_mm_ss():
+    assert parse_datetime_str("2023-06-29T14:55:30") == (
+        datetime(2023, 6, 29, 14, 55, 30, tzinfo=timezone.utc),
+        "0000001",
+    )
+
+
+def test_parse_milliseconds():
+    assert parse_datetime_str("2023-06-29T14:55:30.123") == (
+        datetime(2023, 6, 29, 14, 55, 30, 123000, tzinfo=timezone.utc),
+        "0000000",
+    )
+
+
+def test_parse_microseconds_zulu():
+    assert parse_datetime_str("20230629T145530.123456Z") == (
+        datetime(2023, 6, 29, 14, 55, 30, 123456, tzinfo=timezone.utc),
+        "0000000",
+    )
+
+
+def test_parse_offset():
+    dt, mask = parse_datetime_str("2023-06-29T14:55:30+02:00")  # type: ignore
+    assert dt.utcoffset() == timedelta(hours=2)
+    assert mask == "0000001"
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "202306",  # YYYYMM is not accepted by arrow
+        "2023/06-29",  # mixed separators
+        " 2023-06-29",  # surrounding whitespace
+        "2023-13-01",  # out of range month
+        "2023-02-30",  # out of range day
+        "2023-06-29T24:00",  # arrow rolls 24:00 over to the next day
+        "2023-06-29T14:55:30.1",  # fractions other than milli/micro seconds
+        "June 29th, 2023",
+    ],
+)
+def test_parse_falls_back(date_str):
+    assert parse_datetime_str(date_str) is None
+
+
+def test_flex_datetime_zulu_microseconds_mask():
+    ft = flex_datetime("2023-06-29T14:55:30.123456Z")
+    assert ft.mask_str == "0000000"
+    assert ft.microsecond == 123456
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from flexible_datetime import flex_datetime  # noqa: E402
+from flexible_datetime.flex_array import FlexDateTimeArray  # noqa: E402
+from flexible_datetime.pyarrow_type import (  # noqa: E402
+    STORAGE_TYPE,
+    FlexDateTimeType,
+    from_arrow,
+    to_arrow,
+)
+
+
+@pytest.fixture
+def values():
+    return flex_datetime.parse_many(["2023-06-29T14:55:30.123456", "2023-06", "2023"]) + [None]
+
+
+def test_to_arrow(values):
+    array = to_arrow(values)
+    assert isinstance(array.type, FlexDateTimeType)
+    assert array.storage.type == STORAGE_TYPE
+    assert array.null_count == 1
+    assert [str(ft) for ft in array.to_pylist()[:3]] == [str(ft) for ft in values[:3]]
+    assert array.to_pylist()[3] is None
+    assert array[1].as_py().mask == values[1].mask
+
+
+def test_flex_array_roundtrip(values):
+    arr = FlexDateTimeArray.from_flex(values[:3])
+    restored = from_arrow(to_arrow(arr))
+    assert (restored.dt == arr.dt).all()
+    assert (restored.mask == arr.mask).all()
+    assert to_arrow(arr).to_flex_array().to_list()[2] == values[2]
+
+
+def test_offsets_are_kept(tmp_path):
+    values = flex_datetime.parse_many(["2023-06-29T14:55:30+02:00", "2023-06-29T14:55:30"])
+    path = tmp_path / "values.parquet"
+    pq.write_table(pa.table({"t": to_arrow(values + [None])}), path)
+    column = pq.read_table(path)["t"]
+    assert from_arrow(column).offset.tolist() == [7200, 0, 0]
+    assert column[0].as_py().to_datetime().utcoffset() == timedelta(hours=2)
+    assert [str(ft) for ft in column.to_pylist()[:2]] == [str(ft) for ft in values]
+
+
+def test_storage_without_offset():
+    storage = pa.StructArray.from_arrays(
+        [pa.array([0], pa.timestamp("us", tz="UTC")), pa.array([0b0001111], pa.uint8())],
+        names=["dt", "mask"],
+    )
+    assert str(from_arrow(storage)[0]) == "1970-01-01"
+
+
+def test_nulls_become_nat(values):
+    arr = from_arrow(to_arrow(values))
+    assert arr.to_list()[3] is None
+    assert arr[3] is None
+
+
+def test_parquet_roundtrip(values, tmp_path):
+    path = tmp_path / "values.parquet"
+    pq.write_table(pa.table({"t": to_arrow(values)}), path)
+    table = pq.read_table(path)
+    assert isinstance(table.schema.field("t").type, FlexDateTimeType)
+    assert [str(ft) for ft in table["t"].to_pylist()[:3]] == [str(ft) for ft in values[:3]]
+    assert from_arrow(table["t"]).mask.tolist()[:3] == [ft.mask_bits for ft in values[:3]]
+
+
+def test_pandas_parquet_roundtrip(tmp_path):
+    pd = pytest.importorskip("pandas")
+    import flexible_datetime.pandas_dtype  # noqa: F401
+
+    df = pd.DataFrame({"t": pd.Series(["2023-06", None, "2023-06-29T10"], dtype="flexdatetime")})
+    df.to_parquet(tmp_path / "df.parquet")
+    restored = pd.read_parquet(tmp_path / "df.parquet")
+    assert restored.t.dtype == df.t.dtype
+    assert [str(v) for v in restored.t] == ["2023-06", "NaT", "2023-06-29T10"]
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
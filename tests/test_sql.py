@@ -0,0 +1,123 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from flexible_datetime import flex_datetime
+from flexible_datetime.sql import from_sql, micros_bounds, range_clause, to_sql
+
+VALUES = [
+    "2023-05-31T23:59:59",
+    "2023-06-01",
+    "2023-06-15T12:30",
+    "2023-06-30T23:59:59.999",
+    "2023-07-01T00:00",
+    "2024-01-01",
+]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY, created_us INTEGER, created_mask INTEGER)"
+    )
+    conn.execute("CREATE INDEX events_created ON events (created_us)")
+    conn.executemany(
+        "INSERT INTO events (created_us, created_mask) VALUES (?, ?)",
+        [to_sql(flex_datetime(value)) for value in VALUES],
+    )
+    yield conn
+    conn.close()
+
+
+def select(conn, **bounds):
+    clause, params = range_clause("created_us", **bounds)
+    rows = conn.execute(
+        f"SELECT created_us, created_mask FROM events WHERE {clause} ORDER BY created_us", params
+    )
+    return [str(from_sql(*row)) for row in rows]
+
+
+def test_to_sql_from_sql():
+    ft = flex_datetime("2023-06-29T16:55:30.123+02:00")
+    micros, mask_bits = to_sql(ft)
+    # The local fields, which flex_datetime compares, not the UTC instant
+    local = datetime(2023, 6, 29, 16, 55, 30, 123000, tzinfo=timezone.utc)
+    assert micros == int(local.timestamp()) * 1_000_000 + 123000
+    assert mask_bits == 0
+    restored = from_sql(micros, mask_bits)
+    assert restored.to_datetime() == local
+    assert str(restored) == str(ft)
+    assert restored.mask == ft.mask
+    assert str(from_sql(*to_sql(flex_datetime("2023-06")))) == "2023-06"
+    assert to_sql(None) == (None, None)
+    assert from_sql(None, None) is None
+
+
+def test_local_fields_with_offset():
+    ft = flex_datetime("2023-06-29T00:30:00+02:00")
+    ft.apply_mask(hour=True, minute=True, second=True, millisecond=True)
+    restored = from_sql(*to_sql(ft))
+    assert str(restored) == "2023-06-29"
+    assert restored == ft
+    start = datetime(2023, 6, 29, tzinfo=timezone.utc)
+    end = datetime(2023, 6, 30, tzinfo=timezone.utc)
+    assert micros_bounds(eq=ft) == (int(start.timestamp()) * 10**6, int(end.timestamp()) * 10**6)
+
+
+def test_range_clause():
+    june = flex_datetime("2023-06")
+    assert range_clause("created_us", eq=june) == (
+        "created_us >= ? AND created_us < ?",
+        [to_sql(june)[0], to_sql(flex_datetime("2023-07"))[0]],
+    )
+    assert range_clause("created_us") == ("1 = 1", [])
+
+
+def test_range_queries(conn):
+    june = flex_datetime("2023-06")
+    assert select(conn, eq=june) == [
+        "2023-06-01",
+        "2023-06-15T12:30",
+        "2023-06-30T23:59:59.999000",
+    ]
+    assert select(conn, lt=june) == ["2023-05-31T23:59:59"]
+    assert select(conn, gt=june) == ["2023-07-01T00:00", "2024-01-01"]
+    assert len(select(conn, lte=june)) == 4
+    assert len(select(conn, gte=june)) == 5
+    assert select(conn, gte=flex_datetime("2023-06-15T12:30"), lt=flex_datetime("2023-07-01")) == [
+        "2023-06-15T12:30",
+        "2023-06-30T23:59:59.999000",
+    ]
+
+
+def test_range_queries_match_comparisons(conn):
+    # The query results are the values the flex_datetime operators select, at the bound's mask
+    bound = flex_datetime("2023-06-15")
+    values = [flex_datetime(value) for value in VALUES]
+    for op, cmp in (
+        ("lt", lambda ft: ft < bound),
+        ("lte", lambda ft: ft <= bound),
+        ("gt", lambda ft: ft > bound),
+        ("gte", lambda ft: ft >= bound),
+        ("eq", lambda ft: ft == bound),
+    ):
+        expected = []
+        for ft in values:
+            ft.apply_mask(**{k: v for k, v in bound.mask.items() if v})
+            if cmp(ft):
+                expected.append(ft.to_datetime())
+        found = [from_sql(*to_sql(flex_datetime(value))) for value in select(conn, **{op: bound})]
+        assert [ft.to_datetime() for ft in found] == expected, op
+
+
+def test_range_query_uses_index(conn):
+    clause, params = range_clause("created_us", eq=flex_datetime("2023-06"))
+    plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT * FROM events WHERE {clause}", params)
+    assert any("events_created" in row[-1] for row in plan)
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
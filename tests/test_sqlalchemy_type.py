@@ -0,0 +1,90 @@
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import BigInteger, SmallInteger, create_engine, select, text  # noqa: E402
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column  # noqa: E402
+
+from flexible_datetime import flex_datetime  # noqa: E402
+from flexible_datetime.sqlalchemy_type import flex_datetime_composite  # noqa: E402
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Event(Base):
+    __tablename__ = "events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    created_us: Mapped[Optional[int]] = mapped_column(BigInteger, index=True)
+    created_mask: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    created: Mapped[Optional[flex_datetime]] = flex_datetime_composite(created_us, created_mask)
+
+
+VALUES = ["2023-05-31T23:59:59", "2023-06-01", "2023-06-15T12:30", "2023-07-01T00:00", "2024"]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Event(created=flex_datetime(value)) for value in VALUES)
+        session.add(Event(created=None))
+        session.commit()
+        yield session
+
+
+def created(session, condition) -> list[str]:
+    query = select(Event).where(condition).order_by(Event.created_us)
+    return [str(event.created) for event in session.scalars(query)]
+
+
+def test_round_trip(session):
+    events = session.scalars(select(Event).order_by(Event.id)).all()
+    assert [str(event.created) for event in events[:-1]] == VALUES
+    assert events[0].created_mask == 0b0000001
+    assert events[1].created_mask == 0b0001111
+    assert events[-1].created is None
+
+
+def test_comparisons(session):
+    june = flex_datetime("2023-06")
+    assert created(session, Event.created == june) == ["2023-06-01", "2023-06-15T12:30"]
+    assert created(session, Event.created < june) == ["2023-05-31T23:59:59"]
+    assert created(session, Event.created > june) == ["2023-07-01T00:00", "2024"]
+    assert len(created(session, Event.created <= june)) == 3
+    assert len(created(session, Event.created >= "2023-06")) == 4
+    assert len(created(session, Event.created != june)) == 3
+    assert created(session, Event.created.between("2023-06-02", "2023-07")) == [
+        "2023-06-15T12:30",
+        "2023-07-01T00:00",
+    ]
+    assert created(session, Event.created == None) == ["None"]  # noqa: E711
+
+
+def test_comparisons_use_local_fields(session):
+    # 2023-07-01T04:30 in UTC, but June 30th in its own time zone, as flex_datetime compares it
+    session.add(Event(created=flex_datetime("2023-06-30T23:30:00-05:00")))
+    session.commit()
+    june = flex_datetime("2023-06")
+    assert created(session, Event.created == june) == [
+        "2023-06-01",
+        "2023-06-15T12:30",
+        "2023-06-30T23:30:00",
+    ]
+
+
+def test_comparison_uses_index(session):
+    query = select(Event).where(Event.created == flex_datetime("2023-06"))
+    compiled = query.compile(session.bind, compile_kwargs={"literal_binds": True})
+    plan = session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    assert any("ix_events_created_us" in row[-1] for row in plan)
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
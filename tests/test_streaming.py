@@ -0,0 +1,75 @@
+import io
+import json
+
+import pytest
+
+from flexible_datetime import flex_datetime, mask_datetime
+from flexible_datetime.streaming import RowParseError, iter_flex_datetimes
+
+
+def test_iter_csv_by_name():
+    data = io.StringIO('id,when\n1,2023-06-29\n2,2023-06\n3,"{""year"": 2023, ""month"": 7}"\n')
+    values = list(iter_flex_datetimes(data, column="when"))
+    assert [str(v) for v in values] == ["2023-06-29", "2023-06", "2023-07"]
+
+
+def test_iter_csv_by_index_with_delimiter():
+    data = io.StringIO("1;2023-06-29T14:55\n2;20230630\n")
+    values = list(iter_flex_datetimes(data, column=1, file_format="csv", delimiter=";"))
+    assert [str(v) for v in values] == ["2023-06-29T14:55", "2023-06-30"]
+
+
+def test_iter_csv_by_index_with_header(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("id,when\n1,2023-06-29\n2,2023-06\n")
+    with pytest.raises(RowParseError) as e:
+        list(iter_flex_datetimes(path, column=1))
+    assert e.value.row == 1 and e.value.value == "when"
+    values = list(iter_flex_datetimes(path, column=1, header=True))
+    assert [str(v) for v in values] == ["2023-06-29", "2023-06"]
+
+
+def test_iter_jsonl_sniffed():
+    lines = [
+        {"when": "2023-06-29"},
+        {"when": {"dt": "2023-06-29T00:00:00+00:00", "mask": "0011111"}},
+        {"when": {"year": 2024}},
+    ]
+    data = io.StringIO("\n" + "\n".join(json.dumps(line) for line in lines) + "\n")
+    values = list(iter_flex_datetimes(data, column="when"))
+    assert [str(v) for v in values] == ["2023-06-29", "2023-06", "2024"]
+
+
+def test_iter_errors_raise():
+    data = io.StringIO("when\n2023-06-29\nnot a date\n")
+    it = iter_flex_datetimes(data, column="when")
+    assert str(next(it)) == "2023-06-29"
+    with pytest.raises(RowParseError) as e:
+        next(it)
+    assert e.value.row == 2
+    assert e.value.value == "not a date"
+
+
+def test_iter_errors_yield_and_skip():
+    text = (
+        '{"when": "2023-06-29"}\n{"when": "bad"}\n{broken json\n{"other": 1}\n{"when": "2023-07"}\n'
+    )
+    values = list(iter_flex_datetimes(io.StringIO(text), column="when", errors="yield"))
+    assert [type(v) for v in values] == [
+        flex_datetime,
+        RowParseError,
+        RowParseError,
+        RowParseError,
+        flex_datetime,
+    ]
+    assert [v.row for v in values if isinstance(v, RowParseError)] == [2, 3, 4]
+
+    values = list(iter_flex_datetimes(io.StringIO(text), column="when", errors="skip"))
+    assert [str(v) for v in values] == ["2023-06-29", "2023-07"]
+
+
+def test_iter_path_and_subclass(tmp_path):
+    path = tmp_path / "dates.jsonl"
+    path.write_text('{"when": "2023-06"}\n')
+    values = list(iter_flex_datetimes(path, column="when", cls=mask_datetime))
+    assert values[0].to_flex() == {"dt": "2023-06-01T00:00:00+00:00", "mask": "0011111"}
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from flexible_datetime import flex_datetime
+from flexible_datetime.timeline import FlexTimeline
+
+VALUES = [
+    "2023-05-31T23:59:59",
+    "2023-06",
+    "2023-06-01T00:00:01",
+    "2023-06-15",
+    "2023-06-30T23:59:59",
+    "2023-07-01T00:00",
+    "2024",
+]
+
+
+@pytest.fixture
+def timeline():
+    values = [flex_datetime(value) for value in VALUES]
+    random.Random(0).shuffle(values)
+    return FlexTimeline(values)
+
+
+def test_sorted_mixed_masks(timeline):
+    assert [str(ft) for ft in timeline] == VALUES
+    assert len(timeline) == len(VALUES)
+    assert str(timeline[0]) == "2023-05-31T23:59:59"
+    assert [str(ft) for ft in timeline[-2:]] == ["2023-07-01T00:00", "2024"]
+
+
+def test_equal_keys_keep_insertion_order():
+    a = flex_datetime("2023-06-01T00:00:00")
+    b = flex_datetime("2023-06")
+    timeline = FlexTimeline([a, b])
+    # Coarser masks first at the same start
+    assert timeline[0] is b and timeline[1] is a
+    c = flex_datetime("2023-06-01T00:00:00")
+    timeline.add(c)
+    assert timeline[2] is c
+    d = flex_datetime("2023-06")
+    timeline.update([d])
+    assert timeline[1] is d
+
+
+def test_between(timeline):
+    june = flex_datetime("2023-06")
+    assert [str(ft) for ft in timeline.between(june, june)] == [
+        "2023-06",
+        "2023-06-01T00:00:01",
+        "2023-06-15",
+        "2023-06-30T23:59:59",
+    ]
+    assert [str(ft) for ft in timeline.between(flex_datetime("2023-06-15"))] == [
+        "2023-06-15",
+        "2023-06-30T23:59:59",
+        "2023-07-01T00:00",
+        "2024",
+    ]
+    assert [str(ft) for ft in timeline.between(end=flex_datetime("2023-05-31"))] == [
+        "2023-05-31T23:59:59"
+    ]
+    assert timeline.between(flex_datetime("2023-08"), flex_datetime("2023-07")) == []
+    assert timeline.count_between(june, flex_datetime("2023-07")) == 5
+    assert timeline.count_between() == len(VALUES)
+
+
+def test_between_matches_comparisons():
+    # For values at second precision, the range is what the flex_datetime operators select
+    rng = random.Random(1)
+    values = [
+        flex_datetime(f"2023-06-{rng.randint(1, 30):02d}T{rng.randint(0, 23):02d}:00:00")
+        for _ in range(200)
+    ]
+    timeline = FlexTimeline(values)
+    start, end = flex_datetime("2023-06-10"), flex_datetime("2023-06-20T12")
+
+    def masked_like(ft, bound):
+        ft = flex_datetime(ft)
+        ft.apply_mask(**{field: True for field, masked in bound.mask.items() if masked})
+        return ft
+
+    expected = [
+        ft for ft in values if masked_like(ft, start) >= start and masked_like(ft, end) <= end
+    ]
+    assert sorted(expected, key=lambda ft: ft.to_datetime()) == timeline.between(start, end)
+
+
+def test_nearest(timeline):
+    assert str(timeline.nearest_before(flex_datetime("2023-06-15T12:00"))) == "2023-06-15"
+    assert str(timeline.nearest_before(flex_datetime("2023-06-15"))) == "2023-06-01T00:00:01"
+    assert str(timeline.nearest_before(flex_datetime("2023-07"))) == "2023-06-30T23:59:59"
+    assert timeline.nearest_before(flex_datetime("2023-05")) is None
+    assert str(timeline.nearest_after(flex_datetime("2023-06"))) == "2023-07-01T00:00"
+    assert timeline.nearest_after(flex_datetime("2024")) is None
+
+
+def test_update_and_merge(timeline):
+    other = FlexTimeline([flex_datetime("2023-06-20"), flex_datetime("2025-01-01")])
+    merged = timeline.merge(other)
+    assert len(merged) == len(VALUES) + 2
+    assert len(timeline) == len(VALUES)
+    assert [
+        str(ft) for ft in merged.between(flex_datetime("2023-06-16"), flex_datetime("2023-06"))
+    ] == [
+        "2023-06-20",
+        "2023-06-30T23:59:59",
+    ]
+    timeline.update([flex_datetime("2026"), flex_datetime("2023-01")])
+    assert [str(ft) for ft in timeline][0] == "2023-01"
+    assert [str(ft) for ft in timeline][-1] == "2026"
+    timeline.update([flex_datetime("2027")])
+    assert str(timeline[-1]) == "2027"
+
+
+def test_bound_mask_without_single_period(timeline):
+    ft = flex_datetime("2023-06-15")
+    ft.apply_mask(year=True)
+    with pytest.raises(ValueError):
+        timeline.between(ft)
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
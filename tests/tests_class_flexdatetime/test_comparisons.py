@@ -298,5 +298,11 @@ def test_comparison_different_masks():
         assert fdt1 < fdt2
 
 
+def test_sort_key_mixed_masks():
+    values = ["2023-01-01T00:01", "2023", "2023-01-01", "2023-01"]
+    ordered = sorted((FlexDateTime.from_str(value) for value in values), key=FlexDateTime.sort_key)
+    assert [ft.to_str() for ft in ordered] == ["2023", "2023-01", "2023-01-01", "2023-01-01 00:01"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -105,5 +105,14 @@ def test_alternate_input_fmt():
     assert fdt.dt == arrow.get("2023-06-28")
 
 
+def test_parse_many():
+    values = ["2024-06-28", "2024-06-29", "2024-06", "June 15th, 2023"]
+    parsed = FlexDateTime.parse_many(values, sample=2)
+    expected = [FlexDateTime(v) for v in values]
+    assert [p.dt for p in parsed] == [e.dt for e in expected]
+    assert [p.mask for p in parsed] == [e.mask for e in expected]
+    assert str(parsed[0]) == "2024-06-28"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,3 +1,4 @@
+import pickle
 from datetime import datetime
 
 import arrow
@@ -5,6 +6,7 @@ import pytest
 from pydantic import BaseModel
 
 from flexible_datetime import FlexDateTime
+from flexible_datetime.flexible_datetime import OutputFormat
 
 
 def test_dump_load():
@@ -89,5 +91,17 @@ def test_in_class_from_str():
     assert t.fdt.dt == arrow.get(js["fdt"])
 
 
+def test_pickle():
+    fdt = FlexDateTime(arrow.get("2023-06-29T14:55:30.123+02:00"))
+    fdt.apply_mask(second=True, millisecond=True)
+    restored = pickle.loads(pickle.dumps(fdt))
+    assert restored == fdt
+    assert restored.dt.utcoffset() == fdt.dt.utcoffset()
+    assert str(restored) == "2023-06-29 14:55"
+
+    fdt._output_format = OutputFormat.flex
+    assert pickle.loads(pickle.dumps(fdt))._output_format == OutputFormat.flex
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
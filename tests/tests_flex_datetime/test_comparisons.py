@@ -1,3 +1,6 @@
+import bisect
+import heapq
+
 import pytest
 
 from flexible_datetime import flex_datetime
@@ -298,5 +301,44 @@ def test_comparison_different_masks():
         assert fdt1 < fdt2
 
 
+def test_sort_key_mixed_masks():
+    values = [
+        "2023-01-01T00:01",
+        "2023-01-01T00:00:00.5",
+        "2023",
+        "2022-12-31T23:59:59",
+        "2023-01-01",
+        "2023-01-01T00:00",
+        "2023-01",
+    ]
+    ordered = sorted((flex_datetime(value) for value in values), key=flex_datetime.sort_key)
+    assert [str(ft) for ft in ordered] == [
+        "2022-12-31T23:59:59",
+        "2023",
+        "2023-01",
+        "2023-01-01",
+        "2023-01-01T00:00",
+        "2023-01-01T00:00:00.500000",
+        "2023-01-01T00:01",
+    ]
+
+
+def test_sort_key_consistent_with_operators():
+    values = [flex_datetime(f"2023-06-{day:02d}T{hour:02d}") for day in (1, 15) for hour in (0, 12)]
+    for a in values:
+        for b in values:
+            assert (a < b) == (a.sort_key() < b.sort_key())
+            assert (a == b) == (a.sort_key() == b.sort_key())
+
+
+def test_sort_key_with_heapq_and_bisect():
+    values = [flex_datetime("2023-06-15"), flex_datetime("2023"), flex_datetime("2023-06-15T08:00")]
+    heap = [(ft.sort_key(), i, ft) for i, ft in enumerate(values)]
+    heapq.heapify(heap)
+    assert str(heapq.heappop(heap)[2]) == "2023"
+    keys = sorted(ft.sort_key() for ft in values)
+    assert bisect.bisect_left(keys, flex_datetime("2023-06-15T00:00").sort_key()) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from flexible_datetime import dict_datetime, flex_datetime, iso_datetime
+
+VALUES = ["2023", "2023-06-29", "2023-06-29T14:55:30.123456"]
+
+
+@pytest.mark.parametrize("output_format", ["short", "datetime", "mask", "components"])
+def test_format_many_matches_to_str(output_format):
+    values = [flex_datetime(v) for v in VALUES]
+    assert flex_datetime.format_many(values, output_format) == [
+        v.to_str(output_format) for v in values
+    ]
+
+
+def test_format_many_uses_class_default():
+    assert iso_datetime.format_many(["2023-06-29"]) == ["2023-06-29T00:00:00+00:00"]
+    assert dict_datetime.format_many(["2023-06"]) == ["{'year': 2023, 'month': 6}"]
+
+
+def test_format_many_custom_output_fmt():
+    assert flex_datetime.format_many(VALUES, output_fmt="DD/MM/YYYY HH:mm") == [
+        "2023",
+        "29/06/2023",
+        "29/06/2023 14:55",
+    ]
+
+
+def test_format_many_invalid_format():
+    with pytest.raises(ValueError):
+        flex_datetime.format_many(VALUES, "iso")
+
+
+def test_write_many_text():
+    fp = io.StringIO()
+    assert flex_datetime.write_many(VALUES, fp, chunksize=2) == 3
+    assert fp.getvalue() == "2023\n2023-06-29\n2023-06-29T14:55:30.123456\n"
+
+
+def test_write_many_bytes():
+    fp = io.BytesIO()
+    flex_datetime.write_many(VALUES[:2], fp, sep=",")
+    assert fp.getvalue() == b"2023,2023-06-29,"
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
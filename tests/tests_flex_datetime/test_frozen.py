@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from flexible_datetime import flex_datetime, frozen_datetime
+
+
+def test_frozen_is_hashable():
+    values = frozen_datetime.parse_many(["2023-06-29", "2023-06-29", "2023-06-30"])
+    assert len(set(values)) == 2
+    counts = {}
+    for ft in values:
+        counts[ft] = counts.get(ft, 0) + 1
+    assert counts[frozen_datetime("2023-06-29")] == 2
+
+
+def test_frozen_mixed_masks_are_unequal():
+    a = frozen_datetime("2023-06-29")
+    b = frozen_datetime("2023-06-29T00:00")
+    assert a != b
+    assert len({a, b}) == 2
+
+
+def test_frozen_equals_flex_datetime():
+    assert frozen_datetime("2023-06-29") == flex_datetime("2023-06-29")
+    assert flex_datetime("2023-06-29T14:55").freeze() == frozen_datetime("2023-06-29T14:55")
+
+
+def test_frozen_ordering():
+    assert frozen_datetime("2023-06-29") < frozen_datetime("2023-06-30")
+    with pytest.raises(ValueError):
+        frozen_datetime("2023-06-29") < frozen_datetime("2023-06")
+
+
+def test_frozen_is_immutable():
+    ft = frozen_datetime("2023-06-29")
+    with pytest.raises(AttributeError):
+        ft.mask["year"] = True
+    with pytest.raises(AttributeError):
+        ft.apply_mask(day=True)
+    with pytest.raises(AttributeError):
+        ft.dt = ft.dt.shift(days=1)
+    assert ft.mask_str == "0001111"
+
+
+def test_frozen_output_format_can_change():
+    ft = frozen_datetime("2023-06-29")
+    ft.output_format = "components"
+    assert str(ft) == "{'year': 2023, 'month': 6, 'day': 29}"
+
+
+def test_frozen_pickle():
+    ft = frozen_datetime("2023-06-29T14:55:30.123+02:00")
+    restored = pickle.loads(pickle.dumps(ft))
+    assert restored == ft
+    assert restored.dt == ft.dt
+
+
+def test_freeze_keeps_original_mutable():
+    ft = flex_datetime("2023-06-29")
+    frozen = ft.freeze()
+    ft.apply_mask(day=True)
+    assert frozen.mask_str == "0001111"
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
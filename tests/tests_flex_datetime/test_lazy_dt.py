@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+
+import arrow
+import pytest
+
+from flexible_datetime import flex_datetime
+
+
+def test_arrow_created_on_access():
+    ft = flex_datetime("2023-06-29T14:55:30")
+    assert ft._arrow is None
+    assert ft < flex_datetime("2023-06-30T00:00:00")
+    assert str(ft) == "2023-06-29T14:55:30"
+    assert ft._arrow is None
+    assert isinstance(ft.dt, arrow.Arrow)
+    assert ft.dt is ft.dt
+
+
+def test_dt_setter_accepts_datetime_and_arrow():
+    ft = flex_datetime("2023-06-29")
+    ft.dt = datetime(2024, 1, 2)
+    assert ft.to_datetime() == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    ft.dt = arrow.get("2025-03-04T05:06:07+02:00")
+    assert ft.dt.isoformat() == "2025-03-04T05:06:07+02:00"
+    assert ft.hour == 5
+
+
+def test_default_is_now():
+    before = datetime.now(timezone.utc)
+    ft = flex_datetime()
+    assert before <= ft.to_datetime() <= datetime.now(timezone.utc)
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,57 @@
+import pytest
+
+from flexible_datetime import flex_datetime, short_datetime
+
+
+def test_mask_view_reads_bits():
+    ft = flex_datetime("2023-06")
+    assert ft.mask == {
+        "year": False,
+        "month": False,
+        "day": True,
+        "hour": True,
+        "minute": True,
+        "second": True,
+        "millisecond": True,
+    }
+    assert ft.mask["day"] is True
+    assert list(ft.mask) == list(flex_datetime._mask_fields)
+
+
+def test_mask_view_writes_through():
+    ft = flex_datetime("2023-06-29T14:55:30")
+    ft.mask["second"] = True
+    ft.mask.update(minute=True)
+    assert ft.mask_str == "0000111"
+
+
+def test_mask_view_rejects_unknown_fields():
+    ft = flex_datetime("2023-06-29")
+    with pytest.raises(KeyError):
+        ft.mask["week"] = True
+    with pytest.raises(TypeError):
+        del ft.mask["year"]
+
+
+def test_mask_copy_is_independent():
+    ft = flex_datetime("2023-06-29")
+    copied = ft.mask.copy()
+    copied["year"] = True
+    assert ft.mask["year"] is False
+
+
+def test_copied_instance_does_not_share_mask():
+    a = flex_datetime("2023-06-29")
+    b = flex_datetime(a)
+    b.mask["day"] = True
+    assert a.mask_str == "0001111"
+
+
+def test_no_instance_dict():
+    assert not hasattr(flex_datetime("2023"), "__dict__")
+    assert not hasattr(short_datetime("2023"), "__dict__")
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
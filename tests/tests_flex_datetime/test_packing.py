@@ -0,0 +1,157 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from dateutil import tz
+
+from flexible_datetime import flex_datetime, frozen_datetime
+from flexible_datetime.packing import (
+    comparison_key,
+    pack,
+    pack_datetime,
+    tz_from_id,
+    tz_id,
+    unpack,
+    unpack_datetime,
+)
+
+
+def test_pack_unpack_roundtrip():
+    fields = (9999, 12, 31, 23, 59, 59, 999999, 0b1010101)
+    assert unpack(pack(*fields)) == fields
+
+
+def test_pack_datetime_converts_to_utc():
+    dt = datetime.fromisoformat("2023-06-29T14:55:30.123456+02:00")
+    unpacked, bits = unpack_datetime(pack_datetime(dt, 0b0000001))
+    assert unpacked == datetime(2023, 6, 29, 12, 55, 30, 123456, tzinfo=timezone.utc)
+    assert bits == 0b0000001
+
+
+def test_comparison_key_fills_masked_fields():
+    packed = pack(2023, 6, 29, 14, 55, 30, 123456, 0b1001110)
+    assert unpack(comparison_key(packed)) == (1, 6, 29, 0, 0, 0, 0, 0)
+
+
+def test_to_packed_from_packed():
+    ft = flex_datetime("2023-06-29T14:55")
+    restored = flex_datetime.from_packed(ft.to_packed())
+    assert restored.dt == ft.dt
+    assert restored.mask == ft.mask
+
+
+def test_to_packed_keeps_local_fields():
+    ft = flex_datetime("2023-06-29T00:30:00+02:00")
+    ft.apply_mask(hour=True, minute=True, second=True, millisecond=True)
+    packed = ft.to_packed()
+    assert unpack(packed)[:3] == (2023, 6, 29)
+    assert comparison_key(packed) == ft._comparison_key()
+    restored = flex_datetime.from_packed(packed)
+    assert str(restored) == "2023-06-29"
+    assert restored == ft
+    paris = flex_datetime.from_packed(packed, timezone(timedelta(hours=2)))
+    assert paris.to_datetime() == ft.to_datetime()
+
+
+def test_mask_bits():
+    assert flex_datetime("2023-06").mask_bits == 0b0011111
+
+
+def test_packed_comparisons_ignore_masked_fields():
+    a = flex_datetime("2023-06-29")
+    b = flex_datetime("2023-06-29T14:55:30")
+    b.apply_mask(hour=True, minute=True, second=True)
+    assert a == b
+    assert not a < b
+    c = flex_datetime("2023-06-30")
+    assert a < c
+    assert c >= b
+
+
+def test_to_bytes_from_bytes():
+    ft = flex_datetime("2023-06-29T14:55:30.123456+02:00")
+    data = ft.to_bytes()
+    assert len(data) == 13
+    restored = flex_datetime.from_bytes(data)
+    assert restored.to_datetime() == ft.to_datetime()
+    assert restored.to_datetime().utcoffset() == timedelta(hours=2)
+    assert restored.mask == ft.mask
+    assert str(restored) == str(ft)
+
+
+def test_to_bytes_keeps_local_fields():
+    ft = flex_datetime("2023-06-29T00:30:00+02:00")
+    ft.apply_mask(hour=True, minute=True, second=True, millisecond=True)
+    restored = flex_datetime.from_bytes(ft.to_bytes())
+    assert str(restored) == "2023-06-29"
+    assert restored == ft
+    assert restored.to_datetime() == ft.to_datetime()
+
+
+def test_from_bytes_keeps_subclass():
+    assert type(frozen_datetime.from_bytes(flex_datetime("2023").to_bytes())) is frozen_datetime
+
+
+def test_from_bytes_wrong_length():
+    with pytest.raises(ValueError):
+        flex_datetime.from_bytes(b"\x00" * 9)
+
+
+@pytest.mark.parametrize(
+    "tzinfo, expected",
+    [
+        (None, None),
+        (timezone.utc, 0),
+        (tz.tzutc(), 0),
+        (timezone(timedelta(hours=2)), 7200),
+        (tz.tzoffset(None, -3600), -3600),
+        (ZoneInfo("Europe/Paris"), "Europe/Paris"),
+    ],
+)
+def test_tz_id(tzinfo, expected):
+    assert tz_id(tzinfo) == expected
+    restored = tz_from_id(expected)
+    when = datetime(2023, 6, 29)
+    assert (restored and restored.utcoffset(when)) == (tzinfo and tzinfo.utcoffset(when))
+
+
+def test_tz_id_keeps_named_offsets():
+    est = timezone(timedelta(hours=-5), "EST")
+    assert tz_id(est) is est
+    assert tz_from_id(est) is est
+
+
+def test_pickle():
+    ft = flex_datetime("2023-06-29T14:55:30.123456+02:00")
+    restored = pickle.loads(pickle.dumps(ft))
+    assert restored.to_datetime() == ft.to_datetime()
+    assert restored.to_datetime().utcoffset() == timedelta(hours=2)
+    assert restored.mask == ft.mask
+    assert str(restored) == str(ft)
+
+    ft = flex_datetime("2023-06")
+    ft.output_format = "components"
+    restored = pickle.loads(pickle.dumps(ft))
+    assert str(restored) == "{'year': 2023, 'month': 6}"
+
+
+def test_pickle_zoneinfo_fold():
+    dt = datetime(2023, 10, 29, 2, 30, tzinfo=ZoneInfo("Europe/Paris"), fold=1)
+    restored = pickle.loads(pickle.dumps(flex_datetime(dt))).to_datetime()
+    assert restored == dt
+    assert restored.fold == 1
+    assert restored.utcoffset() == timedelta(hours=1)
+
+
+def test_pickle_is_compact():
+    # Packed integers and a shared time zone id, not the datetime and mask objects
+    values = [flex_datetime(f"2023-06-29T14:55:{i % 60:02d}+02:00") for i in range(1000)]
+    data = pickle.dumps(values)
+    assert len(data) < 30 * len(values)
+    assert pickle.loads(data) == values
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
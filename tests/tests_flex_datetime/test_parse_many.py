@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import arrow
+import pytest
+
+from flexible_datetime import flex_datetime, short_datetime
+from flexible_datetime.time_utils import LockedDatetimeFormat, lock_datetime_format
+
+
+def test_parse_many_matches_constructor():
+    values = [
+        "2023-06-29",
+        "2023-06-30",
+        "2023-07",
+        "20230629T145530",
+        "June 15th, 2023",
+        datetime(2023, 6, 29, 12, 30),
+        {"year": 2023, "month": 6},
+    ]
+    parsed = flex_datetime.parse_many(values, sample=2)
+    expected = [flex_datetime(v) for v in values]
+    assert [p.dt for p in parsed] == [e.dt for e in expected]
+    assert [p.mask_str for p in parsed] == [e.mask_str for e in expected]
+
+
+def test_parse_many_generator():
+    parsed = flex_datetime.parse_many(f"2023-06-{day:02d}T12:00" for day in range(1, 31))
+    assert len(parsed) == 30
+    assert parsed[-1].dt == arrow.get("2023-06-30T12:00:00")
+    assert all(p.mask_str == "0000011" for p in parsed)
+
+
+def test_parse_many_invalid_value_raises():
+    with pytest.raises(ValueError):
+        flex_datetime.parse_many(["2023-06-29", "2023-06-30", "2023-02-30"])
+
+
+def test_parse_many_keeps_subclass():
+    parsed = short_datetime.parse_many(["2023-06-29", "2023-06-30"])
+    assert all(type(p) is short_datetime for p in parsed)
+    assert str(parsed[0]) == "2023-06-29"
+
+
+def test_lock_datetime_format_dominant_shape():
+    locked = lock_datetime_format(
+        ["2023-06", "2023-06-29T14:55:30.123+02:00", "2023-06-30T01:02:03.456+02:00"]
+    )
+    assert isinstance(locked, LockedDatetimeFormat)
+    assert locked.shape == "dddd-dd-ddTdd:dd:dd.ddd+dd:dd"
+    dt, mask = locked.parse("2024-01-02T03:04:05.006+05:00")  # type: ignore
+    assert dt == arrow.get("2024-01-02T03:04:05.006+05:00").datetime
+    assert mask == "0000000"
+    assert locked.parse("2024-01") is None
+
+
+def test_lock_datetime_format_unknown_layout():
+    assert lock_datetime_format(["June 15th, 2023"]) is None
+    assert lock_datetime_format([]) is None
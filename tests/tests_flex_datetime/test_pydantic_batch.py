@@ -0,0 +1,82 @@
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from flexible_datetime import (
+    FlexDatetimeBatch,
+    FlexDatetimeDict,
+    FlexDatetimeList,
+    flex_datetime,
+    iso_datetime,
+)
+
+
+class Batches(BaseModel):
+    items: FlexDatetimeList
+    named: FlexDatetimeDict = {}
+
+
+class Elements(BaseModel):
+    items: list[flex_datetime]
+    named: dict[str, flex_datetime] = {}
+
+
+def test_list_matches_element_validation():
+    values = ["2023-06-29T14:55:30", "2023-06-30T08:00:00", "2023-06", "2023-07-01T00:00:00Z"]
+    batch = Batches(items=values)
+    elements = Elements(items=values)
+    assert batch.items == elements.items
+    assert [ft.mask for ft in batch.items] == [ft.mask for ft in elements.items]
+    assert batch.model_dump() == elements.model_dump()
+    assert batch.model_dump_json() == elements.model_dump_json()
+
+
+def test_dict():
+    m = Batches(items=[], named={"start": "2023-06-29", "end": "2023-06-30T12:00"})
+    assert m.named["start"] == flex_datetime("2023-06-29")
+    assert m.model_dump()["named"] == {"start": "2023-06-29", "end": "2023-06-30T12:00"}
+
+
+def test_json_roundtrip():
+    m = Batches(items=["2023-06-29T14:55:30"], named={"a": "2023"})
+    assert Batches.model_validate_json(m.model_dump_json()) == m
+
+
+def test_instances_are_kept():
+    ft = flex_datetime("2023-06-29")
+    m = Batches(items=[ft, "2023-06-30"])
+    assert m.items[0] is ft
+
+
+def test_subclass_elements():
+    class Model(BaseModel):
+        items: Annotated[list[iso_datetime], FlexDatetimeBatch()]
+
+    m = Model(items=["2023-06-29", "2023-06-30T12:00"])
+    assert all(type(ft) is iso_datetime for ft in m.items)
+    assert m.model_dump()["items"] == [ft.to_str() for ft in m.items]
+
+
+def test_invalid_item_is_named():
+    with pytest.raises(ValidationError, match="Invalid item 1"):
+        Batches(items=["2023-06-29", "not a date"])
+    with pytest.raises(ValidationError, match="Invalid item 'b'"):
+        Batches(items=[], named={"a": "2023-06-29", "b": "2023-13-45"})
+
+
+def test_not_a_list():
+    with pytest.raises(ValidationError):
+        Batches(items="2023-06-29")
+
+
+def test_unsupported_type():
+    with pytest.raises(TypeError):
+
+        class Model(BaseModel):
+            items: Annotated[list[int], FlexDatetimeBatch()]
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -3,9 +3,9 @@ from datetime import date, datetime
 
 import arrow
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-from flexible_datetime import FlexDateTime, flex_datetime
+from flexible_datetime import FlexDateTime, flex_datetime, iso_datetime
 
 
 def test_dump_load():
@@ -244,5 +244,44 @@ def test_from_natural_language():
     assert ft.mask_str == "0000000"
 
 
+def test_in_class_dump_json():
+    class Test(BaseModel):
+        ft: flex_datetime
+
+    t = Test(ft="2023-06-29T14:55")  # type: ignore
+    assert t.model_dump_json() == '{"ft":"2023-06-29T14:55"}'
+    assert t.model_dump() == {"ft": "2023-06-29T14:55"}
+
+
+def test_in_class_subclass_field():
+    class Test(BaseModel):
+        ft: iso_datetime
+
+    t = Test(ft="2023-06-29")  # type: ignore
+    assert isinstance(t.ft, iso_datetime)
+    assert t.model_dump() == {"ft": "2023-06-29T00:00:00+00:00"}
+
+
+def test_in_class_invalid_value():
+    class Test(BaseModel):
+        ft: flex_datetime
+
+    with pytest.raises(ValidationError):
+        Test(ft="not a date at all")  # type: ignore
+    with pytest.raises(ValidationError):
+        Test(ft=12.5)  # type: ignore
+
+
+def test_in_class_json_schema():
+    class Test(BaseModel):
+        ft: flex_datetime
+
+    schema = Test.model_json_schema(mode="validation")
+    assert schema["properties"]["ft"]["anyOf"] == [
+        {"type": "string"},
+        {"additionalProperties": True, "type": "object"},
+    ]
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -0,0 +1,31 @@
+import pytest
+
+from flexible_datetime.flex_time import flex_time
+
+
+def test_mask_view_reads_bits():
+    ft = flex_time("12:30")
+    assert ft.mask == {"hour": False, "minute": False, "second": True, "microsecond": True}
+    assert ft.mask_str == "0011"
+
+
+def test_mask_view_writes_through():
+    ft = flex_time("12:30:45")
+    ft.mask["second"] = True
+    assert ft.mask_str == "0011"
+    assert str(ft) == "12:30"
+
+
+def test_mask_assignment_from_dict():
+    ft = flex_time("12:30:45")
+    ft.mask = {"hour": False, "minute": True, "second": True, "microsecond": True}
+    assert ft.mask_str == "0111"
+
+
+def test_no_instance_dict():
+    assert not hasattr(flex_time("12:30"), "__dict__")
+
+
+# Run the tests
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,24 @@
+from datetime import time
+
+import pytest
+
+from flexible_datetime import flex_time
+
+
+def test_parse_many_matches_constructor():
+    values = ["17:30", "5:30", "17:30:45", "5pm", "at 5:30 pm", "24:00", time(12, 30)]
+    parsed = flex_time.parse_many(values, sample=3)
+    expected = [flex_time(v) for v in values]
+    assert [p.time for p in parsed] == [e.time for e in expected]
+    assert [p.mask_str for p in parsed] == [e.mask_str for e in expected]
+
+
+def test_parse_many_am_pm_layout():
+    parsed = flex_time.parse_many(["5pm", "6pm", "7am"])
+    assert [p.time for p in parsed] == [time(17), time(18), time(7)]
+    assert all(p.mask_str == "0011" for p in parsed)
+
+
+def test_parse_many_invalid_value_raises():
+    with pytest.raises(ValueError):
+        flex_time.parse_many(["17:30", "18:30", "17:99"])
@@ -1,5 +1,6 @@
 import json
-from datetime import datetime, time
+import pickle
+from datetime import datetime, time, timedelta, timezone
 
 import pytest
 from pydantic import BaseModel
@@ -416,6 +417,75 @@ def test_compatibility_with_original_formats():
     # Test that original time object format still works
     ft3 = flex_time(time(9, 30))
     assert ft3.time == time(9, 30, 0, 0)
-    
+
+
+@pytest.mark.parametrize(
+    "time_str,expected",
+    [
+        ("5", time(5)),
+        ("5:30 p.m.", time(17, 30)),
+        ("12:15am", time(0, 15)),
+        ("0pm", time(12)),
+        ("13:30 pm", time(13, 30)),
+        ("5 : 30", time(5, 30)),
+        ("05.30.45 pm", time(17, 30, 45)),
+        ("17.30.45.123", time(17, 30, 45, 123000)),
+        ("24:00", time(0)),
+        ("17:30.", time(17, 30)),
+    ],
+)
+def test_tokenize_time_str(time_str, expected):
+    assert flex_time._tokenize_time_str(time_str) == expected
+    assert flex_time._parse_time_str(time_str) == expected
+
+
+@pytest.mark.parametrize(
+    "time_str",
+    [
+        "5.30.45",  # HH.mm.ss needs a two digit hour
+        "5:30:45.123",  # HH:mm:ss.SSSSSS needs a two digit hour
+        "17:30:45.123 pm",  # no microseconds with am/pm
+        "13 am",  # out of range for am
+        "24:30",
+        "17:30:45.1234567",
+        "17:30.45",  # mixed separators
+    ],
+)
+def test_tokenize_time_str_defers(time_str):
+    assert flex_time._tokenize_time_str(time_str) is None
+
+
+def test_parse_time_str_defers_to_formats():
+    # Not a layout of the tokenizer, the arrow formats still find the time
+    assert flex_time._parse_time_str("13:30 am") == time(13, 30)
+    with pytest.raises(ValueError):
+        flex_time._parse_time_str("5.30.45")
+
+
+def test_to_bytes_from_bytes():
+    ft = flex_time("23:59:59.999999")
+    data = ft.to_bytes()
+    assert len(data) == 6
+    restored = flex_time.from_bytes(data)
+    assert restored.time == ft.time
+    assert restored.mask == ft.mask
+
+    ft = flex_time("14:30")
+    assert str(flex_time.from_bytes(ft.to_bytes())) == "14:30"
+
+
+def test_pickle():
+    ft = flex_time("23:59:59.999999")
+    restored = pickle.loads(pickle.dumps(ft))
+    assert restored.time == ft.time
+    assert restored.mask == ft.mask
+
+    ft = flex_time(time(14, 30, tzinfo=timezone(timedelta(hours=2))))
+    ft.output_format = "components"
+    restored = pickle.loads(pickle.dumps(ft))
+    assert restored.time.utcoffset() == timedelta(hours=2)
+    assert str(restored) == str(ft)
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])